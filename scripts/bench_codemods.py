@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the codemod transforms on synthetic TSX and save the results as JSON.
+
+Usage:
+    python scripts/bench_codemods.py                                # every case
+    python scripts/bench_codemods.py update_datafields --sites 1000 10000
+    python scripts/bench_codemods.py --baseline .cache/codemods/bench/last.json
+"""
+import argparse
+import json
+import sys
+import time
+
+from codemods.bench import CASES, compare, report, run_benchmarks
+from codemods.paths import cache_dir
+from codemods.writer import atomic_write
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('codemods', nargs='*', metavar='codemod',
+                        help='one of: ' + ', '.join(CASES) + ' (default: all)')
+    parser.add_argument('--sites', type=int, nargs='+', help='field-site counts for page codemods')
+    parser.add_argument('--charts', type=int, nargs='+', help='chart-function counts for chart codemods')
+    parser.add_argument('-r', '--repeats', type=int, default=3, help='timed runs per case (default: 3)')
+    parser.add_argument('-o', '--out', help='JSON output (default: .cache/codemods/bench/<timestamp>.json)')
+    parser.add_argument('--baseline', help='earlier JSON result to check for regressions')
+    parser.add_argument('--threshold', type=float, default=1.10,
+                        help='best-time slowdown counted as a regression (default: 1.10x)')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.codemods if name not in CASES]
+    if unknown:
+        parser.error('unknown codemod(s): ' + ', '.join(unknown))
+    return args
+
+
+def show(result):
+    print(f'   {result.codemod:<20} {result.size:>8,} {result.unit:<6} '
+          f'{result.median_s:8.4f}s  {result.units_per_s:>12,.0f} {result.unit}/s  '
+          f'{result.mb_per_s:7.2f} MB/s  peak {result.peak_mem_mb:7.1f} MB  '
+          f'worst-case {result.worst_case_s:.4f}s', flush=True)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    print('⏱️  Benchmarking codemods on synthetic input')
+    results = run_benchmarks(args.codemods or tuple(CASES),
+                             sizes={'sites': args.sites, 'charts': args.charts},
+                             repeats=args.repeats, progress=show)
+    data = report(results)
+
+    out = args.out
+    if out is None:
+        bench_dir = cache_dir() / 'bench'
+        out = bench_dir / time.strftime('%Y%m%d-%H%M%S.json')
+        atomic_write(bench_dir / 'last.json', json.dumps(data, indent=2))
+    atomic_write(out, json.dumps(data, indent=2))
+    print(f'📊 Results saved to {out}')
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(json.load(f), data, args.threshold)
+        for line in regressions:
+            print(f'❌ regression: {line}')
+        if regressions:
+            return 1
+        print(f'✅ No regressions against {args.baseline}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Check that every field-mapping source agrees with the field schema.
+
+Usage:
+    python scripts/check_field_mappings.py                 # summary + issues
+    python scripts/check_field_mappings.py --kind missing  # one kind of issue
+    python scripts/check_field_mappings.py --json out.json # machine-readable report
+
+Sources are parsed once into one table (cached in .cache/codemods/) and
+compared with set operations; see codemods/consistency.py. Exits 1 when
+any issue is found.
+"""
+import argparse
+import json
+import sys
+
+from codemods.consistency import SOURCES, check, load_table
+from codemods.paths import REPO_ROOT
+from codemods.writer import atomic_write
+
+KINDS = ('missing', 'unknown', 'collision', 'disagreement')
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--root', default=str(REPO_ROOT), help='repository root')
+    parser.add_argument('--kind', action='append', choices=KINDS,
+                        help='only report this kind of issue (repeatable)')
+    parser.add_argument('--source', action='append', choices=tuple(SOURCES),
+                        help='only report issues in this source (repeatable)')
+    parser.add_argument('--json', metavar='PATH', help='also write the report as JSON')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    rows = load_table(args.root)
+    report = check(rows)
+    if args.kind or args.source:
+        report.issues = [i for i in report.issues
+                         if (not args.kind or i.kind in args.kind)
+                         and (not args.source or i.source in args.source)]
+
+    per_source = {}
+    for row in rows:
+        per_source[row.source] = per_source.get(row.source, 0) + 1
+    print('📊 ' + ', '.join(f'{name}: {per_source.get(name, 0)}' for name in SOURCES))
+
+    for issue in report.issues:
+        where = f'{SOURCES[issue.source]}:{issue.line}' if issue.line else SOURCES[issue.source]
+        print(f'❌ [{issue.kind}] {where} {issue.key} - {issue.message}')
+
+    if args.json:
+        atomic_write(args.json, json.dumps(report.to_dict(), indent=2))
+        print(f'📝 Report written to {args.json}')
+
+    if report.ok:
+        print('✅ All field-mapping sources agree with the schema')
+        return 0
+    print('❌ ' + ', '.join(f'{n} {kind}' for kind, n in sorted(report.counts.items())))
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
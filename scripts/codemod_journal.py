@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+List, inspect, revert or replay recorded codemod runs.
+
+Usage:
+    python scripts/codemod_journal.py list
+    python scripts/codemod_journal.py show [RUN]
+    python scripts/codemod_journal.py revert [RUN] [--dry-run]
+    python scripts/codemod_journal.py replay [RUN] [--dry-run]
+
+RUN is a run id or a unique prefix of one; the latest run is the default.
+A file edited since the run is reported as a conflict and left untouched.
+"""
+import argparse
+import sys
+
+from codemods.journal import find, runs
+from codemods.paths import REPO_ROOT
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('command', choices=('list', 'show', 'revert', 'replay'))
+    parser.add_argument('run', nargs='?', help='run id or prefix (default: latest)')
+    parser.add_argument('--root', default=str(REPO_ROOT), help='repository root')
+    parser.add_argument('--dry-run', action='store_true', help='check the run applies, write nothing')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command == 'list':
+        for journal in runs(args.root):
+            entries = list(journal.entries())
+            size = journal.path.stat().st_size
+            print(f'{journal.run}  {len(entries)} file(s), {size:,} bytes')
+        return 0
+
+    journal = find(args.run, args.root)
+    if journal is None:
+        print(f'❌ No unique run matches {args.run!r}' if args.run else '❌ No runs recorded')
+        return 1
+
+    if args.command == 'show':
+        for entry in journal.entries():
+            changed = sum(len(new) - len(old) for _, old, new in entry.edits)
+            print(f'{entry.path}: {len(entry.edits)} edit(s), {changed:+,} chars '
+                  f'({entry.pre[:10]} -> {entry.post[:10]})')
+        return 0
+
+    outcome = journal.revert(args.dry_run) if args.command == 'revert' else journal.replay(args.dry_run)
+    verb = 'Reverted' if args.command == 'revert' else 'Replayed'
+    if args.dry_run:
+        verb = f'Would have {verb.lower()}'
+    for path in outcome.done:
+        print(f'✅ {verb} {path}')
+    for path in outcome.already:
+        print(f'⏭️  {path} already in that state')
+    for path in outcome.conflicts:
+        print(f'❌ {path} changed since {journal.run} - left untouched')
+    return 1 if outcome.conflicts else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
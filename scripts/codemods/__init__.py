@@ -0,0 +1,18 @@
+"""
+Shared helpers for the Python codemod scripts in scripts/.
+
+The scripts themselves stay thin entry points; anything reusable across
+them (rewrite engine, file discovery, caches) lives in this package.
+"""
+
+from .engine import Rule, RewriteEngine, RewriteResult
+from .field_index import FieldIndex, FieldRecord, load_field_index
+
+__all__ = [
+    'Rule',
+    'RewriteEngine',
+    'RewriteResult',
+    'FieldIndex',
+    'FieldRecord',
+    'load_field_index',
+]
@@ -0,0 +1,243 @@
+"""
+Benchmarks for the codemod transforms on synthetic TSX.
+
+Generates PropertyDetail.tsx-style pages with N DataField/renderDataField
+sites and Section-style chart files with N ``ChartX_Y_Name`` functions, runs
+each codemod's ``transform`` over them and records:
+
+- throughput: sites (or charts) per second and MB per second, from the
+  median of ``repeats`` timed runs
+- peak memory allocated during one run (tracemalloc), excluding the input
+- worst-case time: one run over a same-size "near miss" input in which
+  every site almost matches (missing terminator), which drives each
+  pattern down its failure/backtracking path
+
+Results are plain dicts so they can be dumped to JSON and compared with
+``compare()`` against an earlier run.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from .field_index import load_field_index
+from .runner import CODEMODS_BY_NAME, load_transform
+
+SITE_SIZES = (1_000, 10_000, 100_000, 500_000)
+CHART_SIZES = (10, 100, 1_000)
+
+FORMAT = 1
+
+# --------------------------------------------------------------- generators
+
+_FORMATS = ('currency', 'number', 'percent', 'date')
+_ICONS = ('<Home className="w-4 h-4" />', '<DollarSign className="w-4 h-4" />')
+
+_RETRY_TODO = '''
+  const handleRetryField = async (fieldKey: string, llmName: string) => {
+    const newFieldData = await retryField(fieldKey, llmName);
+    if (newFieldData) {
+          // Update the property with the new field value
+          alert(`✅ ${llmName} found data for ${fieldKey}: ${newFieldData.value}`);
+          // TODO: Update fullProperty in store with new field data
+        } else {
+          alert(`❌ ${llmName} could not find data for ${fieldKey}`);
+        }
+  };
+'''
+
+
+def _site_paths():
+    """(label, group, prop) for every field that lives at fullProperty.group.prop."""
+    return [(r.label.replace('"', "'"), *r.path) for r in load_field_index() if r.path and len(r.path) == 2]
+
+
+def synth_property_detail(sites: int, near_miss: bool = False, seed: int = 0) -> str:
+    """
+    A PropertyDetail.tsx-like page with ``sites`` field sites: half <DataField>
+    in all four variants (update_datafields), half unkeyed renderDataField
+    calls (fix_property_detail), using real schema paths.
+    """
+    rng = random.Random(seed)
+    paths = _site_paths()
+    end = '' if near_miss else ' />'
+    close = '' if near_miss else ')'
+    lines = ['export default function PropertyDetail() {', _RETRY_TODO, '  return (', '    <div>']
+    for i in range(sites):
+        label, group, prop = paths[i % len(paths)]
+        value = f'fullProperty.{group}.{prop}'
+        if i % 2:
+            fmt = f', "{rng.choice(_FORMATS)}"' if i % 3 == 0 else ''
+            lines.append(f'      {{renderDataField("{label}", {value}{fmt}{close}}}')
+            continue
+        attrs = ''
+        variant = (i // 2) % 4
+        if variant in (0, 1):
+            attrs += f' format="{rng.choice(_FORMATS)}"'
+        if variant in (0, 2):
+            attrs += f' icon={{{rng.choice(_ICONS)}}}'
+        lines.append(f'      <DataField label="{label}" value={{{value}.value}}{attrs}{end}')
+    lines += ['    </div>', '  );', '}', '']
+    return '\n'.join(lines)
+
+
+_CHART_TEMPLATE = '''
+function Chart{section}_{n}_Synthetic({{ homes }}: {{ homes: Home[] }}) {{
+  const scores = homes.map(h => h.score ?? 0);
+  const maxScore = Math.max(...scores);
+  const chartData = homes.map((h, i) => ({{ name: `Home ${{i + 1}}`, value: scores[i] }}));
+
+  return (
+    <div className="relative bg-white/5 backdrop-blur-xl border border-white/10 rounded-2xl p-6">
+      {{/* BRAIN WIDGET */}}
+      <div className="absolute top-4 right-4 flex items-center gap-2 px-3 py-2 rounded-lg">
+        <span className="text-xl">🧠</span>
+        <div style={{{{ color: getScoreColor(maxScore) }}}}>{{maxScore}}/100</div>
+      </div>
+      {{/* TITLE */}}
+      <h3 className="text-lg font-semibold text-white mb-2">Chart {section}-{n}: Synthetic</h3>
+      <ResponsiveContainer width="100%" height={{320}}>
+        <BarChart data={{chartData}}>
+          <Bar dataKey="value" />
+        </BarChart>
+      </ResponsiveContainer>
+      <div className="mt-4 flex justify-center">
+        <div className="flex items-center gap-3 px-5 py-3 rounded-xl">
+          <span className="text-2xl">🏆</span>
+        </div>
+      </div>
+      <div className="mt-4 p-3 bg-white/5 rounded-lg border-l-4 border-purple-400">
+        <p className="text-xs font-bold text-purple-300 mb-2">CLUES-Smart Score Scale:</p>
+      </div>
+    </div>
+  ){end}
+}}
+'''
+
+
+def synth_charts(charts: int, near_miss: bool = False, section: int = 6) -> str:
+    """A recharts Section file with ``charts`` chart functions."""
+    head = "import { BarChart, Bar, ResponsiveContainer } from 'recharts';\n"
+    end = '' if near_miss else ';'
+    return head + ''.join(_CHART_TEMPLATE.format(section=section, n=n, end=end)
+                          for n in range(1, charts + 1))
+
+
+# ----------------------------------------------------------------- measuring
+
+@dataclass
+class CaseResult:
+    codemod: str
+    unit: str                 # what ``size`` counts: 'sites' or 'charts'
+    size: int
+    bytes: int
+    repeats: int
+    median_s: float
+    best_s: float
+    worst_s: float            # slowest of the timed runs
+    worst_case_s: float       # one run over the near-miss input
+    units_per_s: float
+    mb_per_s: float
+    peak_mem_mb: float
+    changes: int              # total counts reported by transform
+
+
+# codemod -> (unit, generator, default sizes)
+CASES: Dict[str, tuple] = {
+    'update_datafields': ('sites', synth_property_detail, SITE_SIZES),
+    'fix_property_detail': ('sites', synth_property_detail, SITE_SIZES),
+    'section6_styling': ('charts', synth_charts, CHART_SIZES),
+}
+
+
+def _timed(transform: Callable, text: str):
+    start = time.perf_counter()
+    result = transform(text)
+    return time.perf_counter() - start, result
+
+
+def _peak_mb(transform: Callable, text: str) -> float:
+    tracemalloc.start()
+    try:
+        transform(text)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2**20
+
+
+def bench_case(name: str, size: int, repeats: int = 3) -> CaseResult:
+    unit, generate, _ = CASES[name]
+    transform = load_transform(CODEMODS_BY_NAME[name])
+    text = generate(size)
+    mb = len(text.encode('utf-8')) / 2**20
+
+    times = []
+    changes = 0
+    for _ in range(repeats):
+        elapsed, (_, counts) = _timed(transform, text)
+        times.append(elapsed)
+        changes = sum(counts.values())
+    worst_case, _ = _timed(transform, generate(size, near_miss=True))
+    median = statistics.median(times)
+
+    return CaseResult(
+        codemod=name,
+        unit=unit,
+        size=size,
+        bytes=len(text.encode('utf-8')),
+        repeats=repeats,
+        median_s=median,
+        best_s=min(times),
+        worst_s=max(times),
+        worst_case_s=worst_case,
+        units_per_s=size / median if median else float('inf'),
+        mb_per_s=mb / median if median else float('inf'),
+        peak_mem_mb=_peak_mb(transform, text),
+        changes=changes,
+    )
+
+
+def run_benchmarks(codemods: Iterable[str] = tuple(CASES), sizes: Optional[Dict[str, Sequence[int]]] = None,
+                   repeats: int = 3, progress: Optional[Callable[[CaseResult], None]] = None) -> List[CaseResult]:
+    """Every (codemod, size) case; sizes overrides CASES' defaults per unit ('sites'/'charts')."""
+    results = []
+    for name in codemods:
+        unit, _, default_sizes = CASES[name]
+        for size in (sizes or {}).get(unit) or default_sizes:
+            result = bench_case(name, size, repeats)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+def report(results: Sequence[CaseResult]) -> dict:
+    return {
+        'format': FORMAT,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'cases': [asdict(r) for r in results],
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 1.10) -> List[str]:
+    """
+    Lines describing cases whose best time grew by more than ``threshold`` x.
+    The best of the repeats is compared since it is the least noisy.
+    """
+    before = {(c['codemod'], c['size']): c for c in baseline.get('cases', [])}
+    regressions = []
+    for case in current['cases']:
+        old = before.get((case['codemod'], case['size']))
+        if not old or not old['best_s']:
+            continue
+        ratio = case['best_s'] / old['best_s']
+        if ratio > threshold:
+            regressions.append(f"{case['codemod']} @ {case['size']} {case['unit']}: "
+                               f"{old['best_s']:.4f}s -> {case['best_s']:.4f}s ({ratio:.2f}x)")
+    return regressions
@@ -0,0 +1,194 @@
+"""
+Incremental codemod cache.
+
+A JSON manifest records, per (file, codemod chain), the content hash the
+file had after the last successful run, the rule-set version that produced
+it and that run's result. On the next run an unchanged file is skipped:
+first by an O(1) stat check (mtime + size), falling back to a content hash
+when only the timestamp moved (checkout, touch). Editing a codemod script
+changes its rule-set version, which invalidates every entry it produced.
+
+Runner sweeps and the standalone scripts (via ScriptCache) share the same
+manifest under .cache/codemods/.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .paths import REPO_ROOT, SCRIPTS_DIR, cache_dir
+from .writer import atomic_write
+
+MANIFEST_NAME = 'manifest.json'
+FORMAT = 1
+
+# (sha256, mtime_ns, size) of a file as last written
+Fingerprint = Tuple[str, int, int]
+
+# Shared inputs every codemod's output depends on (relative to scripts/):
+# the rewrite engine and its streaming mode, the rule registry, snippet
+# patcher, TSX index and chart memoizer, the field search index and the site
+# pattern it is extracted with, the field-path table whose import line the
+# page codemods insert, and the field index plus the schema it is built from
+SHARED_SOURCES = (
+    'codemods/engine.py',
+    'codemods/registry.py',
+    'codemods/stream.py',
+    'codemods/snippets.py',
+    'codemods/tsx.py',
+    'codemods/memoize.py',
+    'codemods/search_index.py',
+    'codemods/consistency.py',
+    'codemods/field_paths.py',
+    'codemods/field_index.py',
+    '../src/types/fields-schema.ts',
+    '../src/lib/field-normalizer.ts',
+)
+
+
+HASH_CHUNK = 1 << 20
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path) -> str:
+    """content_hash of a file's bytes, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint(path, data: Optional[bytes] = None) -> Fingerprint:
+    sha = file_hash(path) if data is None else content_hash(data)
+    st = os.stat(path)
+    return sha, st.st_mtime_ns, st.st_size
+
+
+def source_stamp(path, data: bytes) -> Dict[str, Any]:
+    """Stamp of a parsed input file, for stamps_current()."""
+    st = os.stat(path)
+    return {'sha256': content_hash(data), 'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+
+
+def stamps_current(stamps: Dict[str, Dict[str, Any]], sources: Dict[str, Path]) -> bool:
+    """
+    True if every source still matches its stamp: by mtime + size, falling
+    back to the content hash when only the timestamp moved.
+    """
+    if set(stamps) != set(sources):
+        return False
+    for rel, path in sources.items():
+        stamp = stamps[rel]
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if (st.st_mtime_ns, st.st_size) == (stamp['mtime_ns'], stamp['size']):
+            continue
+        if st.st_size != stamp['size']:
+            return False
+        if file_hash(path) != stamp['sha256']:
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _source_hash(path: str) -> str:
+    return file_hash(path)
+
+
+def ruleset_version(*scripts) -> str:
+    """Version of a codemod chain: a hash over its scripts (relative to scripts/) and shared inputs."""
+    digest = hashlib.sha256()
+    for source in (*scripts, *SHARED_SOURCES):
+        digest.update(_source_hash(str(SCRIPTS_DIR / source)).encode())
+    return digest.hexdigest()[:16]
+
+
+class Manifest:
+    def __init__(self, path: Path, entries: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = entries or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, root=REPO_ROOT) -> 'Manifest':
+        path = cache_dir(root) / MANIFEST_NAME
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(path)
+        if data.get('format') != FORMAT:
+            return cls(path)
+        return cls(path, data.get('entries', {}))
+
+    @staticmethod
+    def _key(file, chain: str) -> str:
+        return f'{chain}::{Path(file).resolve().as_posix()}'
+
+    def lookup(self, file, chain: str, version: str) -> Optional[Dict[str, Any]]:
+        """Cached result if the file is unchanged since chain@version last ran, else None."""
+        entry = self.entries.get(self._key(file, chain))
+        if not entry or entry['version'] != version:
+            return None
+        try:
+            st = os.stat(file)
+        except OSError:
+            return None
+        if st.st_mtime_ns == entry['mtime_ns'] and st.st_size == entry['size']:
+            return entry['result']
+        if st.st_size != entry['size']:
+            return None
+        if file_hash(file) != entry['sha256']:
+            return None
+        # Same bytes, new timestamp: refresh so the next lookup is a stat again.
+        entry['mtime_ns'] = st.st_mtime_ns
+        self.dirty = True
+        return entry['result']
+
+    def record(self, file, chain: str, version: str, result: Any,
+               fp: Optional[Fingerprint] = None) -> None:
+        sha, mtime_ns, size = fp or fingerprint(file)
+        self.entries[self._key(file, chain)] = {
+            'sha256': sha,
+            'mtime_ns': mtime_ns,
+            'size': size,
+            'version': version,
+            'result': result,
+        }
+        self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        atomic_write(self.path, json.dumps({'format': FORMAT, 'entries': self.entries},
+                                           separators=(',', ':')))
+        self.dirty = False
+
+
+class ScriptCache:
+    """Manifest access for one standalone script's main()."""
+
+    def __init__(self, name: str, script, sources=(), root=REPO_ROOT):
+        self.name = name
+        # sources: rule modules (relative to scripts/) the script's output also depends on
+        self.version = ruleset_version(Path(script).name, *sources)
+        self.manifest = Manifest.load(root)
+
+    def fresh(self, path) -> Optional[Any]:
+        """Result of the last run if path is unchanged since then."""
+        return self.manifest.lookup(path, self.name, self.version)
+
+    def done(self, path, result: Any) -> None:
+        self.manifest.record(path, self.name, self.version, result)
+        self.manifest.save()
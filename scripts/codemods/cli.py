@@ -0,0 +1,27 @@
+"""Argument parsing shared by the standalone codemod scripts."""
+
+import argparse
+from pathlib import Path
+from typing import List
+
+
+def parse_script_args(description: str, default_path: str, argv=None,
+                      target: str = 'file', stream: bool = False) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('path', nargs='?', default=default_path,
+                        help=f'{target} to rewrite (default: {default_path})')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='print a unified diff instead of writing the file')
+    parser.add_argument('--profile', metavar='JSON',
+                        help='write per-rule timings and match counts to this file')
+    if stream:
+        parser.add_argument('--stream', action='store_true',
+                            help='memory-map the file and stream the rewrite in bounded memory, '
+                                 'for large generated files (--dry-run then only counts)')
+    return parser.parse_args(argv)
+
+
+def expand_targets(path, pattern: str) -> List[Path]:
+    """[path] for a file; the files matching pattern (sorted) for a directory."""
+    path = Path(path)
+    return sorted(path.glob(pattern)) if path.is_dir() else [path]
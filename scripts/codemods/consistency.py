@@ -0,0 +1,365 @@
+"""
+Cross-file field-mapping consistency index.
+
+The same ~180 fields are declared in several places that drift apart:
+
+    schema       src/types/fields-schema.ts              ALL_FIELDS (source of truth)
+    mapping      src/lib/field-mapping.ts                FIELD_MAPPINGS
+    flat         src/lib/field-map-flat-to-numbered.ts   FLAT_TO_NUMBERED_FIELD_MAP
+    normalizer   src/lib/field-normalizer.ts             FIELD_TO_PROPERTY_MAP
+    paths        src/lib/field-paths.generated.ts        FIELD_PATHS
+    detail       src/pages/PropertyDetail.tsx            renderDataField(...) sites
+    diagnostic   src/components/SMARTScoreDiagnostic.tsx getPropertyPath() map
+
+Every source is parsed once into one table of rows (source, key, num,
+label, group, path, line), cached under .cache/codemods/ keyed by the
+mtime, size and hash of every source. ``check`` then compares the sources
+by key with set operations:
+
+    missing       schema keys a source should declare but does not
+    unknown       keys a source declares that the schema does not
+    collision     one number used for two keys, a row whose stated number
+                  disagrees with its key, or a key filed under another
+                  number than the schema's
+    disagreement  one key with different Property paths, or with another
+                  label / group than the schema's
+
+Usage:
+
+    table = load_table()
+    report = check(table)
+    report.counts          # {'missing': 3, 'disagreement': 1, ...}
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+from .cache import source_stamp, stamps_current
+from .field_index import NORMALIZER_ENTRY, NORMALIZER_FILE, SCHEMA_ENTRY, SCHEMA_FILE, _array_body
+from .field_paths import OUTPUT as PATHS_FILE
+from .paths import REPO_ROOT, cache_dir
+from .writer import atomic_write
+
+MAPPING_FILE = 'src/lib/field-mapping.ts'
+FLAT_FILE = 'src/lib/field-map-flat-to-numbered.ts'
+DETAIL_FILE = 'src/pages/PropertyDetail.tsx'
+DIAGNOSTIC_FILE = 'src/components/SMARTScoreDiagnostic.tsx'
+TABLE_NAME = 'consistency.json'
+FORMAT = 1
+
+SOURCES = {
+    'schema': SCHEMA_FILE,
+    'mapping': MAPPING_FILE,
+    'flat': FLAT_FILE,
+    'normalizer': NORMALIZER_FILE,
+    'paths': PATHS_FILE,
+    'detail': DETAIL_FILE,
+    'diagnostic': DIAGNOSTIC_FILE,
+}
+
+_STRING = r"""(?:'((?:[^'\\]|\\.)*)'|"((?:[^"\\]|\\.)*)")"""
+
+# { fieldNumber: 1, apiKey: '1_full_address', frontendKey: ..., label: ..., group: ... }
+MAPPING_ENTRY = re.compile(r"\{[^{}\n]*\bfieldNumber:[^{}\n]*\}")
+MAPPING_PROP = re.compile(r"\b(fieldNumber|apiKey|label|group):\s*(?:" + _STRING + r"|([0-9]+))")
+
+# 'flat_name': '1_full_address',
+FLAT_ENTRY = re.compile(r"^\s*'([^']+)':\s*'([^']+)'", re.M)
+
+# '1_full_address': ['address', 'fullAddress'],  (generated table or an inline copy)
+PATH_ENTRY = re.compile(r"^\s*'([0-9]+[a-z]?_\w+)':\s*\['(\w+)',\s*'(\w+)'\]", re.M)
+
+# renderDataField("Label", fullProperty.group?.prop, ..., "1_full_address")
+DETAIL_SITE = re.compile(
+    r'renderDataField\(\s*"((?:[^"\\]|\\.)*)",\s*fullProperty((?:\??\.\w+)+)\s*,[^\n]*?"([0-9]+[a-z]?_\w+)"\s*\)'
+)
+
+# 6: 'address.neighborhoodName.value',
+DIAGNOSTIC_ENTRY = re.compile(r"^\s*([0-9]+):\s*'([\w.]+?)(?:\.value)?'", re.M)
+
+KEY_NUMBER = re.compile(r'^([0-9]+[a-z]?)_(.+)$')
+
+
+@dataclass(frozen=True)
+class Row:
+    source: str
+    key: str                      # full key, e.g. '10_listing_price'
+    num: str                      # number the source states (or the key's prefix)
+    label: Optional[str] = None
+    group: Optional[str] = None
+    path: Optional[str] = None    # dotted Property path, e.g. 'address.listingPrice'
+    line: int = 0
+
+
+@dataclass(frozen=True)
+class Issue:
+    kind: str                     # missing | unknown | collision | disagreement
+    source: str
+    key: str
+    message: str
+    line: int = 0                 # 0 when the issue is an absence
+
+
+@dataclass
+class Report:
+    issues: List[Issue] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = defaultdict(int)
+        for issue in self.issues:
+            counts[issue.kind] += 1
+        return dict(counts)
+
+    def to_dict(self) -> dict:
+        return {'counts': self.counts, 'issues': [asdict(issue) for issue in self.issues]}
+
+
+def _unquote(single: Optional[str], double: Optional[str]) -> str:
+    text = single if single is not None else double
+    return text.replace("\\'", "'").replace('\\"', '"')
+
+
+def _line_of(source: str) -> Callable[[int], int]:
+    starts = [0] + [m.end() for m in re.finditer('\n', source)]
+
+    def line(offset: int) -> int:
+        return bisect_right(starts, offset)
+    return line
+
+
+def _key_number(key: str) -> str:
+    m = KEY_NUMBER.match(key)
+    return m.group(1) if m else ''
+
+
+def _parse_schema(text: str) -> List[Row]:
+    line = _line_of(text)
+    base = text.index('export const ALL_FIELDS')
+    rows = []
+    for m in SCHEMA_ENTRY.finditer(_array_body(text, 'ALL_FIELDS')):
+        num = m.group(1) or m.group(2)
+        label = m.group(5).replace("\\'", "'").replace('\\"', '"')
+        rows.append(Row('schema', f'{num}_{m.group(3)}', num, label, m.group(6), None, line(base + m.start())))
+    return rows
+
+
+def _parse_mapping(text: str) -> List[Row]:
+    line = _line_of(text)
+    base = text.index('export const FIELD_MAPPINGS')
+    rows = []
+    for m in MAPPING_ENTRY.finditer(_array_body(text, 'FIELD_MAPPINGS')):
+        props = {}
+        for p in MAPPING_PROP.finditer(m.group(0)):
+            props[p.group(1)] = p.group(4) if p.group(4) is not None else _unquote(p.group(2), p.group(3))
+        if 'apiKey' in props:
+            rows.append(Row('mapping', props['apiKey'], props.get('fieldNumber', ''),
+                            props.get('label'), props.get('group'), None, line(base + m.start())))
+    return rows
+
+
+def _parse_flat(text: str) -> List[Row]:
+    line = _line_of(text)
+    start = text.index('export const FLAT_TO_NUMBERED_FIELD_MAP')
+    end = text.find('\n};', start)
+    body = text[start:end if end >= 0 else len(text)]
+    return [Row('flat', m.group(2), _key_number(m.group(2)), m.group(1), None, None, line(start + m.start()))
+            for m in FLAT_ENTRY.finditer(body)]
+
+
+def _parse_normalizer(text: str) -> List[Row]:
+    line = _line_of(text)
+    base = text.index('export const FIELD_TO_PROPERTY_MAP')
+    return [Row('normalizer', m.group(3), m.group(1) or m.group(2), None, None,
+                f'{m.group(4)}.{m.group(5)}', line(base + m.start()))
+            for m in NORMALIZER_ENTRY.finditer(_array_body(text, 'FIELD_TO_PROPERTY_MAP'))]
+
+
+def _parse_paths(source: str) -> Callable[[str], List[Row]]:
+    def parse(text: str) -> List[Row]:
+        line = _line_of(text)
+        return [Row(source, m.group(1), _key_number(m.group(1)), None, None,
+                    f'{m.group(2)}.{m.group(3)}', line(m.start()))
+                for m in PATH_ENTRY.finditer(text)]
+    return parse
+
+
+def _parse_detail(text: str) -> List[Row]:
+    line = _line_of(text)
+    rows = _parse_paths('detail')(text)     # an inline paths map, if one is back
+    rows += [Row('detail', m.group(3), _key_number(m.group(3)), m.group(1).replace('\\"', '"'), None,
+                 m.group(2).replace('?', '')[1:], line(m.start()))
+             for m in DETAIL_SITE.finditer(text)]
+    return rows
+
+
+def _parse_diagnostic(text: str) -> List[Row]:
+    line = _line_of(text)
+    start = text.find('function getPropertyPath')
+    if start < 0:
+        return []
+    end = text.find('\n  };', start)
+    body = text[start:end if end >= 0 else len(text)]
+    # Keyed by number only; the full key is resolved against the schema in check()
+    return [Row('diagnostic', '', m.group(1), None, None, m.group(2), line(start + m.start()))
+            for m in DIAGNOSTIC_ENTRY.finditer(body)]
+
+
+PARSERS: Dict[str, Callable[[str], List[Row]]] = {
+    'schema': _parse_schema,
+    'mapping': _parse_mapping,
+    'flat': _parse_flat,
+    'normalizer': _parse_normalizer,
+    'paths': _parse_paths('paths'),
+    'detail': _parse_detail,
+    'diagnostic': _parse_diagnostic,
+}
+
+
+def parse_sources(texts: Dict[str, str]) -> List[Row]:
+    """One table of rows from {source name: file text}; absent sources are skipped."""
+    rows = []
+    for name, parse in PARSERS.items():
+        if name in texts:
+            rows.extend(parse(texts[name]))
+    return rows
+
+
+def _read_cached(table_path: Path, sources: Dict[str, Path]) -> Optional[List[Row]]:
+    try:
+        with open(table_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get('format') != FORMAT or not stamps_current(data.get('sources', {}), sources):
+        return None
+    return [Row(*row) for row in data['rows']]
+
+
+@lru_cache(maxsize=None)
+def load_table(root=REPO_ROOT) -> List[Row]:
+    """Every source's rows, parsed at most once per change to any source."""
+    sources = {name: Path(root) / rel for name, rel in SOURCES.items() if (Path(root) / rel).exists()}
+    table_path = cache_dir(root) / TABLE_NAME
+
+    cached = _read_cached(table_path, sources)
+    if cached is not None:
+        return cached
+
+    texts = {}
+    stamps = {}
+    for name, path in sources.items():
+        with open(path, 'rb') as f:
+            raw = f.read()
+        texts[name] = raw.decode('utf-8')
+        stamps[name] = source_stamp(path, raw)
+
+    rows = parse_sources(texts)
+    atomic_write(table_path, json.dumps({
+        'format': FORMAT,
+        'sources': stamps,
+        'rows': [[r.source, r.key, r.num, r.label, r.group, r.path, r.line] for r in rows],
+    }, separators=(',', ':')))
+    return rows
+
+
+def check(rows: List[Row]) -> Report:
+    """Compare every source against the schema and against each other."""
+    report = Report()
+    add = report.issues.append
+
+    schema = {r.key: r for r in rows if r.source == 'schema'}
+    schema_by_num = {r.num: r for r in schema.values()}
+    schema_by_name = {KEY_NUMBER.match(k).group(2): r for k, r in schema.items() if KEY_NUMBER.match(k)}
+    normalizer_paths = {r.key: r.path for r in rows if r.source == 'normalizer'}
+
+    by_source: Dict[str, List[Row]] = defaultdict(list)
+    for r in rows:
+        if r.source == 'diagnostic':
+            owner = schema_by_num.get(r.num)
+            r = Row(r.source, owner.key if owner else f'{r.num}_?', r.num, r.label, r.group, r.path, r.line)
+        by_source[r.source].append(r)
+
+    schema_keys = set(schema)
+    two_part = {k for k, path in normalizer_paths.items() if k in schema_keys and path.count('.') == 1}
+    # Which schema keys each source is expected to cover (PropertyDetail
+    # also renders fields outside renderDataField, so it has no quota)
+    expected: Dict[str, Set[str]] = {
+        'mapping': schema_keys,
+        'normalizer': schema_keys,
+        'paths': two_part,
+    }
+
+    for source in SOURCES:
+        source_rows = by_source.get(source, [])
+        if not source_rows:
+            continue
+        keys = {r.key for r in source_rows}
+        first = {}
+        for r in source_rows:
+            first.setdefault(r.key, r)
+
+        if source != 'schema':
+            for key in sorted(keys - schema_keys, key=lambda k: first[k].line):
+                add(Issue('unknown', source, key, 'not in the schema', first[key].line))
+            for key in sorted(expected.get(source, set()) - keys, key=lambda k: schema[k].line):
+                add(Issue('missing', source, key, f'schema field ({SCHEMA_FILE}:{schema[key].line}) not declared'))
+
+        # One number, several keys (flat is an alias map: many names per key is its point)
+        if source not in ('flat', 'diagnostic'):
+            numbered: Dict[str, Set[str]] = defaultdict(set)
+            for r in source_rows:
+                numbered[r.num].add(r.key)
+            for num, owners in numbered.items():
+                if len(owners) > 1:
+                    key = min(owners, key=lambda k: first[k].line)
+                    add(Issue('collision', source, key,
+                              f'number {num} is used by {", ".join(sorted(owners))}', first[key].line))
+
+        for r in source_rows:
+            stated = _key_number(r.key)
+            if r.num and stated and r.num != stated:
+                add(Issue('collision', source, r.key, f'stated number {r.num} but key is numbered {stated}', r.line))
+            m = KEY_NUMBER.match(r.key)
+            owner = schema_by_name.get(m.group(2)) if m and r.key not in schema_keys else None
+            if owner is not None:
+                add(Issue('collision', source, r.key, f'schema numbers this field {owner.num} ({owner.key})', r.line))
+
+        if source == 'mapping':
+            for r in source_rows:
+                truth = schema.get(r.key)
+                if truth is None:
+                    continue
+                if r.label is not None and r.label != truth.label:
+                    add(Issue('disagreement', source, r.key, f'label {r.label!r} != schema {truth.label!r}', r.line))
+                if r.group is not None and r.group != truth.group:
+                    add(Issue('disagreement', source, r.key, f'group {r.group!r} != schema {truth.group!r}', r.line))
+
+    # Property paths: every source that states one must agree with every other
+    paths: Dict[str, Dict[str, Row]] = defaultdict(dict)
+    for source in ('normalizer', 'paths', 'detail', 'diagnostic'):
+        for r in by_source.get(source, []):
+            if r.path and r.key in schema_keys:
+                paths[r.key].setdefault(r.path, r)
+    for key in sorted(paths, key=lambda k: schema[k].line):
+        variants = paths[key]
+        if len(variants) < 2:
+            continue
+        reference = normalizer_paths.get(key)
+        for path, r in variants.items():
+            if path != reference:
+                where = ', '.join(f'{o.source}: {p}' for p, o in variants.items() if p != path)
+                add(Issue('disagreement', r.source, key, f'path {path} vs {where}', r.line))
+    return report
@@ -0,0 +1,184 @@
+"""
+Single-pass multi-pattern rewrite engine.
+
+Every rule's pattern is joined into one alternation and the text is scanned
+once. When the combined pattern matches, the rule that won is identified by
+its outer named group and its own compiled pattern is re-applied to just the
+matched span, so rules keep their own group numbering and backreferences.
+
+The combined pattern can also be run over a bytes buffer (``byte_pattern``)
+with each matched span decoded and handed to ``replace``; codemods.stream
+uses this to rewrite memory-mapped files without loading them as text.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from .instrument import Profile
+from .regex_safety import RuleTimeout, budget, validate
+
+Replacement = Union[str, Callable[['re.Match[str]'], str]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A named pattern and its replacement (template string or callable)."""
+    name: str
+    pattern: str
+    replacement: Replacement
+    flags: int = 0
+
+
+@dataclass
+class RewriteResult:
+    text: str
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+class RewriteEngine:
+    """
+    Apply many rules in one left-to-right scan.
+
+    Rules are tried in the order given, so when two rules can match at the
+    same offset the earlier one wins - list the most specific rule first.
+    Matches never overlap: once a span is rewritten the scan resumes after it.
+    Patterns must not use numeric backreferences or reuse a group name that
+    another rule also declares, since they share one combined regex. A rule
+    whose pattern can backtrack exponentially is refused (UnsafePattern, see
+    codemods.regex_safety), and a scan that outruns the rule budget raises
+    RuleTimeout naming the rule that stalls on the text.
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules: List[Rule] = list(rules)
+        if not self.rules:
+            raise ValueError('RewriteEngine needs at least one rule')
+        for rule in self.rules:
+            validate(rule.name, rule.pattern, rule.flags)
+
+        self._compiled = [re.compile(r.pattern, r.flags) for r in self.rules]
+        self._group_to_index = {}
+        branches = []
+        for i, rule in enumerate(self.rules):
+            group = f'_r{i}'
+            self._group_to_index[group] = i
+            # Scoped inline flags keep each rule's flags local to its branch.
+            branches.append(f'(?P<{group}>{_scoped(rule.pattern, rule.flags)})')
+        self._combined = re.compile('|'.join(branches))
+        self._byte_pattern: Optional['re.Pattern[bytes]'] = None
+
+    @property
+    def byte_pattern(self) -> 're.Pattern[bytes]':
+        """The combined pattern compiled for bytes-like buffers (mmap, memoryview)."""
+        if self._byte_pattern is None:
+            try:
+                self._byte_pattern = re.compile(self._combined.pattern.encode('utf-8'),
+                                                self._combined.flags & ~re.UNICODE)
+            except re.error as e:
+                raise ValueError(f'rules cannot be matched against bytes: {e}') from e
+        return self._byte_pattern
+
+    def rule_index(self, match: 're.Match') -> int:
+        """Index into ``rules`` of the rule whose branch produced match."""
+        return self._group_to_index[match.lastgroup]
+
+    def replace(self, index: int, span: str) -> Optional[str]:
+        """
+        Rule ``index``'s replacement for span, matched on its own; None if the
+        rule's pattern does not match the whole span.
+        """
+        rule = self.rules[index]
+        inner = self._compiled[index].fullmatch(span)
+        if inner is None:
+            return None
+        if callable(rule.replacement):
+            return rule.replacement(inner)
+        return inner.expand(rule.replacement)
+
+    def rewrite(self, text: str, profile: Optional[Profile] = None) -> RewriteResult:
+        """
+        Rewrite text in one scan. With a profile, each rule records its
+        matches, replacements and time spent building replacements; the
+        shared scan itself is recorded as rule ``(scan)``.
+        """
+        counts: Counter = Counter({rule.name: 0 for rule in self.rules})
+        stats = [profile[rule.name] for rule in self.rules] if profile is not None else None
+        clock = time.perf_counter
+
+        def dispatch(match: 're.Match[str]') -> str:
+            index = self._group_to_index[match.lastgroup]
+            rule = self.rules[index]
+            start = clock() if stats else 0.0
+            inner = self._compiled[index].fullmatch(text, match.start(), match.end())
+            if inner is None:  # pragma: no cover - the branch just matched this span
+                return match.group(0)
+            counts[rule.name] += 1
+            if callable(rule.replacement):
+                replaced = rule.replacement(inner)
+            else:
+                replaced = inner.expand(rule.replacement)
+            if stats:
+                rule_stats = stats[index]
+                rule_stats.seconds += clock() - start
+                rule_stats.matches += 1
+                rule_stats.replacements += replaced != match.group(0)
+            return replaced
+
+        try:
+            with budget('(scan)'):
+                return self._rewrite(text, dispatch, counts, stats, profile)
+        except RuleTimeout as timeout:
+            if timeout.rule != '(scan)':   # an enclosing budget ran out
+                raise
+            raise RuleTimeout(self._stalled(text, timeout.seconds), timeout.seconds) from None
+
+    def _rewrite(self, text: str, dispatch, counts: Counter, stats, profile: Optional[Profile]) -> RewriteResult:
+        if profile is None:
+            return RewriteResult(self._combined.sub(dispatch, text), dict(counts))
+
+        # Every branch of the alternation is tried across the whole text
+        scanned = len(text.encode('utf-8'))
+        for rule_stats in stats:
+            rule_stats.bytes_scanned += scanned
+        before = sum(rule_stats.seconds for rule_stats in stats)
+        with profile.timed('(scan)', text) as scan:
+            new_text = self._combined.sub(dispatch, text)
+        scan.seconds -= sum(rule_stats.seconds for rule_stats in stats) - before
+        scan.matches += sum(counts.values())
+        return RewriteResult(new_text, dict(counts))
+
+    def _stalled(self, text: str, seconds: float) -> str:
+        """Name of the first rule that cannot scan text alone within the budget."""
+        for rule, compiled in zip(self.rules, self._compiled):
+            try:
+                with budget(rule.name, seconds):
+                    for _ in compiled.finditer(text):
+                        pass
+            except RuleTimeout:
+                return rule.name
+        return '(scan)'
+
+
+def _scoped(pattern: str, flags: int) -> str:
+    """Wrap a pattern in a non-capturing group carrying its own inline flags."""
+    letters = ''
+    if flags & re.IGNORECASE:
+        letters += 'i'
+    if flags & re.MULTILINE:
+        letters += 'm'
+    if flags & re.DOTALL:
+        letters += 's'
+    if flags & re.VERBOSE:
+        letters += 'x'
+    if letters:
+        return f'(?{letters}:{pattern})'
+    return f'(?:{pattern})'
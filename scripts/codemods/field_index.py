@@ -0,0 +1,192 @@
+"""
+Field index compiled from the TypeScript schema.
+
+Parses ``ALL_FIELDS`` in src/types/fields-schema.ts (number, key, label,
+group) and joins it with ``FIELD_TO_PROPERTY_MAP`` in
+src/lib/field-normalizer.ts (where each API key lives on the Property
+object). The result is cached under .cache/codemods/ keyed by the mtime,
+size and hash of both sources, so only a schema edit triggers a re-parse.
+
+Lookups are O(1) in every direction:
+
+    index = load_field_index()
+    index.by_full_key['10_listing_price'].path   # ('address', 'listingPrice')
+    index.by_path['address.listingPrice'].num    # '10'
+    index.by_num['16a'].full_key                 # '16a_zestimate'
+    index.by_key['bedrooms'].full_key            # '17_bedrooms'
+
+Codemods should look fields up here instead of declaring their own maps.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .cache import source_stamp, stamps_current
+from .paths import REPO_ROOT, cache_dir
+from .writer import atomic_write
+
+SCHEMA_FILE = 'src/types/fields-schema.ts'
+NORMALIZER_FILE = 'src/lib/field-normalizer.ts'
+INDEX_NAME = 'field-index.json'
+FORMAT = 1
+
+SCHEMA_ENTRY = re.compile(
+    r"\{\s*num:\s*(?:'([0-9A-Za-z]+)'|([0-9]+))\s*,"
+    r"\s*key:\s*'([^']+)'\s*,"
+    r"""\s*label:\s*(['"])((?:(?!\4)[^\\]|\\.)*)\4\s*,"""
+    r"\s*group:\s*'([^']+)'"
+)
+
+NORMALIZER_ENTRY = re.compile(
+    r"\{\s*fieldNumber:\s*(?:'([0-9A-Za-z_]+)'|([0-9]+))\s*,"
+    r"\s*apiKey:\s*'([^']+)'\s*,"
+    r"\s*group:\s*'([^']+)'\s*,"
+    r"\s*propName:\s*'([^']+)'"
+)
+
+
+@dataclass(frozen=True)
+class FieldRecord:
+    num: str
+    key: str
+    label: str
+    group: str
+    path: Optional[Tuple[str, ...]] = None
+
+    @property
+    def full_key(self) -> str:
+        return f'{self.num}_{self.key}'
+
+    @property
+    def dotted_path(self) -> Optional[str]:
+        return '.'.join(self.path) if self.path else None
+
+    @property
+    def accessor(self) -> Optional[str]:
+        """Expression used in PropertyDetail.tsx, e.g. fullProperty.address.county"""
+        return f'fullProperty.{self.dotted_path}' if self.path else None
+
+
+class FieldIndex:
+    def __init__(self, records: List[FieldRecord]):
+        self.records = records
+        self.by_full_key: Dict[str, FieldRecord] = {}
+        self.by_num: Dict[str, FieldRecord] = {}
+        self.by_key: Dict[str, FieldRecord] = {}
+        self.by_path: Dict[str, FieldRecord] = {}
+        for record in records:
+            self.by_full_key[record.full_key] = record
+            self.by_num.setdefault(record.num, record)
+            self.by_key.setdefault(record.key, record)
+            if record.path:
+                self.by_path.setdefault(record.dotted_path, record)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def for_accessor(self, accessor: str) -> Optional[FieldRecord]:
+        """Record for 'fullProperty.group.prop' (or 'group.prop')."""
+        if accessor.startswith('fullProperty.'):
+            accessor = accessor[len('fullProperty.'):]
+        return self.by_path.get(accessor)
+
+    def path_entries(self, records=None, indent: str = '  ') -> List[str]:
+        """
+        TS object-literal lines ``'fullKey': ['group', 'prop'],`` with a comment
+        per schema group. Only fields on a top-level Property group fit the
+        two-element tuple.
+        """
+        records = self.records if records is None else records
+        lines = []
+        group = None
+        for r in records:
+            if not r.path or len(r.path) != 2:
+                continue
+            if r.group != group:
+                group = r.group
+                lines.append(f'{indent}// {group}')
+            lines.append(f"{indent}'{r.full_key}': ['{r.path[0]}', '{r.path[1]}'],")
+        return lines
+
+    def to_rows(self) -> List[list]:
+        return [[r.num, r.key, r.label, r.group, r.dotted_path] for r in self.records]
+
+    @classmethod
+    def from_rows(cls, rows: List[list]) -> 'FieldIndex':
+        return cls([
+            FieldRecord(num, key, label, group, tuple(path.split('.')) if path else None)
+            for num, key, label, group, path in rows
+        ])
+
+
+def _array_body(source: str, name: str) -> str:
+    start = source.index(f'export const {name}')
+    end = re.compile(r'\n\](?: as const)?;').search(source, start)
+    return source[start:end.start() if end else len(source)]
+
+
+def parse_schema(schema_src: str, normalizer_src: str) -> FieldIndex:
+    """Build the index from the text of fields-schema.ts and field-normalizer.ts."""
+    paths: Dict[str, Tuple[str, ...]] = {}
+    for m in NORMALIZER_ENTRY.finditer(_array_body(normalizer_src, 'FIELD_TO_PROPERTY_MAP')):
+        api_key, group, prop = m.group(3), m.group(4), m.group(5)
+        paths.setdefault(api_key, (*group.split('.'), prop))
+
+    records = []
+    for m in SCHEMA_ENTRY.finditer(_array_body(schema_src, 'ALL_FIELDS')):
+        num = m.group(1) or m.group(2)
+        key = m.group(3)
+        label = m.group(5).replace("\\'", "'").replace('\\"', '"')
+        records.append(FieldRecord(num, key, label, m.group(6), paths.get(f'{num}_{key}')))
+    return FieldIndex(records)
+
+
+def _sources(root) -> Dict[str, Path]:
+    return {rel: Path(root) / rel for rel in (SCHEMA_FILE, NORMALIZER_FILE)}
+
+
+def _read_cached(index_path: Path, sources: Dict[str, Path]) -> Optional[FieldIndex]:
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get('format') != FORMAT or not stamps_current(data.get('sources', {}), sources):
+        return None
+    return FieldIndex.from_rows(data['rows'])
+
+
+def _write_cached(index_path: Path, stamps: Dict[str, dict], index: FieldIndex) -> None:
+    atomic_write(index_path, json.dumps({'format': FORMAT, 'sources': stamps, 'rows': index.to_rows()},
+                                        separators=(',', ':')))
+
+
+@lru_cache(maxsize=None)
+def load_field_index(root=REPO_ROOT) -> FieldIndex:
+    """The field index for a checkout, parsed at most once per schema change."""
+    sources = _sources(root)
+    index_path = cache_dir(root) / INDEX_NAME
+
+    cached = _read_cached(index_path, sources)
+    if cached is not None:
+        return cached
+
+    raw = {}
+    stamps = {}
+    for rel, path in sources.items():
+        with open(path, 'rb') as f:
+            raw[rel] = f.read()
+        stamps[rel] = source_stamp(path, raw[rel])
+
+    index = parse_schema(raw[SCHEMA_FILE].decode('utf-8'), raw[NORMALIZER_FILE].decode('utf-8'))
+    _write_cached(index_path, stamps, index)
+    return index
@@ -0,0 +1,64 @@
+"""
+Generated TypeScript field-path table.
+
+Renders src/lib/field-paths.generated.ts from the field index: a frozen,
+module-level ``FIELD_PATHS`` map of full field key -> [group, prop]. The
+retry handlers in src/pages import it instead of declaring a
+``const paths = {...}`` literal that is rebuilt on every click and goes
+stale whenever the schema moves.
+
+sync() rewrites the module only when the rendered text differs, and is
+run before every codemod sweep and by watch mode on schema changes.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, TextIO
+
+from .field_index import FieldIndex, SCHEMA_FILE, NORMALIZER_FILE, load_field_index
+from .paths import REPO_ROOT
+from .writer import write_if_changed
+
+OUTPUT = 'src/lib/field-paths.generated.ts'
+IMPORT_PATH = '@/lib/field-paths.generated'
+IMPORT_LINE = f"import {{ FIELD_PATHS }} from '{IMPORT_PATH}';"
+
+HEADER = f'''/**
+ * Field-path lookup: full field key -> [Property group, property name].
+ *
+ * GENERATED by scripts/generate_field_paths.py from {SCHEMA_FILE}
+ * and {NORMALIZER_FILE} - DO NOT EDIT. It is regenerated before
+ * every scripts/run_codemods.py sweep, or run the script after a schema change.
+ *
+ * Module-level and frozen: built once at import, so lookups allocate nothing.
+ */
+'''
+
+
+def render(index: FieldIndex) -> str:
+    lines = [
+        HEADER,
+        'export type FieldPath = readonly [group: string, prop: string];',
+        '',
+        'const paths: Record<string, FieldPath> = {',
+        *index.path_entries(),
+        '};',
+        '',
+        'for (const path of Object.values(paths)) Object.freeze(path);',
+        '',
+        'export const FIELD_PATHS: Readonly<Record<string, FieldPath>> = Object.freeze(paths);',
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+def sync(root=REPO_ROOT, dry_run: bool = False, out: Optional[TextIO] = None, journal=None) -> bool:
+    """Regenerate the module if the schema changed; returns whether it did (or would)."""
+    path = Path(root) / OUTPUT
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            current = f.read()
+    except FileNotFoundError:
+        current = ''
+    return write_if_changed(path, current, render(load_field_index(root)), dry_run, out, journal)
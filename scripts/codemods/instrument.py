@@ -0,0 +1,120 @@
+"""
+Per-rule instrumentation for the codemods.
+
+A Profile collects, for each named rule, wall time, matches, replacements
+(matches whose text actually changed), bytes scanned and unmapped matches
+(matches left alone because no field mapping exists). Transforms accept an
+optional ``profile`` and record into it; the runner merges one Profile per
+codemod across every file and writes the lot as JSON:
+
+    profile = Profile()
+    text = profile.sub('field_keys', pattern, add_field_key, text)
+    with profile.timed('paths_map', text) as stats:
+        ...
+        stats.matches += 1
+
+Rules with a high share of the time are hot; rules with no matches over a
+whole sweep are dead weight. Every timed block also runs under the rule
+budget (codemods.regex_safety.budget), and sub() refuses patterns that can
+backtrack exponentially.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, Mapping, Optional, Union
+
+from .regex_safety import budget, validate
+from .writer import atomic_write
+
+FORMAT = 1
+
+
+@dataclass
+class RuleStats:
+    seconds: float = 0.0
+    matches: int = 0
+    replacements: int = 0
+    bytes_scanned: int = 0
+    unmapped: int = 0
+
+    def merge(self, other: 'RuleStats') -> None:
+        self.seconds += other.seconds
+        self.matches += other.matches
+        self.replacements += other.replacements
+        self.bytes_scanned += other.bytes_scanned
+        self.unmapped += other.unmapped
+
+
+class Profile:
+    def __init__(self, rules: Optional[Dict[str, RuleStats]] = None):
+        self.rules: Dict[str, RuleStats] = rules or {}
+
+    def __getitem__(self, name: str) -> RuleStats:
+        stats = self.rules.get(name)
+        if stats is None:
+            stats = self.rules[name] = RuleStats()
+        return stats
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    @contextmanager
+    def timed(self, name: str, scanned: Optional[str] = None) -> Iterator[RuleStats]:
+        """Time a block against rule ``name``; ``scanned`` is the text it reads."""
+        stats = self[name]
+        if scanned is not None:
+            stats.bytes_scanned += len(scanned.encode('utf-8'))
+        start = time.perf_counter()
+        try:
+            with budget(name):
+                yield stats
+        finally:
+            stats.seconds += time.perf_counter() - start
+
+    def sub(self, name: str, pattern: Union[str, 're.Pattern[str]'],
+            repl: Callable[['re.Match[str]'], str], text: str, flags: int = 0) -> str:
+        """re.sub with a callable replacement, recorded as rule ``name``."""
+        compiled = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        validate(name, compiled)
+        with self.timed(name, text) as stats:
+            def counted(match):
+                replaced = repl(match)
+                stats.matches += 1
+                if replaced != match.group(0):
+                    stats.replacements += 1
+                return replaced
+            return compiled.sub(counted, text)
+
+    def merge(self, other: Union['Profile', Mapping[str, dict]]) -> None:
+        rules = other.rules if isinstance(other, Profile) else Profile.from_dict(other).rules
+        for name, stats in rules.items():
+            self[name].merge(stats)
+
+    def to_dict(self) -> Dict[str, dict]:
+        return {name: asdict(stats) for name, stats in self.rules.items()}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, dict]) -> 'Profile':
+        return cls({name: RuleStats(**stats) for name, stats in data.items()})
+
+
+def report(profiles: Mapping[str, Profile], files: int = 0) -> dict:
+    """Machine-readable report: codemod -> rule -> stats, hottest rule first."""
+    codemods = {}
+    for codemod, profile in profiles.items():
+        ranked = sorted(profile.rules.items(), key=lambda item: item[1].seconds, reverse=True)
+        codemods[codemod] = {
+            'seconds': sum(stats.seconds for _, stats in ranked),
+            'rules': {name: asdict(stats) for name, stats in ranked},
+            'dead_rules': [name for name, stats in ranked if not stats.matches and not name.startswith('(')],
+        }
+    return {'format': FORMAT, 'files': files, 'codemods': codemods}
+
+
+def write_report(path, profiles: Mapping[str, Profile], files: int = 0) -> None:
+    atomic_write(path, json.dumps(report(profiles, files), indent=2))
@@ -0,0 +1,199 @@
+"""
+Reversible patch journal.
+
+Every codemod run that writes files appends one JSON line per changed file
+to .cache/codemods/journal/<run>.jsonl:
+
+    {"path": ..., "pre": sha256, "post": sha256,
+     "edits": [[offset, old_text, new_text], ...], "created": false}
+
+Edits are line-aligned hunks from difflib with offsets into the file as it
+was before the run, so an entry's size is proportional to the diff, not to
+the file. ``revert`` undoes a run (newest entry first) on files whose hash
+still equals ``post``; ``replay`` re-applies it to files whose hash equals
+``pre``. Files edited since are reported as conflicts and left alone; a
+file the run created is deleted again on revert. Files are read and written
+with newline translation off, so line endings (CRLF included) round-trip.
+
+This replaces keeping .backup / .original copies of whole files.
+"""
+
+from __future__ import annotations
+
+import difflib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from .cache import content_hash
+from .paths import REPO_ROOT, cache_dir
+from .writer import atomic_write
+
+JOURNAL_DIR = 'journal'
+
+Edit = List  # [offset, old_text, new_text]
+
+
+def diff_edits(old: str, new: str) -> List[Edit]:
+    """Line-aligned edits turning old into new; offsets index into old."""
+    old_lines = old.splitlines(True)
+    new_lines = new.splitlines(True)
+    starts = [0]
+    for line in old_lines:
+        starts.append(starts[-1] + len(line))
+    edits = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != 'equal':
+            edits.append([starts[i1], ''.join(old_lines[i1:i2]), ''.join(new_lines[j1:j2])])
+    return edits
+
+
+def apply_edits(text: str, edits: Iterable[Edit]) -> str:
+    """Apply edits whose offsets index into text (sorted, non-overlapping)."""
+    pieces = []
+    pos = 0
+    for offset, old, new in edits:
+        if text[offset:offset + len(old)] != old:
+            raise ValueError(f'edit at offset {offset} does not match the file')
+        pieces.append(text[pos:offset])
+        pieces.append(new)
+        pos = offset + len(old)
+    pieces.append(text[pos:])
+    return ''.join(pieces)
+
+
+def invert_edits(edits: Iterable[Edit]) -> List[Edit]:
+    """Edits that undo ``edits``, with offsets into the patched text."""
+    inverted = []
+    shift = 0
+    for offset, old, new in edits:
+        inverted.append([offset + shift, new, old])
+        shift += len(new) - len(old)
+    return inverted
+
+
+def _hash(text: str) -> str:
+    return content_hash(text.encode('utf-8'))
+
+
+@dataclass
+class Entry:
+    path: str
+    pre: str
+    post: str
+    edits: List[Edit]
+    created: bool = False
+
+    @classmethod
+    def between(cls, path, old: str, new: str, created: bool = False) -> 'Entry':
+        return cls(str(Path(path).resolve()), _hash(old), _hash(new), diff_edits(old, new), created)
+
+    def to_json(self) -> str:
+        return json.dumps({'path': self.path, 'pre': self.pre, 'post': self.post,
+                           'edits': self.edits, 'created': self.created},
+                          ensure_ascii=False, separators=(',', ':'))
+
+
+@dataclass
+class Outcome:
+    done: List[str] = field(default_factory=list)
+    already: List[str] = field(default_factory=list)     # file is already in the target state
+    conflicts: List[str] = field(default_factory=list)   # file changed since; left alone
+
+
+class Journal:
+    """One run's journal file; entries are appended as files are written."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    @classmethod
+    def start(cls, label: str, root=REPO_ROOT) -> 'Journal':
+        run = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{label}"
+        return cls(journal_dir(root) / f'{run}.jsonl')
+
+    @property
+    def run(self) -> str:
+        return self.path.stem
+
+    def append(self, entry: Entry) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(entry.to_json() + '\n')
+
+    def record(self, path, old: str, new: str, created: bool = False) -> None:
+        if old != new:
+            self.append(Entry.between(path, old, new, created))
+
+    def entries(self) -> Iterator[Entry]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield Entry(**json.loads(line))
+
+    def revert(self, dry_run: bool = False) -> Outcome:
+        return self._apply(reversed(list(self.entries())), undo=True, dry_run=dry_run)
+
+    def replay(self, dry_run: bool = False) -> Outcome:
+        return self._apply(self.entries(), undo=False, dry_run=dry_run)
+
+    def _apply(self, entries: Iterable[Entry], undo: bool, dry_run: bool) -> Outcome:
+        outcome = Outcome()
+        for entry in entries:
+            source, target = (entry.post, entry.pre) if undo else (entry.pre, entry.post)
+            try:
+                with open(entry.path, 'r', encoding='utf-8', newline='') as f:
+                    text = f.read()
+            except FileNotFoundError:
+                if not entry.created:
+                    outcome.conflicts.append(entry.path)
+                    continue
+                text = ''
+            current = _hash(text)
+            if undo and entry.created and not os.path.exists(entry.path):
+                outcome.already.append(entry.path)
+                continue
+            if current == target:
+                outcome.already.append(entry.path)
+                continue
+            if current != source:
+                outcome.conflicts.append(entry.path)
+                continue
+            edits = invert_edits(entry.edits) if undo else entry.edits
+            patched = apply_edits(text, edits)
+            if _hash(patched) != target:
+                outcome.conflicts.append(entry.path)
+                continue
+            if dry_run:
+                pass
+            elif undo and entry.created:
+                os.unlink(entry.path)
+            else:
+                atomic_write(entry.path, patched, newline='')
+            outcome.done.append(entry.path)
+        return outcome
+
+
+def journal_dir(root=REPO_ROOT) -> Path:
+    return cache_dir(root) / JOURNAL_DIR
+
+
+def runs(root=REPO_ROOT) -> List[Journal]:
+    """Every recorded run, oldest first."""
+    directory = journal_dir(root)
+    if not directory.is_dir():
+        return []
+    return [Journal(p) for p in sorted(directory.glob('*.jsonl'), key=lambda p: (p.stat().st_mtime_ns, p.name))]
+
+
+def find(run: Optional[str] = None, root=REPO_ROOT) -> Optional[Journal]:
+    """The run with this id (or unique id prefix), or the latest when run is None."""
+    recorded = runs(root)
+    if run is None:
+        return recorded[-1] if recorded else None
+    matches = [j for j in recorded if j.run == run] or [j for j in recorded if j.run.startswith(run)]
+    return matches[0] if len(matches) == 1 else None
@@ -0,0 +1,227 @@
+"""
+Memoize chart components: useMemo for derived data, React.memo on export.
+
+Chart components take ``{ homes }`` and recompute their scores, ``maxScore``
+and winner indices on every render, and comparison views re-render every
+chart together. For each such component this
+
+- wraps each run of consecutive ``const`` declarations that derive from
+  ``homes`` in one ``useMemo(() => ..., [homes])``, returning every name
+  the run declares, and
+- turns the component into ``const Name = memo(function Name(...) {...})``.
+
+A run is left alone when it reads component state (a ``use*`` hook result
+or anything computed from one), when a later statement other than a hook
+call or a console.* line uses its values, when anything after it calls a
+mutating method on them or assigns into them, or when it spans a
+multi-line template literal. Nothing after a statement containing
+``return`` is memoized, so hook order never depends on an early return.
+Default exports keep their plain form.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from .instrument import Profile
+from .tsx import ARROW_FUNCTION, FunctionSpan, TsxIndex, ensure_named_imports
+
+HOMES_PROPS = re.compile(r'\(\s*\{\s*homes\s*,?\s*\}\s*[:)]')
+DEFAULT_EXPORT = re.compile(r'^export\s+default\s+(?:function\s+)?([A-Za-z_$][\w$]*)', re.MULTILINE)
+COMMENT = re.compile(r'\s*(?://[^\n]*|/\*.*?\*/)', re.DOTALL)
+DECL = re.compile(
+    r'const\s+(?:([A-Za-z_$][\w$]*)\s*(:[^=]*)?|\{([^{}]*)\}|\[([^\[\]]*)\])\s*=(?![=>])\s*'
+)
+HOOK_CALL = re.compile(r'use[A-Z]?\w*\s*[(<]')
+PASSIVE = re.compile(r'(?:use[A-Z]?\w*|console\.\w+)\s*\(')
+IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+MUTATORS = 'sort|reverse|push|pop|shift|unshift|splice|fill|copyWithin|set|add|delete|clear'
+FC_TYPE = re.compile(r':\s*(?:React\.)?FC<(.*)>\s*$', re.DOTALL)
+
+Edit = Tuple[int, int, str]
+
+
+def _code_start(chunk: str) -> int:
+    """Offset of the first code character after whitespace and comments."""
+    pos = 0
+    while True:
+        m = COMMENT.match(chunk, pos)
+        if not m:
+            return len(chunk) - len(chunk[pos:].lstrip())
+        pos = m.end()
+
+
+def _names(decl: 're.Match[str]') -> Optional[List[str]]:
+    if decl.group(1):
+        return [decl.group(1)]
+    names = []
+    for part in (decl.group(3) or decl.group(4) or '').split(','):
+        part = part.strip().lstrip('.').split('=')[0].split(':')[-1].strip()
+        if part:
+            if not IDENTIFIER.fullmatch(part):
+                return None
+            names.append(part)
+    return names or None
+
+
+class _Statement:
+    def __init__(self, start: int, end: int, chunk: str):
+        self.start = start
+        self.end = end
+        self.chunk = chunk
+        self.code_at = _code_start(chunk)
+        self.code = chunk[self.code_at:]
+        self.refs: Set[str] = set(IDENTIFIER.findall(chunk))
+        decl = DECL.match(self.code)
+        self.names = _names(decl) if decl else None
+        self.decl = decl
+        self.hook = bool(decl and HOOK_CALL.match(self.code, decl.end()))
+
+
+def _runs(text: str, index: TsxIndex, span: FunctionSpan) -> List[List[_Statement]]:
+    """Runs of derived const statements in span's body that are safe to memoize."""
+    tainted: Set[str] = set()
+    derived = {'homes'}
+    runs: List[Tuple[List[_Statement], Set[str]]] = []
+    current: List[_Statement] = []
+
+    def flush():
+        if current and any(s.refs & derived for s in current):
+            runs.append((list(current), {n for s in current for n in s.names}))
+        current.clear()
+
+    for start, end in index.statements(span.body_open):
+        stmt = _Statement(start, end, text[start:end])
+        if stmt.names is None or stmt.hook:
+            flush()
+            if stmt.hook and stmt.names:
+                tainted.update(stmt.names)
+            if re.search(r'\breturn\b', stmt.code):
+                break
+            if stmt.names is None and not PASSIVE.match(stmt.code):
+                # Anything else that touches a run's values may mutate them
+                runs = [(run, names) for run, names in runs if not stmt.refs & names]
+            continue
+        if stmt.refs & tainted:
+            tainted.update(stmt.names)
+            flush()
+            continue
+        if stmt.refs & derived:
+            derived.update(stmt.names)
+        current.append(stmt)
+    flush()
+
+    safe = []
+    for run, names in runs:
+        body = text[run[0].start:run[-1].end]
+        if any(line.count('`') % 2 for line in body.splitlines()):
+            continue
+        mutated = re.compile(
+            rf'\b(?:{"|".join(map(re.escape, names))})(?:\.[\w$]+|\[[^\]\n]*\])*'
+            rf'(?:\.(?:{MUTATORS})\s*\(|(?:\.[\w$]+|\[[^\]\n]*\])\s*(?:[-+*/]?=(?![=>])|\+\+|--))')
+        if mutated.search(text, run[-1].end, span.body_close):
+            continue
+        safe.append(run)
+    return safe
+
+
+def _memo_run(text: str, run: List[_Statement]) -> Edit:
+    start, end = run[0].start, run[-1].end
+    first = run[0]
+    lead = first.chunk[:first.code_at]
+    indent = lead[lead.rfind('\n') + 1:]
+    comments_at = len(first.chunk) - len(first.chunk.lstrip())
+    prefix = first.chunk[:first.chunk.rfind('\n', 0, comments_at) + 1]
+    body = text[start + len(prefix):end]
+
+    if len(run) == 1 and first.decl.group(1) and not first.decl.group(2):
+        init = first.code[first.decl.end():].rstrip().rstrip(';').rstrip()
+        if init.startswith('{'):
+            init = f'({init})'
+        head = first.chunk[len(prefix):first.code_at]
+        return start, end, f'{prefix}{head}const {first.decl.group(1)} = useMemo(() => {init}, [homes]);'
+
+    names = ', '.join(n for s in run for n in s.names)
+    inner = '\n'.join(f'  {line}' if line.strip() else line for line in body.split('\n'))
+    return start, end, (f'{prefix}{indent}const {{ {names} }} = useMemo(() => {{\n'
+                        f'{inner}\n'
+                        f'{indent}  return {{ {names} }};\n'
+                        f'{indent}}}, [homes]);')
+
+
+def _memo_component(text: str, index: TsxIndex, span: FunctionSpan, arrow: bool) -> Optional[List[Edit]]:
+    """Edits wrapping the component in memo(function Name(...) {...})."""
+    if arrow:
+        m = ARROW_FUNCTION.match(text, span.start)
+        params_open = m.end() - 1
+        annotation = text[m.end(1):text.rindex('=', m.end(1), params_open)].strip()
+        props = ''
+        if annotation:
+            fc = FC_TYPE.match(annotation)
+            if fc is None:
+                return None
+            props = f'<{fc.group(1)}>'
+        params_close = index.pairs[params_open]
+        after = text[span.end:span.end + 1]
+        return [
+            (span.start, params_open, f'const {span.name} = memo{props}(function {span.name}'),
+            (params_close + 1, span.body_open, ' '),
+            (span.body_close, span.end + (after == ';'), '});'),
+        ]
+    keyword = text.index('function', span.start)
+    if 'memo' in text[span.start:keyword]:
+        return None
+    return [
+        (keyword, keyword, f'const {span.name} = memo('),
+        (span.body_close, span.end, '});'),
+    ]
+
+
+def memo_edits(text: str, index: TsxIndex, stats=None) -> Tuple[List[Edit], Dict[str, int]]:
+    """(start, end, replacement) edits memoizing every ``{ homes }`` component, and counts."""
+    counts = {'use_memo': 0, 'react_memo': 0}
+    edits: List[Edit] = []
+    exported = set(DEFAULT_EXPORT.findall(text))
+    components = [(s, False) for s in index.functions(r'[A-Z][\w$]*')]
+    components += [(s, True) for s in index.arrow_functions(r'[A-Z][\w$]*')]
+    for span, arrow in sorted(components, key=lambda c: c[0].start):
+        if not HOMES_PROPS.search(text, span.start, span.body_open):
+            continue
+        runs = _runs(text, index, span)
+        wrap = None if span.name in exported else _memo_component(text, index, span, arrow)
+        if stats is not None:
+            stats.matches += 1
+        if wrap is None and not runs:
+            continue
+        edits.extend(_memo_run(text, run) for run in runs)
+        counts['use_memo'] += len(runs)
+        if wrap is not None:
+            edits.extend(wrap)
+            counts['react_memo'] += 1
+        if stats is not None:
+            stats.replacements += 1
+    return edits, counts
+
+
+def splice(text: str, edits: List[Edit], counts: Dict[str, int]) -> str:
+    """Splice non-overlapping edits into text and import what the memo edits use."""
+    if not edits:
+        return text
+    pieces = []
+    pos = 0
+    for start, end, replacement in sorted(edits):
+        pieces.append(text[pos:start])
+        pieces.append(replacement)
+        pos = end
+    pieces.append(text[pos:])
+    needed = [name for name, key in (('useMemo', 'use_memo'), ('memo', 'react_memo')) if counts.get(key)]
+    return ensure_named_imports(''.join(pieces), needed, 'react') if needed else ''.join(pieces)
+
+
+def memoize_charts(text: str, profile: Optional[Profile] = None) -> Tuple[str, Dict[str, int]]:
+    """Memoize every ``{ homes }`` component in text; returns (new_text, counts)."""
+    profile = Profile() if profile is None else profile
+    with profile.timed('memoize', text) as stats:
+        edits, counts = memo_edits(text, TsxIndex(text), stats)
+    return splice(text, edits, counts), counts
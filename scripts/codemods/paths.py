@@ -0,0 +1,11 @@
+"""Well-known locations shared by the codemod package and scripts."""
+
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = SCRIPTS_DIR.parent
+
+
+def cache_dir(root=REPO_ROOT) -> Path:
+    """Per-checkout cache directory (git-ignored)."""
+    return Path(root) / '.cache' / 'codemods'
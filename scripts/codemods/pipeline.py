@@ -0,0 +1,79 @@
+"""
+Transform fusion: one read, N in-memory stages, one write.
+
+A Pipeline is an ordered list of (name, transform) stages. ``apply`` passes
+the text through every stage and times each one; callers read the file
+once before and write it once after, so a multi-step migration such as
+update_datafields -> fix_property_detail costs one disk round trip and one
+rebuild trigger instead of one per script.
+
+The runner builds a Pipeline per file (codemods.runner.stages) and
+scripts/run_pipeline.py exposes it for an explicit chain of codemods.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .instrument import Profile
+from .regex_safety import RuleTimeout
+
+Transform = Callable[..., Tuple[str, Dict[str, int]]]
+
+
+@dataclass
+class StageResult:
+    name: str
+    seconds: float
+    counts: Dict[str, int]
+    changed: bool
+
+
+@dataclass
+class PipelineResult:
+    text: str
+    stages: List[StageResult] = field(default_factory=list)
+
+    @property
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        return {stage.name: stage.counts for stage in self.stages}
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        return {stage.name: stage.seconds for stage in self.stages}
+
+    @property
+    def seconds(self) -> float:
+        return sum(stage.seconds for stage in self.stages)
+
+
+class Pipeline:
+    def __init__(self, stages: Sequence[Tuple[str, Transform]]):
+        self.stages = list(stages)
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name, _ in self.stages]
+
+    def apply(self, text: str, profiles: Optional[Dict[str, Profile]] = None) -> PipelineResult:
+        """
+        Run every stage over text in order. With profiles, each stage also
+        records per-rule stats into profiles[name] (created as needed).
+        """
+        result = PipelineResult(text)
+        for name, transform in self.stages:
+            start = time.perf_counter()
+            try:
+                if profiles is None:
+                    new_text, counts = transform(result.text)
+                else:
+                    new_text, counts = transform(result.text, profiles.setdefault(name, Profile()))
+            except RuleTimeout as timeout:
+                # Name the stage too: rule names only need to be unique per codemod
+                raise RuleTimeout(f'{name}.{timeout.rule}', timeout.seconds) from None
+            elapsed = time.perf_counter() - start
+            result.stages.append(StageResult(name, elapsed, dict(counts), new_text != result.text))
+            result.text = new_text
+        return result
@@ -0,0 +1,286 @@
+"""
+Regex safety: static checks for backtracking-prone patterns, and a
+per-rule time budget.
+
+Python's ``re`` backtracks, so an ambiguous pattern can take exponential
+(or high polynomial) time on malformed or deeply nested JSX, and one bad
+file would hang a whole sweep. Two layers guard against that:
+
+lint(pattern, flags) walks the parsed pattern and reports
+
+    error    nested quantifier - an unbounded repeat inside another whose
+             iterations can split the same text in many ways, e.g. (a+)+
+             or (?:\\s*\\w*)*; exponential on a near miss
+    warning  adjacent quantifiers over overlapping characters, e.g. \\s*\\s+
+             or \\w+\\d*, which go polynomial on a near miss
+    warning  an unbounded DOTALL scan (.*? with re.DOTALL) with more pattern
+             after it: each candidate start may read to the end of the file
+
+validate() raises UnsafePattern on errors; RewriteEngine runs it for every
+rule it is given and Profile.sub for every pattern it runs.
+
+budget(rule) bounds the wall time of a block with SIGALRM (the regex engine
+checks for signals while it matches) and raises RuleTimeout naming the
+rule. Profile.timed and RewriteEngine.rewrite run every rule under it, and
+the runner reports a timed-out file with its rule and moves on. Budgets do
+not nest - an inner block runs under the outer one - and are skipped where
+SIGALRM is unavailable (Windows, or off the main thread).
+"""
+
+from __future__ import annotations
+
+import re
+import signal
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, Iterator, List, Optional, Tuple, Union
+
+try:
+    from re import _constants as sre, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants as sre
+    import sre_parse
+
+DEFAULT_BUDGET = 5.0
+
+# Every ASCII character plus a few non-ASCII ones stand in for the whole
+# character set when comparing what two pieces of a pattern can consume
+ALPHABET: FrozenSet[int] = frozenset([*range(128), 0xA0, 0xE9, 0x2028, 0x4E2D])
+
+_CATEGORIES = {
+    'CATEGORY_DIGIT': r'\d', 'CATEGORY_NOT_DIGIT': r'\D',
+    'CATEGORY_SPACE': r'\s', 'CATEGORY_NOT_SPACE': r'\S',
+    'CATEGORY_WORD': r'\w', 'CATEGORY_NOT_WORD': r'\W',
+    'CATEGORY_LINEBREAK': r'\n', 'CATEGORY_NOT_LINEBREAK': r'[^\n]',
+}
+
+_REPEATS = (sre.MAX_REPEAT, sre.MIN_REPEAT)
+_POSSESSIVE = getattr(sre, 'POSSESSIVE_REPEAT', None)
+_ATOMIC = getattr(sre, 'ATOMIC_GROUP', None)
+
+
+@dataclass(frozen=True)
+class Finding:
+    severity: str   # 'error' or 'warning'
+    message: str
+
+
+class UnsafePattern(ValueError):
+    def __init__(self, rule: str, findings: List[Finding]):
+        self.rule = rule
+        self.findings = findings
+        super().__init__(f"rule '{rule}': " + '; '.join(f.message for f in findings))
+
+
+class RuleTimeout(Exception):
+    def __init__(self, rule: str, seconds: float):
+        self.rule = rule
+        self.seconds = seconds
+        super().__init__(f"rule '{rule}' exceeded its {seconds:g}s budget")
+
+
+class _Walker:
+    def __init__(self, flags: int):
+        self.flags = flags
+        self.findings: List[Finding] = []
+
+    def chars(self, items, dotall: bool) -> FrozenSet[int]:
+        """Every character the items can consume (over ALPHABET)."""
+        found = set()
+        for op, av in items:
+            if op == sre.LITERAL:
+                found.add(av)
+                if self.flags & re.IGNORECASE:
+                    found.update(ord(c) for c in (chr(av).lower(), chr(av).upper()) if len(c) == 1)
+            elif op == sre.NOT_LITERAL:
+                found |= ALPHABET - {av}
+            elif op == sre.ANY:
+                found |= ALPHABET if dotall else ALPHABET - {10}
+            elif op == sre.IN:
+                found |= self._class(av)
+            elif op in _REPEATS or op == _POSSESSIVE:
+                found |= self.chars(av[2], dotall)
+            elif op == sre.SUBPATTERN:
+                found |= self.chars(av[-1], self._dotall(av, dotall))
+            elif op == sre.BRANCH:
+                for branch in av[1]:
+                    found |= self.chars(branch, dotall)
+            elif op == _ATOMIC:
+                found |= self.chars(av, dotall)
+            elif op == sre.GROUPREF:
+                found |= ALPHABET
+        return frozenset(found)
+
+    def _class(self, items) -> FrozenSet[int]:
+        found = set()
+        negate = False
+        for op, av in items:
+            if op == sre.NEGATE:
+                negate = True
+            elif op == sre.LITERAL:
+                found.add(av)
+            elif op == sre.RANGE:
+                found.update(c for c in ALPHABET if av[0] <= c <= av[1])
+            elif op == sre.CATEGORY:
+                category = re.compile(_CATEGORIES.get(str(av), r'[^\s\S]'))
+                found.update(c for c in ALPHABET if category.match(chr(c)))
+        return frozenset(ALPHABET - found if negate else found)
+
+    def _dotall(self, subpattern_av, dotall: bool) -> bool:
+        if len(subpattern_av) == 4:
+            _, add, remove, _ = subpattern_av
+            return (dotall or bool(add & re.DOTALL)) and not remove & re.DOTALL
+        return dotall
+
+    @staticmethod
+    def _min_width(item) -> int:
+        return sre_parse.SubPattern(sre_parse.State(), [item]).getwidth()[0]
+
+    @staticmethod
+    def _unbounded(item) -> bool:
+        op, av = item
+        return op in _REPEATS and av[1] == sre.MAXREPEAT
+
+    def _flatten(self, items, dotall: bool) -> List[Tuple[tuple, bool]]:
+        """Items with non-capturing/capturing groups opened up, each with its DOTALL state."""
+        flat = []
+        for item in items:
+            op, av = item
+            if op == sre.SUBPATTERN:
+                flat.extend(self._flatten(av[-1], self._dotall(av, dotall)))
+            else:
+                flat.append((item, dotall))
+        return flat
+
+    def _inner_repeats(self, items, dotall: bool) -> Iterator[Tuple[tuple, bool]]:
+        for item, item_dotall in self._flatten(items, dotall):
+            op, av = item
+            if self._unbounded(item):
+                yield item, item_dotall
+            if op in _REPEATS:
+                yield from self._inner_repeats(av[2], item_dotall)
+            elif op == sre.BRANCH:
+                for branch in av[1]:
+                    yield from self._inner_repeats(branch, item_dotall)
+
+    @staticmethod
+    def _single(items) -> bool:
+        """True if items always match exactly one character."""
+        return sre_parse.SubPattern(sre_parse.State(), list(items)).getwidth() == (1, 1)
+
+    def _nested(self, body, dotall: bool) -> Optional[str]:
+        """Why an unbounded repeat of body is ambiguous, or None."""
+        flat = self._flatten(body, dotall)
+        for inner, inner_dotall in self._inner_repeats(body, dotall):
+            consumed = self.chars([inner], inner_dotall)
+            # A mandatory piece the inner repeat cannot consume separates the
+            # iterations, so there is only one way to split the text
+            separated = any(
+                item is not inner and self._min_width(item) > 0
+                and not self.chars([item], item_dotall) & consumed
+                for item, item_dotall in flat
+            )
+            if consumed and not separated:
+                return 'nested quantifier: an unbounded repeat inside another can split the same text many ways'
+        return None
+
+    def walk(self, items, dotall: bool) -> None:
+        flat = list(items)
+        for i, (op, av) in enumerate(flat):
+            if op in _REPEATS:
+                lo, hi, body = av
+                if hi == sre.MAXREPEAT:
+                    problem = self._nested(body, dotall)
+                    if problem:
+                        self.findings.append(Finding('error', problem))
+                    if (dotall and op == sre.MIN_REPEAT and i + 1 < len(flat)
+                            and self.chars(body, dotall) >= ALPHABET):
+                        self.findings.append(Finding(
+                            'warning', 'unbounded DOTALL scan: each candidate start may read to the end of the file'))
+                    following = flat[i + 1] if i + 1 < len(flat) else None
+                    if (following and self._unbounded(following) and self._single(body)
+                            and self._single(following[1][2])
+                            and self.chars(body, dotall) & self.chars([following], dotall)):
+                        self.findings.append(Finding(
+                            'warning', 'adjacent quantifiers over overlapping characters'))
+                self.walk(body, dotall)
+            elif op == _POSSESSIVE:
+                self.walk(av[2], dotall)
+            elif op == sre.SUBPATTERN:
+                self.walk(av[-1], self._dotall(av, dotall))
+            elif op == sre.BRANCH:
+                for branch in av[1]:
+                    self.walk(branch, dotall)
+            elif op in (sre.ASSERT, sre.ASSERT_NOT):
+                self.walk(av[1], dotall)
+            elif op == _ATOMIC:
+                self.walk(av, dotall)
+            elif op == sre.GROUPREF_EXISTS:
+                self.walk(av[1], dotall)
+                if av[2]:
+                    self.walk(av[2], dotall)
+
+
+@lru_cache(maxsize=None)
+def _lint(pattern: str, flags: int) -> Tuple[Finding, ...]:
+    parsed = sre_parse.parse(pattern, flags)
+    walker = _Walker(parsed.state.flags)
+    walker.walk(parsed.data, bool(parsed.state.flags & re.DOTALL))
+    return tuple(dict.fromkeys(walker.findings))
+
+
+def lint(pattern: Union[str, 're.Pattern[str]'], flags: int = 0) -> List[Finding]:
+    """Backtracking hazards in pattern, errors first."""
+    if isinstance(pattern, re.Pattern):
+        pattern, flags = pattern.pattern, pattern.flags
+    if isinstance(pattern, bytes):
+        pattern = pattern.decode('latin-1')
+    return sorted(_lint(pattern, flags & ~re.UNICODE), key=lambda f: f.severity != 'error')
+
+
+def validate(rule: str, pattern: Union[str, 're.Pattern[str]'], flags: int = 0) -> List[Finding]:
+    """Raise UnsafePattern if pattern has an error-level hazard; returns the warnings."""
+    findings = lint(pattern, flags)
+    errors = [f for f in findings if f.severity == 'error']
+    if errors:
+        raise UnsafePattern(rule, errors)
+    return findings
+
+
+_budget = DEFAULT_BUDGET
+_active = False
+
+
+def set_budget(seconds: Optional[float]) -> None:
+    """Per-rule budget for this process; None or 0 turns it off."""
+    global _budget
+    _budget = seconds or 0.0
+
+
+def _available() -> bool:
+    return hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+
+
+@contextmanager
+def budget(rule: str, seconds: Optional[float] = None) -> Iterator[None]:
+    """Raise RuleTimeout if the block runs longer than the rule budget."""
+    global _active
+    seconds = _budget if seconds is None else seconds
+    if _active or not seconds or not _available():
+        yield
+        return
+
+    def expired(signum, frame):
+        raise RuleTimeout(rule, seconds)
+
+    previous = signal.signal(signal.SIGALRM, expired)
+    _active = True
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+        _active = False
@@ -0,0 +1,128 @@
+"""
+Declarative rule registry.
+
+Rewrite rules are declared as data in the modules of ``codemods.rules``,
+each under the codemod (migration) it belongs to:
+
+    register('update_datafields', 'plain',
+             r'<DataField label="([^"]+)" ... />', r'{renderDataField("\\1", ...)}',
+             globs=('pages/*.tsx',), priority=10)
+
+A codemod's rules run as one RewriteEngine, highest priority first (ties
+keep declaration order), so the most specific rule wins at any offset. The
+engine is compiled the first time it is asked for and then reused for the
+rest of the process; declaring another rule for that codemod drops it.
+
+Every registered codemod is swept by the runner (codemods.runner) over its
+globs, so a new regex migration is a rules module, not another script.
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import os
+import sys
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .engine import Replacement, RewriteEngine, Rule
+from .instrument import Profile
+from .paths import SCRIPTS_DIR
+
+
+@dataclass(frozen=True)
+class Declaration:
+    codemod: str
+    rule: Rule
+    globs: Tuple[str, ...]
+    priority: int
+    source: str     # declaring module, relative to scripts/
+
+
+class Registry:
+    def __init__(self):
+        self.declarations: List[Declaration] = []
+        self._engines: Dict[str, RewriteEngine] = {}
+
+    def register(self, codemod: str, name: str, pattern: str, replacement: Replacement,
+                 globs: Tuple[str, ...], priority: int = 0, flags: int = 0, source: Optional[str] = None) -> Rule:
+        rule = Rule(name, pattern, replacement, flags)
+        if any(d.codemod == codemod and d.rule.name == name for d in self.declarations):
+            raise ValueError(f'rule {codemod}.{name} is already registered')
+        self.declarations.append(Declaration(codemod, rule, tuple(globs), priority, source or _caller()))
+        self._engines.pop(codemod, None)
+        return rule
+
+    def names(self) -> List[str]:
+        """Registered codemods, in declaration order."""
+        return list(dict.fromkeys(d.codemod for d in self.declarations))
+
+    def _declared(self, codemod: str) -> List[Declaration]:
+        found = [d for d in self.declarations if d.codemod == codemod]
+        if not found:
+            raise KeyError(f'no rules registered for codemod {codemod!r}')
+        return found
+
+    def rules(self, codemod: str) -> List[Rule]:
+        """The codemod's rules, highest priority first."""
+        ranked = sorted(enumerate(self._declared(codemod)), key=lambda item: (-item[1].priority, item[0]))
+        return [d.rule for _, d in ranked]
+
+    def globs(self, codemod: str) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(g for d in self._declared(codemod) for g in d.globs))
+
+    def sources(self, codemod: str) -> Tuple[str, ...]:
+        """Modules declaring the codemod's rules, relative to scripts/."""
+        return tuple(dict.fromkeys(d.source for d in self._declared(codemod)))
+
+    def engine(self, codemod: str) -> RewriteEngine:
+        engine = self._engines.get(codemod)
+        if engine is None:
+            engine = self._engines[codemod] = RewriteEngine(self.rules(codemod))
+        return engine
+
+    def transform(self, codemod: str) -> Callable[..., Tuple[str, Dict[str, int]]]:
+        """``transform(content, profile=None) -> (new_content, counts)`` for the codemod."""
+        def transform(content: str, profile: Optional[Profile] = None) -> Tuple[str, Dict[str, int]]:
+            result = self.engine(codemod).rewrite(content, profile)
+            return result.text, result.counts
+        transform.__name__ = f'transform_{codemod}'
+        return transform
+
+    def clear(self) -> None:
+        self.declarations.clear()
+        self._engines.clear()
+
+
+def _caller() -> str:
+    """File of the module calling register(), relative to scripts/."""
+    for frame in inspect.stack(0)[2:]:
+        path = os.path.abspath(frame.filename)
+        if path != os.path.abspath(__file__):
+            return os.path.relpath(path, SCRIPTS_DIR).replace(os.sep, '/')
+    return ''
+
+
+REGISTRY = Registry()
+register = REGISTRY.register
+_loaded = False
+
+
+def registry() -> Registry:
+    """The process-wide registry, with every module in codemods.rules declared."""
+    global _loaded
+    if not _loaded:
+        importlib.import_module(f'{__package__}.rules')
+        _loaded = True
+    return REGISTRY
+
+
+def reload() -> Registry:
+    """Forget every declaration and engine and re-import the rule modules (watch mode)."""
+    global _loaded
+    REGISTRY.clear()
+    for name in [m for m in sys.modules if m == f'{__package__}.rules' or m.startswith(f'{__package__}.rules.')]:
+        del sys.modules[name]
+    _loaded = False
+    return registry()
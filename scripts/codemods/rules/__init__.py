@@ -0,0 +1,8 @@
+"""
+Declared rewrite rules, one module per migration (see codemods.registry).
+
+Importing this package registers every rule; add a module here and list it
+below to ship a new regex migration without a new script.
+"""
+
+from . import datafields  # noqa: F401
@@ -0,0 +1,37 @@
+"""
+<DataField ... /> -> renderDataField(...) in the pages (update_datafields).
+
+All four variants share a prefix; the most specific is declared with the
+highest priority so it wins where several could match.
+"""
+
+from ..registry import register
+
+GLOBS = ('pages/*.tsx',)
+
+# Shared prefix: <DataField label="X" value={fullProperty.category.field.value}
+_PREFIX = r'<DataField label="([^"]+)" value=\{fullProperty\.([^.]+)\.([^.]+)\.value\}'
+
+# Pattern 4: With format and icon
+register('update_datafields', 'format+icon',
+         _PREFIX + r' format="([^"]+)" icon=\{([^}]+)\} />',
+         r'{renderDataField("\1", fullProperty.\2.\3, "\4", \5)}',
+         globs=GLOBS, priority=30)
+
+# Pattern 2: <DataField label="X" value={...} format="Y" />
+register('update_datafields', 'format',
+         _PREFIX + r' format="([^"]+)" />',
+         r'{renderDataField("\1", fullProperty.\2.\3, "\4")}',
+         globs=GLOBS, priority=20)
+
+# Pattern 3: With icon prop
+register('update_datafields', 'icon',
+         _PREFIX + r' icon=\{([^}]+)\} />',
+         r'{renderDataField("\1", fullProperty.\2.\3, "text", \4)}',
+         globs=GLOBS, priority=20)
+
+# Pattern 1: <DataField label="X" value={fullProperty.category.field.value} />
+register('update_datafields', 'plain',
+         _PREFIX + r' />',
+         r'{renderDataField("\1", fullProperty.\2.\3)}',
+         globs=GLOBS, priority=10)
@@ -0,0 +1,302 @@
+"""
+Repo-wide codemod runner.
+
+Finds every file under src/ that a codemod's globs claim and fans the work
+out over a process pool. Work is grouped per file, not per codemod: each
+worker reads its file once, runs the codemods that apply to it in registry
+order as one in-memory pipeline (codemods.pipeline) and writes once, so
+transforms that must run in sequence on the same file (update_datafields ->
+fix_property_detail) never race each other and each stage is timed.
+
+Each codemod script exposes ``transform(content, profile=None) ->
+(new_content, counts)`` and is loaded by file path, which also covers
+hyphenated script names. Pure regex migrations need no script: their rules
+are declared in codemods.rules and run from codemods.registry. With
+``profile=True`` every transform records per-rule stats
+(codemods.instrument), merged per codemod in the Summary.
+
+Files whose content and codemod chain are unchanged since the last
+successful run are skipped using the manifest in codemods.cache. Writes go
+through codemods.writer (only when content changed, atomically); a dry run
+returns each file's unified diff instead.
+
+Each rule runs under a time budget (codemods.regex_safety): a file on which
+a rule backtracks past it is reported with that rule and the sweep goes on.
+
+The worker that processes src/pages/PropertyDetail.tsx also extracts its
+keyed field sites from the new text (FileResult.sites), so callers can
+refresh the field search index (codemods.search_index) in the same pass.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .cache import Fingerprint, Manifest, content_hash, fingerprint, ruleset_version
+from .instrument import Profile
+from .journal import Entry, Journal
+from .pipeline import Pipeline
+from .regex_safety import DEFAULT_BUDGET, RuleTimeout, set_budget
+from .registry import registry
+from .paths import REPO_ROOT, SCRIPTS_DIR
+from .search_index import FieldSite, extract_sites, indexes
+from .writer import atomic_write, stream_diff
+
+
+@dataclass(frozen=True)
+class Codemod:
+    name: str
+    script: str
+    globs: Tuple[str, ...]
+    declared: bool = False  # rules come from codemods.registry; script is a module declaring them
+
+    @property
+    def sources(self) -> Tuple[str, ...]:
+        """Files (relative to scripts/) whose edits change this codemod's output."""
+        return registry().sources(self.name) if self.declared else (self.script,)
+
+
+def declared(name: str) -> Codemod:
+    """Codemod for a migration declared in codemods.rules."""
+    rules = registry()
+    return Codemod(name, rules.sources(name)[0], rules.globs(name), declared=True)
+
+
+def registered() -> Tuple[Codemod, ...]:
+    """Every codemod, in registry order (which is execution order within a file)."""
+    codemods = (
+        declared('update_datafields'),
+        Codemod('fix_retry', 'fix_retry.py', ('pages/*.tsx',)),
+        Codemod('fix_property_detail', 'fix_property_detail.py', ('pages/*.tsx',)),
+        Codemod('section6_styling', 'complete-section6-styling.py',
+                ('components/visuals/recharts/*Charts.tsx',)),
+        Codemod('lazy_section_charts', 'lazy_section_charts.py', ('components/visuals/Category*.tsx',)),
+    )
+    # Every other declared migration runs after these, in declaration order
+    return codemods + tuple(declared(name) for name in registry().names()
+                            if name not in {c.name for c in codemods})
+
+
+CODEMODS: Tuple[Codemod, ...] = registered()
+CODEMODS_BY_NAME: Dict[str, Codemod] = {c.name: c for c in CODEMODS}
+
+
+def refresh() -> Tuple[Codemod, ...]:
+    """
+    Rebuild CODEMODS from the registry after codemods.registry.reload(), so
+    declared migrations pick up new globs and sources and newly added rule
+    modules join. CODEMODS_BY_NAME is updated in place for its importers.
+    """
+    global CODEMODS
+    CODEMODS = registered()
+    CODEMODS_BY_NAME.clear()
+    CODEMODS_BY_NAME.update((c.name, c) for c in CODEMODS)
+    return CODEMODS
+
+
+def target_globs(codemods: Sequence[Codemod]) -> Tuple[str, ...]:
+    """Every glob (relative to src/) claimed by one of codemods, in order."""
+    return tuple(dict.fromkeys(g for c in codemods for g in c.globs))
+
+
+@dataclass
+class FileResult:
+    path: str
+    changed: bool = False
+    counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    error: Optional[str] = None
+    fingerprint: Optional[Fingerprint] = None
+    diff: Optional[str] = None
+    profiles: Dict[str, Dict[str, dict]] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    journal: Optional[Entry] = None
+    timed_out: Optional[str] = None     # rule that ran out of budget
+    sites: Optional[List[FieldSite]] = None     # the page's field sites, for the search index
+
+
+@dataclass
+class Summary:
+    files: int = 0
+    changed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    timeouts: Dict[str, str] = field(default_factory=dict)   # path -> rule
+    counts: Dict[str, Counter] = field(default_factory=dict)
+    profiles: Dict[str, Profile] = field(default_factory=dict)
+    seconds: Counter = field(default_factory=Counter)   # per codemod stage
+    sites: Optional[List[FieldSite]] = None
+
+    def add(self, result: FileResult) -> None:
+        self.files += 1
+        if result.changed:
+            self.changed.append(result.path)
+        if result.error:
+            self.errors[result.path] = result.error
+        if result.timed_out:
+            self.timeouts[result.path] = result.timed_out
+        for name, counts in result.counts.items():
+            self.counts.setdefault(name, Counter()).update(counts)
+        self.seconds.update(result.timings)
+        for name, rules in result.profiles.items():
+            self.profiles.setdefault(name, Profile()).merge(rules)
+        if result.sites is not None:
+            self.sites = result.sites
+
+
+_loaded = {}
+
+
+def load_module(codemod: Codemod):
+    """Import a codemod script by path, once per process."""
+    module = _loaded.get(codemod.name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            f'codemod_{codemod.name}', SCRIPTS_DIR / codemod.script)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded[codemod.name] = module
+    return module
+
+
+def load_transform(codemod: Codemod):
+    """The codemod's transform: its declared rules' engine, or its script's (imported once per process)."""
+    if codemod.declared:
+        return registry().transform(codemod.name)
+    return load_module(codemod).transform
+
+
+def stages(names: Sequence[str]) -> Pipeline:
+    """Pipeline of the named codemods, in the order given."""
+    return Pipeline([(name, load_transform(CODEMODS_BY_NAME[name])) for name in names])
+
+
+def discover(root: Path = REPO_ROOT, globs: Optional[Iterable[str]] = None) -> List[Path]:
+    """Every file under root/src matching one of globs (default: every codemod's), sorted."""
+    src = Path(root) / 'src'
+    found = set()
+    for pattern in target_globs(CODEMODS) if globs is None else globs:
+        found.update(p for p in src.glob(pattern) if p.is_file())
+    return sorted(found)
+
+
+def plan(files: Iterable[Path], codemods: Sequence[Codemod],
+         root: Path = REPO_ROOT) -> List[Tuple[str, Tuple[str, ...]]]:
+    """Pair each file with the codemods whose globs claim it (in registry order)."""
+    src = Path(root) / 'src'
+    tasks = []
+    for path in files:
+        rel = path.relative_to(src).as_posix()
+        names = tuple(c.name for c in codemods if any(fnmatch(rel, g) for g in c.globs))
+        if names:
+            tasks.append((str(path), names))
+    return tasks
+
+
+def chain_version(names: Sequence[str]) -> str:
+    return ruleset_version(*(source for n in names for source in CODEMODS_BY_NAME[n].sources))
+
+
+def run_file(path: str, names: Sequence[str], dry_run: bool = False,
+             profile: bool = False, rule_budget: Optional[float] = DEFAULT_BUDGET,
+             root: Path = REPO_ROOT) -> FileResult:
+    """
+    Worker: read one file once, run the codemod pipeline over it, write once
+    if it changed. For root's PropertyDetail page the result carries the
+    field sites of the new text.
+    """
+    result = FileResult(path)
+    set_budget(rule_budget)
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        # Same newline handling as reading in text mode
+        original = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        profiles = {} if profile else None
+        fused = stages(names).apply(original, profiles)
+        content = fused.text
+        result.counts = fused.counts
+        result.timings = fused.timings
+        if profiles:
+            result.profiles = {name: recorder.to_dict() for name, recorder in profiles.items()}
+        if indexes(path, root):
+            result.sites = extract_sites(content)
+        if content != original and dry_run:
+            result.changed = True
+            diff = io.StringIO()
+            stream_diff(path, original, content, diff)
+            result.diff = diff.getvalue()
+        elif content != original:
+            atomic_write(path, content)
+            result.changed = True
+            result.fingerprint = fingerprint(path)
+            result.journal = Entry.between(path, original, content)
+        else:
+            st = os.stat(path)
+            result.fingerprint = (content_hash(raw), st.st_mtime_ns, st.st_size)
+    except RuleTimeout as exc:  # a pathological file is marked, not waited on
+        result.error = f'{type(exc).__name__}: {exc}'
+        result.timed_out = exc.rule
+    except Exception as exc:  # one bad file must not sink the sweep
+        result.error = f'{type(exc).__name__}: {exc}'
+    return result
+
+
+def run(codemods: Optional[Sequence[Codemod]] = None, root: Path = REPO_ROOT,
+        jobs: Optional[int] = None, use_cache: bool = True, dry_run: bool = False,
+        profile: bool = False, on_result: Optional[Callable[[FileResult], None]] = None,
+        journal: Optional[Journal] = None, rule_budget: Optional[float] = DEFAULT_BUDGET) -> Summary:
+    """
+    Sweep every file claimed by codemods (default: all of them). on_result
+    is called in the parent as each file finishes (in plan order), e.g. to
+    stream dry-run diffs. Every write is
+    recorded in journal, if given. A rule that runs past rule_budget seconds
+    on a file fails just that file (Summary.timeouts); None turns the budget off.
+    Summary.sites is set when the PropertyDetail page was processed.
+    """
+    codemods = CODEMODS if codemods is None else codemods
+    summary = Summary()
+    manifest = Manifest.load(root) if use_cache else None
+
+    tasks = []
+    for path, names in plan(discover(root, target_globs(codemods)), codemods, root):
+        chain = ','.join(names)
+        version = chain_version(names)
+        cached = manifest.lookup(path, chain, version) if manifest else None
+        if cached is not None:
+            summary.files += 1
+            summary.skipped.append(path)
+            continue
+        tasks.append((path, names, chain, version))
+
+    def collect(result: FileResult, chain: str, version: str) -> None:
+        summary.add(result)
+        if on_result is not None:
+            on_result(result)
+        if journal is not None and result.journal is not None:
+            journal.append(result.journal)
+        if manifest is not None and result.error is None and not dry_run:
+            manifest.record(result.path, chain, version, result.counts, result.fingerprint)
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(tasks) <= 1:
+        for path, names, chain, version in tasks:
+            collect(run_file(path, names, dry_run, profile, rule_budget, root), chain, version)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            paths, names, chains, versions = zip(*tasks)
+            results = pool.map(run_file, paths, names, [dry_run] * len(tasks), [profile] * len(tasks),
+                               [rule_budget] * len(tasks), [root] * len(tasks))
+            for result, chain, version in zip(results, chains, versions):
+                collect(result, chain, version)
+
+    if manifest is not None:
+        manifest.save()
+    return summary
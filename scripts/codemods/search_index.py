@@ -0,0 +1,160 @@
+"""
+Static field search index for the property detail page.
+
+Once fix_property_detail.py has keyed them, the renderDataField sites in
+src/pages/PropertyDetail.tsx carry every field's label, Property path and
+API key:
+
+    renderDataField("Listing Price", fullProperty.address.listingPrice, "currency", undefined, "10_listing_price")
+
+extract_sites() collects those triples from the text the codemod already
+has in memory, and sync() writes them with a prefix and trigram table to
+public/field-search-index.json, so the page can jump to or filter fields
+without walking its component tree. Only that page feeds the index
+(indexes()); the runner and watch mode refresh() it whenever they rewrite
+the page:
+
+    {"format": 1, "prefixLength": 4,
+     "fields": [["Listing Price", "address.listingPrice", "10_listing_price"], ...],
+     "prefixes": {"l": [3, 9], "li": [3, 9], "lis": [3], "list": [3], ...},
+     "trigrams": {"ist": [3], "pri": [3, 12], ...}}
+
+Each field is indexed by the words of its label, path and key (camelCase
+split, field number included). A query matches the fields that match all
+of its words: a word of up to ``prefixLength`` characters must start one
+of the field's words (a ``prefixes`` lookup); a longer one must occur in
+one of them (the ``trigrams`` lists intersected, then checked). search()
+is the reference implementation of this.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, TextIO
+
+from .cache import file_hash
+from .consistency import DETAIL_SITE
+from .paths import REPO_ROOT
+from .writer import write_if_changed
+
+PAGE = 'src/pages/PropertyDetail.tsx'
+OUTPUT = 'public/field-search-index.json'
+FORMAT = 1
+PREFIX_LEN = 4
+
+WORD = re.compile(r'[a-z0-9]+')
+CAMEL = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+
+
+@dataclass(frozen=True)
+class FieldSite:
+    label: str
+    path: str
+    key: str
+
+    @property
+    def words(self) -> List[str]:
+        return list(dict.fromkeys(words(f'{self.label} {self.path} {self.key}')))
+
+
+def words(text: str) -> List[str]:
+    """Lower-case search words of text, with camelCase split."""
+    return WORD.findall(CAMEL.sub(' ', text).lower())
+
+
+def extract_sites(text: str) -> List[FieldSite]:
+    """Keyed renderDataField sites in page order, one per API key."""
+    sites: Dict[str, FieldSite] = {}
+    for m in DETAIL_SITE.finditer(text):
+        key = m.group(3)
+        if key not in sites:
+            sites[key] = FieldSite(m.group(1).replace('\\"', '"'), m.group(2).replace('?', '')[1:], key)
+    return list(sites.values())
+
+
+def _trigrams(word: str) -> List[str]:
+    return [word[i:i + 3] for i in range(len(word) - 2)]
+
+
+def build(sites: Sequence[FieldSite]) -> dict:
+    prefixes: Dict[str, Set[int]] = defaultdict(set)
+    trigrams: Dict[str, Set[int]] = defaultdict(set)
+    for i, site in enumerate(sites):
+        for word in site.words:
+            for n in range(1, min(len(word), PREFIX_LEN) + 1):
+                prefixes[word[:n]].add(i)
+            for gram in _trigrams(word):
+                trigrams[gram].add(i)
+    return {
+        'format': FORMAT,
+        'prefixLength': PREFIX_LEN,
+        'fields': [[s.label, s.path, s.key] for s in sites],
+        'prefixes': {k: sorted(v) for k, v in sorted(prefixes.items())},
+        'trigrams': {k: sorted(v) for k, v in sorted(trigrams.items())},
+    }
+
+
+def render(sites: Sequence[FieldSite]) -> str:
+    return json.dumps(build(sites), ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def search(index: dict, query: str) -> List[int]:
+    """Indexes into ``index['fields']`` of the fields matching every word of query."""
+    fields = index['fields']
+    matched: Optional[Set[int]] = None
+    for word in words(query):
+        if len(word) <= index['prefixLength']:
+            found = set(index['prefixes'].get(word, ()))
+        else:
+            grams = [set(index['trigrams'].get(g, ())) for g in _trigrams(word)]
+            candidates = set.intersection(*grams)
+            found = {i for i in candidates
+                     if any(word in w for w in FieldSite(*fields[i]).words)}
+        matched = found if matched is None else matched & found
+        if not matched:
+            return []
+    return sorted(matched) if matched is not None else []
+
+
+def indexes(path, root=REPO_ROOT) -> bool:
+    """True if path is the page the index is built from."""
+    return Path(path).resolve() == (Path(root) / PAGE).resolve()
+
+
+def digest(root=REPO_ROOT) -> Optional[str]:
+    """Hash of the index on disk, or None if it has not been built."""
+    try:
+        return file_hash(Path(root) / OUTPUT)
+    except FileNotFoundError:
+        return None
+
+
+def sync(sites: Sequence[FieldSite], root=REPO_ROOT, dry_run: bool = False,
+         out: Optional[TextIO] = None, journal=None) -> bool:
+    """Write the index for sites if it changed; returns whether it did (or would)."""
+    path = Path(root) / OUTPUT
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            current = f.read()
+    except FileNotFoundError:
+        current = ''
+    return write_if_changed(path, current, render(sites), dry_run, out, journal)
+
+
+def refresh(root=REPO_ROOT, sites: Optional[Sequence[FieldSite]] = None, dry_run: bool = False,
+            out: Optional[TextIO] = None, journal=None) -> bool:
+    """
+    sync() the index with the page: from sites if the caller extracted them
+    from the page's new text, else from the page on disk.
+    """
+    if sites is None:
+        try:
+            with open(Path(root) / PAGE, 'r', encoding='utf-8') as f:
+                sites = extract_sites(f.read())
+        except FileNotFoundError:
+            return False
+    return sync(sites, root, dry_run, out, journal)
@@ -0,0 +1,122 @@
+"""
+Multi-snippet literal patcher.
+
+Replaces many old -> new code snippets in one scan of the file. Each
+snippet's old text becomes a whitespace-tolerant literal pattern (every run
+of whitespace matches any run, so re-indented or re-wrapped code still
+matches) and all of them are compiled into a single RewriteEngine
+alternation, so patching dozens of handlers costs one pass over the file
+rather than a search plus a replace per snippet.
+
+Each snippet's new text (or a shorter ``applied`` marker, when later
+codemods keep editing the patched block) is also looked for, so a file that
+was already patched reports the snippet as applied instead of missing. New
+text is inserted verbatim.
+
+Snippets can be declared in Python or loaded from a JSON file:
+
+    {
+      "target": "src/pages/PropertyDetail.tsx",
+      "snippets": [
+        {"name": "retry-todo", "old": ["line 1", "line 2"], "new": "...",
+         "applied": "...", "optional": false}
+      ]
+    }
+
+"old", "new" and "applied" are a string or a list of lines.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .engine import Rule, RewriteEngine
+from .instrument import Profile
+
+APPLIED = '@applied'
+
+
+@dataclass(frozen=True)
+class Snippet:
+    name: str
+    old: str
+    new: str
+    optional: bool = False
+    applied: Optional[str] = None   # marker of an earlier patch (default: new)
+
+
+@dataclass
+class PatchResult:
+    text: str
+    patched: Dict[str, int] = field(default_factory=dict)   # name -> replacements
+    already: List[str] = field(default_factory=list)        # applied marker already present
+    missing: List[str] = field(default_factory=list)        # required, anchor not found
+    skipped: List[str] = field(default_factory=list)        # optional, anchor not found
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return dict(self.patched)
+
+
+def tolerant_pattern(text: str) -> str:
+    """Regex for text as a literal in which any whitespace run matches any other."""
+    tokens = text.split()
+    if not tokens:
+        raise ValueError('snippet text is empty')
+    return r'\s+'.join(re.escape(token) for token in tokens)
+
+
+class SnippetPatcher:
+    def __init__(self, snippets: Iterable[Snippet]):
+        self.snippets: List[Snippet] = list(snippets)
+        names = [s.name for s in self.snippets]
+        if len(set(names)) != len(names):
+            raise ValueError('snippet names must be unique')
+        rules = []
+        for snippet in self.snippets:
+            # Already-patched text first, so new text that contains the old
+            # anchor is left alone instead of being patched twice
+            rules.append(Rule(snippet.name + APPLIED, tolerant_pattern(snippet.applied or snippet.new),
+                              lambda m: m.group(0)))
+            rules.append(Rule(snippet.name, tolerant_pattern(snippet.old),
+                              lambda m, new=snippet.new: new))
+        self.engine = RewriteEngine(rules)
+
+    def patch(self, text: str, profile: Optional[Profile] = None) -> PatchResult:
+        rewritten = self.engine.rewrite(text, profile)
+        result = PatchResult(rewritten.text)
+        for snippet in self.snippets:
+            hits = rewritten.counts[snippet.name]
+            result.patched[snippet.name] = hits
+            if hits:
+                continue
+            if rewritten.counts[snippet.name + APPLIED]:
+                result.already.append(snippet.name)
+            elif snippet.optional:
+                result.skipped.append(snippet.name)
+            else:
+                result.missing.append(snippet.name)
+        return result
+
+
+def _text(value: Union[str, List[str]]) -> str:
+    return '\n'.join(value) if isinstance(value, list) else value
+
+
+def load_snippets(path) -> Tuple[Optional[str], List[Snippet]]:
+    """(target path or None, snippets) from a JSON snippet file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    snippets = [
+        Snippet(entry['name'], _text(entry['old']), _text(entry['new']),
+                entry.get('optional', False), _text(entry['applied']) if 'applied' in entry else None)
+        for entry in data['snippets']
+    ]
+    return data.get('target'), snippets
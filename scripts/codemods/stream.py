@@ -0,0 +1,165 @@
+"""
+Memory-mapped streaming rewrites for very large inputs.
+
+``RewriteEngine.rewrite`` needs the whole file as one ``str`` and builds a
+new full copy, so peak memory is a few times the file size. For large
+generated artifacts (bulk property exports, build output) stream_rewrite()
+instead memory-maps the file, runs the engine's combined pattern over the
+bytes buffer and writes the output segment by segment to a temp file beside
+it (codemods.writer.AtomicOutput):
+
+    result = stream_rewrite(ENGINE, 'dist/properties.json')
+    result.changed, result.counts
+
+Unchanged stretches are copied from the map in CHUNK-sized slices and only
+matched spans are decoded, so memory stays bounded by the largest match,
+not the file. Each rule sees its span decoded on its own (see
+``RewriteEngine.replace``); a span that is not valid UTF-8 is left alone.
+
+As with write_if_changed, nothing is written when no span changes, and a
+dry run only counts. A journal entry records each changed span with its
+character offset, so codemod_journal.py can revert the run; its size is
+proportional to the changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .engine import RewriteEngine
+from .instrument import Profile
+from .journal import Edit, Entry
+from .writer import AtomicOutput
+
+CHUNK = 1 << 20
+
+# UTF-8 continuation bytes: every other byte starts a character
+_CONTINUATION = bytes(range(0x80, 0xC0))
+
+
+@dataclass
+class StreamResult:
+    changed: bool = False
+    counts: Dict[str, int] = field(default_factory=dict)
+    replacements: Dict[str, int] = field(default_factory=dict)
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+class _Output:
+    """Destination file (None for a dry run) plus what the journal needs."""
+
+    def __init__(self, file, track: bool):
+        self.file = file
+        self.track = track
+        self.digest = hashlib.sha256()
+        self.chars = 0      # characters of the input consumed so far
+        self.written = 0
+
+    def copy(self, view: memoryview, start: int, end: int) -> None:
+        for pos in range(start, end, CHUNK):
+            chunk = view[pos:min(pos + CHUNK, end)]
+            self.emit(chunk)
+            if self.track:
+                self.chars += len(bytes(chunk).translate(None, _CONTINUATION))
+
+    def emit(self, data) -> None:
+        if self.file is not None:
+            self.file.write(data)
+        if self.track:
+            self.digest.update(data)
+        self.written += len(data)
+
+
+def _scan(engine: RewriteEngine, buffer, view: memoryview, out: _Output,
+          result: StreamResult, edits: Optional[List[Edit]]) -> None:
+    counts: Counter = Counter({rule.name: 0 for rule in engine.rules})
+    replaced: Counter = Counter({rule.name: 0 for rule in engine.rules})
+    pos = 0
+    for match in engine.byte_pattern.finditer(buffer):
+        raw = match.group(0)
+        try:
+            span = raw.decode('utf-8')
+        except UnicodeDecodeError:
+            continue
+        index = engine.rule_index(match)
+        new = engine.replace(index, span)
+        if new is None:
+            continue
+        name = engine.rules[index].name
+        counts[name] += 1
+        if new == span:
+            continue
+        replaced[name] += 1
+        out.copy(view, pos, match.start())
+        if edits is not None:
+            edits.append([out.chars, span, new])
+            out.chars += len(span)
+        out.emit(new.encode('utf-8'))
+        pos = match.end()
+    out.copy(view, pos, len(view))
+    result.counts = dict(counts)
+    result.replacements = dict(replaced)
+    result.changed = sum(replaced.values()) > 0
+
+
+def stream_rewrite(engine: RewriteEngine, path, dry_run: bool = False, journal=None,
+                   profile: Optional[Profile] = None) -> StreamResult:
+    """
+    Apply engine's rules to the file at path in bounded memory, replacing
+    it atomically if any span changed. A real write is recorded in
+    ``journal`` (a codemods.journal.Journal).
+    """
+    result = StreamResult(bytes_in=os.path.getsize(path))
+    if not result.bytes_in:  # an empty file cannot be mapped, and has nothing to rewrite
+        return result
+
+    track = journal is not None and not dry_run
+    edits: Optional[List[Edit]] = [] if track else None
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        with AtomicOutput(path, binary=True) if not dry_run else _NoOutput() as target, \
+                memoryview(buffer) as view:
+            out = _Output(target.file, track)
+            if profile is None:
+                _scan(engine, buffer, view, out, result, edits)
+            else:
+                # Timed by hand: a whole-artifact stream is not held to the per-rule budget
+                start = time.perf_counter()
+                _scan(engine, buffer, view, out, result, edits)
+                stats = profile['(stream)']
+                stats.seconds += time.perf_counter() - start
+                stats.bytes_scanned += result.bytes_in
+                stats.matches += result.total
+                for name, count in result.counts.items():
+                    profile[name].matches += count
+                    profile[name].replacements += result.replacements[name]
+            result.bytes_out = out.written
+            pre = hashlib.sha256(buffer).hexdigest() if track and result.changed else None
+            if result.changed and not dry_run:
+                target.commit()
+
+    if pre is not None:
+        journal.append(Entry(str(Path(path).resolve()), pre, out.digest.hexdigest(), edits))
+    return result
+
+
+class _NoOutput:
+    """Stand-in for AtomicOutput on a dry run: counts only, writes nothing."""
+    file = None
+
+    def __enter__(self) -> '_NoOutput':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
@@ -0,0 +1,337 @@
+"""
+Watch mode: re-run the codemods on a file as soon as it is saved.
+
+One long-running process keeps every codemod module (and with it the
+compiled rules and the field index) loaded, so a save costs one
+``run_file`` call instead of a cold interpreter per script. File events
+come from inotify on Linux (through ctypes, no extra dependency) and from
+a stat-polling loop everywhere else.
+
+The watched directories are the literal prefixes of the codemods' globs
+(watch_dirs). The codemods' own writes also raise events; they are skipped
+by the same manifest check the runner uses, so a save settles after one
+pass. When a codemod script, a module of the codemods package or the schema
+sources change, the loaded scripts are dropped, the package's modules are
+reloaded (dependencies first), the declared migrations are re-read from
+the registry (a new rule module joins, and its directories are watched),
+the field index is rebuilt on the next event, and the generated field-path
+table is refreshed. A save of
+src/pages/PropertyDetail.tsx also refreshes the field search index.
+"""
+
+from __future__ import annotations
+
+import ast
+import ctypes
+import ctypes.util
+import importlib.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from . import cache, field_index, field_paths, registry, runner, search_index
+from .cache import Manifest, SHARED_SOURCES
+from .journal import Journal
+from .paths import REPO_ROOT, SCRIPTS_DIR
+
+# Quiet period after the first event, so an editor's burst of writes
+# (truncate, write, rename) is handled as one save
+SETTLE = 0.05
+
+
+def _wanted(path: Path) -> bool:
+    # Skip editor swap and backup files and codemods.writer's '.name.tmp'
+    # files; runner.plan() matches the rest against the codemods' globs
+    return not path.name.startswith('.') and not path.name.endswith('~')
+
+
+def watch_dirs(codemods: Sequence[runner.Codemod]) -> Tuple[str, ...]:
+    """Directories (relative to the root) holding every file the codemods' globs can match."""
+    dirs = set()
+    for pattern in runner.target_globs(codemods):
+        literal = []
+        for part in Path('src', pattern).parts[:-1]:
+            if any(ch in part for ch in '*?['):
+                break
+            literal.append(part)
+        dirs.add(Path(*literal))
+    # Each directory is watched with its subtree
+    return tuple(sorted(d.as_posix() for d in dirs if not any(p in dirs for p in d.parents)))
+
+
+class PollingWatcher:
+    """Portable fallback: compare (mtime, size) of every file under dirs on each tick."""
+    name = 'polling'
+
+    def __init__(self, dirs: Iterable[Path], interval: float = 0.25):
+        self.dirs = [Path(d) for d in dirs]
+        self.interval = interval
+        self._seen = self._snapshot()
+
+    def add(self, dirs: Iterable[Path]) -> None:
+        self.dirs.extend(Path(d) for d in dirs)
+        self._seen = self._snapshot()
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        seen = {}
+        for directory in self.dirs:
+            for path in directory.rglob('*'):
+                if not _wanted(path) or not path.is_file():
+                    continue
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                seen[path] = (st.st_mtime_ns, st.st_size)
+        return seen
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+        current = self._snapshot()
+        changed = {p for p, stamp in current.items() if self._seen.get(p) != stamp}
+        self._seen = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify on every directory under dirs (new subdirectories included)."""
+    name = 'inotify'
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    EVENT = struct.Struct('iIII')
+
+    def __init__(self, dirs: Iterable[Path]):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        self._add = libc.inotify_add_watch      # AttributeError off Linux
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._dirs: Dict[int, Path] = {}
+        self.add(dirs)
+
+    def add(self, dirs: Iterable[Path]) -> None:
+        for directory in dirs:
+            self._watch_tree(Path(directory))
+
+    def _watch_tree(self, top: Path) -> None:
+        for directory, _, _ in os.walk(top):
+            wd = self._add(self._fd, os.fsencode(directory), self.MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+            self._dirs[wd] = Path(directory)
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        try:
+            data = os.read(self._fd, 1 << 16)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / name
+            if mask & self.IN_ISDIR:
+                if mask & self.IN_CREATE:
+                    self._watch_tree(path)
+            elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO) and _wanted(path):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def make_watcher(dirs: Iterable[Path], poll: bool = False, interval: float = 0.25):
+    """inotify where available, else (or when poll is set) the polling watcher."""
+    dirs = [Path(d) for d in dirs if Path(d).is_dir()]
+    if not poll:
+        try:
+            return InotifyWatcher(dirs)
+        except (AttributeError, OSError):
+            pass
+    return PollingWatcher(dirs, interval)
+
+
+def _rule_sources(codemods: Sequence[runner.Codemod]) -> List[Path]:
+    package = sorted((SCRIPTS_DIR / 'codemods').rglob('*.py'))
+    sources = [SCRIPTS_DIR / source for source in (*(s for c in codemods for s in c.sources), *SHARED_SOURCES)]
+    return list(dict.fromkeys([*sources, *package]))
+
+
+def _stamps(paths: Iterable[Path]) -> Tuple[Tuple[int, int], ...]:
+    stamps = []
+    for path in paths:
+        try:
+            st = path.stat()
+            stamps.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamps.append((0, 0))
+    return tuple(stamps)
+
+
+def _imports(module) -> Set[str]:
+    """Absolute names of the modules module imports (and may import from)."""
+    try:
+        with open(module.__file__, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, TypeError):
+        return set()
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = importlib.util.resolve_name('.' * node.level + (node.module or ''), module.__package__)
+            found.add(base)
+            found.update(f'{base}.{alias.name}' for alias in node.names)
+    return found
+
+
+def _dependency_order(modules: Dict[str, object]) -> List[str]:
+    """Module names with every module after the modules it imports."""
+    ordered: List[str] = []
+    seen: Set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in seen:
+            return
+        seen.add(name)
+        for dep in sorted(_imports(modules[name]) & modules.keys()):
+            visit(dep)
+        ordered.append(name)
+
+    for name in sorted(modules):
+        visit(name)
+    return ordered
+
+
+def reload_package() -> None:
+    """
+    Re-execute every loaded module of the codemods package, dependencies
+    first, so each picks up its dependencies' new definitions. The rule
+    modules are dropped instead (registry.reload() imports them afresh), and
+    this module keeps running the code it started with.
+    """
+    package = __package__
+    rules = f'{package}.rules'
+    for name in [m for m in sys.modules if m == rules or m.startswith(f'{rules}.')]:
+        del sys.modules[name]
+    loaded = {name: module for name, module in sys.modules.items()
+              if (name == package or name.startswith(f'{package}.')) and name != __name__}
+    for name in _dependency_order(loaded):
+        importlib.reload(loaded[name])
+
+
+def reload_rules() -> None:
+    """
+    Reload the codemods package, forget loaded scripts, declared rules,
+    source hashes and the field index, and rebuild runner.CODEMODS.
+    """
+    reload_package()
+    runner._loaded.clear()
+    registry.reload()
+    runner.refresh()
+    cache._source_hash.cache_clear()
+    field_index.load_field_index.cache_clear()
+
+
+def warm(codemods: Sequence[runner.Codemod], root: Path = REPO_ROOT) -> None:
+    """Load the field index and every codemod module up front."""
+    field_index.load_field_index(root)
+    for codemod in codemods:
+        runner.load_transform(codemod)
+
+
+def _select(names: Optional[Sequence[str]]) -> List[runner.Codemod]:
+    """The registered codemods named (all of them for None), in registry order."""
+    return [c for c in runner.CODEMODS if names is None or c.name in names]
+
+
+def watch(codemods: Optional[Sequence[runner.Codemod]] = None, root: Path = REPO_ROOT,
+          poll: bool = False, interval: float = 0.25, watcher=None,
+          on_result: Optional[Callable[[runner.FileResult, float], None]] = None,
+          on_reload: Optional[Callable[[], None]] = None,
+          should_stop: Callable[[], bool] = lambda: False) -> None:
+    """
+    Watch the codemods' directories under root (or use the given watcher)
+    until should_stop() is true or Ctrl-C. codemods defaults to every
+    registered codemod, including ones a rules module adds while watching.
+    on_result gets each processed file's result and its latency in seconds.
+    """
+    root = Path(root)
+    names = None if codemods is None else [c.name for c in codemods]
+    codemods = _select(names)
+    dirs = set(watch_dirs(codemods))
+    sources = _rule_sources(codemods)
+    stamps = _stamps(sources)
+    warm(codemods, root)
+    manifest = Manifest.load(root)
+    journal = Journal.start('watch', root)
+    if watcher is None:
+        watcher = make_watcher((root / d for d in sorted(dirs)), poll, interval)
+    try:
+        while not should_stop():
+            changed = watcher.wait(timeout=0.5)
+            if not changed:
+                continue
+            time.sleep(SETTLE)
+            changed |= watcher.wait(timeout=0)
+
+            current = _stamps(sources)
+            if current != stamps:
+                reload_rules()
+                codemods = _select(names)
+                sources = _rule_sources(codemods)
+                stamps = _stamps(sources)
+                added = [d for d in watch_dirs(codemods) if d not in dirs]
+                if added:
+                    dirs.update(added)
+                    watcher.add(root / d for d in added if (root / d).is_dir())
+                warm(codemods, root)
+                field_paths.sync(root, journal=journal)
+                if on_reload is not None:
+                    on_reload()
+
+            for path, names in runner.plan(sorted(p for p in changed if p.exists()), codemods, root):
+                start = time.perf_counter()
+                chain = ','.join(names)
+                version = runner.chain_version(names)
+                if manifest.lookup(path, chain, version) is not None:
+                    continue
+                result = runner.run_file(path, names, root=root)
+                if result.journal is not None:
+                    journal.append(result.journal)
+                if result.sites is not None:
+                    search_index.sync(result.sites, root, journal=journal)
+                if result.error is None:
+                    manifest.record(path, chain, version, result.counts, result.fingerprint)
+                    manifest.save()
+                if on_result is not None:
+                    on_result(result, time.perf_counter() - start)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        manifest.save()
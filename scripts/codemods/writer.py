@@ -0,0 +1,101 @@
+"""
+Change-only, atomic file writes and dry-run diffs.
+
+Rewriting a file with identical content still bumps its mtime, which sets
+off a Vite HMR/rebuild cascade. Every codemod writes through
+write_if_changed(): nothing happens when the text is unchanged, otherwise
+the new text goes to a temp file in the same directory and is moved into
+place with os.replace, so readers never see a half-written file. With
+dry_run the unified diff is streamed to ``out`` instead. Real writes can be
+recorded in a codemods.journal run so they can be reverted later.
+AtomicOutput is the same temp-file-and-replace for writers that stream
+their output (codemods.stream).
+"""
+
+from __future__ import annotations
+
+import difflib
+import os
+import shutil
+import sys
+import tempfile
+from typing import Iterator, Optional, TextIO
+
+
+class AtomicOutput:
+    """
+    A temp file beside ``path``, opened for writing. ``commit()`` moves it
+    into place; leaving the block without committing (or on an error)
+    deletes it, so path is never half-written or touched for nothing.
+    """
+
+    def __init__(self, path, binary: bool = False, encoding: str = 'utf-8', newline: Optional[str] = None):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, self.tmp = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+        self.file = os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding=encoding, newline=newline)
+        self.committed = False
+
+    def __enter__(self) -> 'AtomicOutput':
+        return self
+
+    def commit(self) -> None:
+        self.file.close()
+        if os.path.exists(self.path):
+            shutil.copymode(self.path, self.tmp)
+        os.replace(self.tmp, self.path)
+        self.committed = True
+
+    def __exit__(self, *exc) -> None:
+        if self.committed:
+            return
+        self.file.close()
+        try:
+            os.unlink(self.tmp)
+        except OSError:
+            pass
+
+
+def atomic_write(path, text: str, encoding: str = 'utf-8', newline: Optional[str] = None) -> None:
+    with AtomicOutput(path, encoding=encoding, newline=newline) as out:
+        out.file.write(text)
+        out.commit()
+
+
+def _diff_name(path) -> str:
+    # a/ and b/ labels relative to the working directory where possible, like git
+    name = os.path.relpath(path) if os.path.isabs(path) else str(path)
+    if name.startswith('..'):
+        name = os.path.abspath(path).lstrip(os.sep)
+    return name.replace(os.sep, '/')
+
+
+def unified_diff(path, old: str, new: str) -> Iterator[str]:
+    name = _diff_name(path)
+    return difflib.unified_diff(old.splitlines(True), new.splitlines(True),
+                                f'a/{name}', f'b/{name}')
+
+
+def stream_diff(path, old: str, new: str, out: Optional[TextIO] = None) -> None:
+    out = out or sys.stdout
+    for line in unified_diff(path, old, new):
+        out.write(line if line.endswith('\n') else line + '\n\\ No newline at end of file\n')
+
+
+def write_if_changed(path, old: str, new: str, dry_run: bool = False,
+                     out: Optional[TextIO] = None, journal=None) -> bool:
+    """
+    Write new over path if it differs from old; returns whether it differed.
+    A real write is recorded in ``journal`` (a codemods.journal.Journal).
+    """
+    if new == old:
+        return False
+    if dry_run:
+        stream_diff(path, old, new, out)
+    else:
+        created = not os.path.exists(path)
+        atomic_write(path, new)
+        if journal is not None:
+            journal.record(path, old, new, created)
+    return True
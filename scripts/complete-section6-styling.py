@@ -2,16 +2,27 @@
 """
 Complete Section 6 Chart Styling Unification
 Fixes all 10 charts to match Section 5 patterns
+
+Every chart component in the *Charts.tsx files is also memoized: its
+derived data (scores, maxScore, winnerIndices) moves into useMemo keyed on
+homes and the component becomes a React.memo (see codemods/memoize.py).
 """
 
 import re
+import sys
+from functools import partial
 
-file_path = r'D:\Clues_Quantum_Property_Dashboard\src\components\visuals\recharts\Section6InteriorFeaturesCharts.tsx'
-
-print('🔧 Starting complete Section 6 styling unification...\n')
+from codemods.cache import ScriptCache
+from codemods.cli import expand_targets, parse_script_args
+from codemods.instrument import Profile, write_report
+from codemods.journal import Journal
+from codemods.memoize import splice, memo_edits
+from codemods.tsx import TsxIndex
+from codemods.writer import write_if_changed
 
-with open(file_path, 'r', encoding='utf8') as f:
-    content = f.read()
+file_path = 'src/components/visuals/recharts/Section6InteriorFeaturesCharts.tsx'
+charts_dir = 'src/components/visuals/recharts'
+charts_glob = '*Charts.tsx'
 
 # Define chart numbers and names for systematic replacement
 charts = [
@@ -27,24 +38,40 @@ charts = [
     ('6-10', 'Interior Features Smart Rank', 'Top interior features overall'),
 ]
 
-def fix_chart_structure(chart_num, chart_name, reason):
-    """Fix a single chart's structure"""
-    chart_id = chart_num.replace('-', '_')
-
-    # Pattern to find the return statement
-    pattern = rf'(function Chart{chart_id}_[A-Za-z]+.*?\n.*?return \(\n)(.*?)(^\s+\);$)'
-
-    def replace_return(match):
-        func_line = match.group(1)
-        body = match.group(2)
-        closing = match.group(3)
-
-        # Check if already has motion.div
-        if '<motion.div' in body:
-            return match.group(0)  # Already fixed
 
-        # Add motion.div wrapper
-        new_body = f'''    <motion.div
+description_map = {
+    '6-1': 'CLUES favors premium flooring (e.g., hardwood) with higher scores, while basic flooring (e.g., carpet) scores lower.',
+    '6-2': 'Homes offering more appliances (washer, dryer, etc.) score higher on this metric.',
+    '6-3': 'Homes with a fireplace (especially multiple fireplaces) score higher, while homes with none score lowest.',
+    '6-4': 'Kitchens with luxury finishes, modern appliances, and open layouts achieve higher scores.',
+    '6-5': 'Combined interior score reflecting all features (flooring, kitchen, appliances, fireplace).',
+    '6-6': 'More included appliances often coincide with a higher interior score, as shown by the upward trend.',
+    '6-7': 'The top home\'s interior score is built from flooring, kitchen, and appliance points (waterfall breakdown).',
+    '6-8': 'Bar color indicates fireplace count (gray for 0, orange for 1, red for 2+).',
+    '6-9': 'Larger pie slices mean more properties share that appliance combination.',
+    '6-10': 'Final ranking of properties by interior quality, from best (1st) to worst (3rd).',
+}
+
+# Chart functions are located with one linear scan (codemods.tsx); these
+# patterns only ever run over a single chart's return block.
+chart_function = r'Chart\d+_\d+_[A-Za-z]+'
+chart_number = re.compile(r'Chart(\d+)_(\d+)_')
+closing_line = re.compile(r'\s+\);')
+brain_widget_pattern = re.compile(r'\s*{\/\* BRAIN WIDGET[^\n]*\n.*?<div className="absolute top-4.*?<\/div>\n', re.DOTALL)
+title_pattern = re.compile(r'\s*{\/\* TITLE.*?\n')
+winner_pattern = re.compile(r'<div className="mt-4 flex justify-center">.*?<\/div>\s+<\/div>\s+<\/div>', re.DOTALL)
+legend_pattern = re.compile(r'<div className="mt-4 p-3 bg-white\/5.*?<\/div>\s+<\/div>', re.DOTALL)
+
+
+def fix_chart_structure(body, chart_num, reason, profile=None):
+    """Restyle one chart's return block; returns None if it is already fixed"""
+    profile = Profile() if profile is None else profile
+    # Check if already has motion.div
+    if '<motion.div' in body:
+        return None  # Already fixed
+
+    # Add motion.div wrapper
+    new_body = f'''    <motion.div
       initial={{ opacity: 0, y: 20 }}
       animate={{ opacity: 1, y: 0 }}
       transition={{ delay: 0.{chart_num.split('-')[1]} }}
@@ -66,58 +93,109 @@ def fix_chart_structure(chart_num, chart_name, reason):
 
 '''
 
-        # Remove old Brain Widget div and title section
-        body = re.sub(r'\s*{\/\* BRAIN WIDGET.*?\n.*?<div className="absolute top-4.*?<\/div>\n', '', body, flags=re.DOTALL)
-        body = re.sub(r'\s*{\/\* TITLE.*?\n', '', body)
+    # Remove old Brain Widget div and title section
+    body = profile.sub('brain_widget', brain_widget_pattern, lambda m: '', body)
+    body = profile.sub('title', title_pattern, lambda m: '', body)
 
-        new_body += body.lstrip()
+    new_body += body.lstrip()
 
-        # Replace inline winner badge
-        winner_pattern = r'<div className="mt-4 flex justify-center">.*?<\/div>\s+<\/div>\s+<\/div>'
-        new_body = re.sub(winner_pattern,
-                         f'''<WinnerBadge
+    # Replace inline winner badge
+    new_body = profile.sub('winner_badge', winner_pattern, lambda m: f'''<WinnerBadge
         winnerName={{winnerIndices.map(i => homes[i].name.split(',')[0]).join(' & ')}}
         score={{maxScore}}
         reason="{reason}"
-      />''',
-                         new_body, flags=re.DOTALL)
-
-        # Replace inline legend
-        legend_pattern = r'<div className="mt-4 p-3 bg-white\/5.*?<\/div>\s+<\/div>'
-        description_map = {
-            '6-1': 'CLUES favors premium flooring (e.g., hardwood) with higher scores, while basic flooring (e.g., carpet) scores lower.',
-            '6-2': 'Homes offering more appliances (washer, dryer, etc.) score higher on this metric.',
-            '6-3': 'Homes with a fireplace (especially multiple fireplaces) score higher, while homes with none score lowest.',
-            '6-4': 'Kitchens with luxury finishes, modern appliances, and open layouts achieve higher scores.',
-            '6-5': 'Combined interior score reflecting all features (flooring, kitchen, appliances, fireplace).',
-            '6-6': 'More included appliances often coincide with a higher interior score, as shown by the upward trend.',
-            '6-7': 'The top home\'s interior score is built from flooring, kitchen, and appliance points (waterfall breakdown).',
-            '6-8': 'Bar color indicates fireplace count (gray for 0, orange for 1, red for 2+).',
-            '6-9': 'Larger pie slices mean more properties share that appliance combination.',
-            '6-10': 'Final ranking of properties by interior quality, from best (1st) to worst (3rd).',
-        }
-        desc = description_map.get(chart_num, 'Interior features comparison')
-        new_body = re.sub(legend_pattern,
-                         f'<SmartScaleLegend description="{desc}" />',
-                         new_body, flags=re.DOTALL)
-
-        # Close motion.div
-        new_body += '\n    </motion.div>'
-
-        return func_line + new_body + '\n' + closing
-
-    return re.sub(pattern, replace_return, content, flags=re.MULTILINE | re.DOTALL)
-
-# Apply fixes to all charts
-for chart_num, chart_name, reason in charts:
-    print(f'✅ Fixing Chart {chart_num}: {chart_name}')
-    content = fix_chart_structure(chart_num, chart_name, reason)
-
-print('\n✅ All chart structures updated!')
-print('📝 Writing updated file...\n')
-
-with open(file_path, 'w', encoding='utf8') as f:
-    f.write(content)
-
-print('✅ Section 6 styling unification complete!')
-print('🔍 Next: Test the build with npm run dev\n')
+      />''', new_body)
+
+    # Replace inline legend
+    desc = description_map.get(chart_num, 'Interior features comparison')
+    new_body = profile.sub('legend', legend_pattern, lambda m: f'<SmartScaleLegend description="{desc}" />', new_body)
+
+    # Close motion.div
+    new_body += '\n    </motion.div>'
+    return new_body
+
+
+def transform(content, profile=None):
+    """Apply the styling fix to every chart; returns (new_content, counts)."""
+    profile = Profile() if profile is None else profile
+    with profile.timed('tsx_index', content) as stats:
+        index = TsxIndex(content)
+        spans = {}
+        for span in index.functions(chart_function):
+            m = chart_number.match(span.name)
+            spans.setdefault(f'{m.group(1)}-{m.group(2)}', span)
+            stats.matches += 1
+
+    # (splice start, splice end, replacement), applied in file order
+    edits = []
+    counts = {}
+    for chart_num, chart_name, reason in charts:
+        counts[chart_num] = 0
+        span = spans.get(chart_num)
+        if span is None or span.return_open is None:
+            continue
+        # `return (` must end its line and `);` must sit on a line of its own
+        head_end = index.line_end(span.return_open) + 1
+        if content[span.return_open + 1:head_end].strip():
+            continue
+        close_start = index.line_start(span.return_close)
+        if not closing_line.fullmatch(content[close_start:index.line_end(span.return_close)]):
+            continue
+
+        new_body = fix_chart_structure(content[head_end:close_start], chart_num, reason, profile)
+        if new_body is None:
+            continue
+        edits.append((head_end, close_start, new_body + '\n'))
+        counts[chart_num] = 1
+
+    # Memoization edits come from the same index; they touch component
+    # headers and the statements before each return, never a return block
+    with profile.timed('memoize', content) as stats:
+        memo, memo_counts = memo_edits(content, index, stats)
+    counts.update(memo_counts)
+    return splice(content, edits + memo, memo_counts), counts
+
+
+def main(path=charts_dir, dry_run=False, profile_path=None):
+    # With --dry-run stdout carries only the diff
+    say = partial(print, file=sys.stderr if dry_run else sys.stdout)
+    cache = ScriptCache('section6_styling', __file__)
+    journal = None if dry_run else Journal.start('section6_styling')
+    profile = Profile()
+    files = expand_targets(path, charts_glob)
+
+    say('🔧 Starting complete Section 6 styling unification...\n')
+
+    for target in files:
+        if cache.fresh(target) is not None:
+            say(f'⏭️  {target} unchanged since last run - skipping')
+            continue
+
+        with open(target, 'r', encoding='utf8') as f:
+            original = f.read()
+
+        # Apply fixes to all charts
+        content, counts = transform(original, profile)
+        if file_path.endswith(target.name):
+            for chart_num, chart_name, reason in charts:
+                status = '✅ Fixed' if counts[chart_num] else '⏭️  Unchanged'
+                say(f'{status} Chart {chart_num}: {chart_name}')
+        say(f"🧠 {target.name}: {counts['use_memo']} useMemo block(s), {counts['react_memo']} React.memo component(s)")
+
+        if write_if_changed(target, original, content, dry_run, journal=journal):
+            say('📝 Wrote updated file\n' if not dry_run else '📝 Dry run - diff above, file not written\n')
+        else:
+            say('📝 Nothing changed - file not written\n')
+        if not dry_run:
+            cache.done(target, counts)
+
+    if profile_path:
+        write_report(profile_path, {'section6_styling': profile}, files=len(files))
+    say('✅ Section 6 styling unification complete!')
+    say('🔍 Next: Test the build with npm run dev\n')
+
+
+if __name__ == '__main__':
+    args = parse_script_args('Complete Section 6 chart styling unification and chart memoization', charts_dir,
+                             target='file, or directory of *Charts.tsx files')
+    main(args.path, args.dry_run, args.profile)
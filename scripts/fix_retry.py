@@ -1,31 +1,30 @@
-import re
+import sys
+from functools import partial
 
-filepath = 'D:/Clues_Quantum_Property_Dashboard/app/src/pages/PropertyDetail.tsx'
+from codemods.cache import ScriptCache
+from codemods.cli import parse_script_args
+from codemods.field_paths import IMPORT_LINE, IMPORT_PATH
+from codemods.instrument import Profile, write_report
+from codemods.journal import Journal
+from codemods.snippets import Snippet, SnippetPatcher
+from codemods.tsx import ensure_import
+from codemods.writer import write_if_changed
 
-with open(filepath, 'r', encoding='utf-8') as f:
-    content = f.read()
-
-old_pattern = r'''if \(newFieldData\) \{
-          // Update the property with the new field value
-          alert\(`✅ \$\{llmName\} found data for \$\{fieldKey\}: \$\{newFieldData\.value\}`\);
-          // TODO: Update fullProperty in store with new field data
-        \} else \{
-          alert\(`❌ \$\{llmName\} could not find data for \$\{fieldKey\}`\);
-        \}'''
+filepath = 'src/pages/PropertyDetail.tsx'
 
+# Path-copying update: only the touched group object is cloned, every other
+# group (photos, source metadata, ...) is shared with fullProperty.
+# Field paths come from the generated module-level table (codemods.field_paths).
 new_code = '''if (newFieldData && newFieldData.value != null) {
-          const updated = JSON.parse(JSON.stringify(fullProperty));
-          const paths: Record<string, [string, string]> = {
-            '1_full_address': ['address', 'fullAddress'],
-            '7_listing_price': ['address', 'listingPrice'],
-            '12_bedrooms': ['details', 'bedrooms'],
-            '16_living_sqft': ['details', 'livingSqft'],
-            '65_walk_score': ['location', 'walkScore'],
-            '100_flood_zone': ['utilities', 'floodZone'],
-          };
-          const path = paths[fieldKey];
-          if (path && updated[path[0]]) {
-            updated[path[0]][path[1]] = { value: newFieldData.value, confidence: 'Medium', notes: `Updated by ${llmName}`, sources: [llmName] };
+          const path = FIELD_PATHS[fieldKey];
+          if (path && (fullProperty as any)[path[0]]) {
+            const updated = {
+              ...fullProperty,
+              [path[0]]: {
+                ...(fullProperty as any)[path[0]],
+                [path[1]]: { value: newFieldData.value, confidence: 'Medium', notes: `Updated by ${llmName}`, sources: [llmName] },
+              },
+            };
             updateFullProperty(id, updated);
             alert(`✅ ${llmName}: ${newFieldData.value}`);
           } else { alert(`✅ ${llmName}: ${newFieldData.value}`); }
@@ -33,25 +32,99 @@ new_code = '''if (newFieldData && newFieldData.value != null) {
           alert(`❌ ${llmName} found no data`);
         }'''
 
-new_content = re.sub(old_pattern, new_code, content)
-
-if new_content != content:
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    print('SUCCESS: File patched')
-else:
-    print('Pattern not matched - trying simple replace')
-    old_simple = '''if (newFieldData) {
+old_code = '''if (newFieldData) {
           // Update the property with the new field value
           alert(`✅ ${llmName} found data for ${fieldKey}: ${newFieldData.value}`);
           // TODO: Update fullProperty in store with new field data
         } else {
           alert(`❌ ${llmName} could not find data for ${fieldKey}`);
         }'''
-    if old_simple in content:
-        new_content = content.replace(old_simple, new_code)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        print('SUCCESS: File patched with simple replace')
+
+# Handlers patched by an earlier version deep-clone the whole property with
+# JSON.parse(JSON.stringify(...)) and then write into it field by field.
+# Switch them to copy-on-write: shallow-copy the property, then copy each
+# group the first time a field lands in it.
+old_clone = 'const updated = JSON.parse(JSON.stringify(fullProperty));'
+new_clone = '''// Path-copying update: only groups that receive a field are cloned
+          const updated: any = { ...fullProperty };
+          const copiedGroups = new Set<string>();'''
+
+old_group_write = '''if (path && updated[path[0]] && (fieldData as any)?.value != null) {
+              updated[path[0]][path[1]] = {'''
+new_group_write = '''if (path && updated[path[0]] && (fieldData as any)?.value != null) {
+              if (!copiedGroups.has(path[0])) {
+                updated[path[0]] = { ...updated[path[0]] };
+                copiedGroups.add(path[0]);
+              }
+              updated[path[0]][path[1]] = {'''
+
+# Matched as a whitespace-tolerant literal (codemods.snippets), so no regex
+# escaping and no second search when indentation differs. The injected block
+# may be edited afterwards, so "already patched" is keyed on its guard line
+# rather than the whole block.
+PATCHER = SnippetPatcher([
+    Snippet('retry_todo', old_code, new_code, optional=True,
+            applied='if (newFieldData && newFieldData.value != null) {'),
+    Snippet('deep_clone', old_clone, new_clone, optional=True),
+    Snippet('group_write', old_group_write, new_group_write, optional=True),
+])
+
+
+def patch(content, profile=None):
+    """
+    Run PATCHER; the deep-clone migration is all or nothing, since a shallow
+    copy without the per-group copy would mutate fullProperty in place.
+    """
+    result = PATCHER.patch(content, profile)
+    if bool(result.patched['deep_clone']) != bool(result.patched['group_write']):
+        result.text = content
+        result.patched['deep_clone'] = result.patched['group_write'] = 0
+        result.missing = ['deep_clone' if 'deep_clone' in result.skipped else 'group_write']
+    if result.patched['retry_todo']:
+        result.text = ensure_import(result.text, IMPORT_LINE, IMPORT_PATH)
+    return result
+
+
+def transform(content, profile=None):
+    """Patch the handleRetryField block; returns (new_content, counts)."""
+    result = patch(content, profile)
+    return result.text, result.counts
+
+
+def main(path=filepath, dry_run=False, profile_path=None):
+    # With --dry-run stdout carries only the diff
+    say = partial(print, file=sys.stderr if dry_run else sys.stdout)
+    cache = ScriptCache('fix_retry', __file__)
+    if cache.fresh(path) is not None:
+        say(f'⏭️  {path} unchanged since last run - skipping')
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    journal = None if dry_run else Journal.start('fix_retry')
+    profile = Profile()
+    result = patch(content, profile)
+    counts = result.counts
+    if profile_path:
+        write_report(profile_path, {'fix_retry': profile}, files=1)
+
+    if result.missing:
+        say(f"ERROR: Only part of the copy-on-write update matched ({', '.join(result.missing)} not found)")
+        return
+    if any(counts.values()):
+        say('SUCCESS: File patched: ' + ', '.join(name for name, n in counts.items() if n))
+    elif result.already:
+        say('SUCCESS: File already patched - nothing to do')
     else:
-        print('ERROR: Could not find pattern')
+        say('ERROR: Could not find pattern')
+        return
+
+    write_if_changed(path, content, result.text, dry_run, journal=journal)
+    if not dry_run:
+        cache.done(path, counts)
+
+
+if __name__ == '__main__':
+    args = parse_script_args('Patch the handleRetryField TODO block in PropertyDetail.tsx', filepath)
+    main(args.path, args.dry_run, args.profile)
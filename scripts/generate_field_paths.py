@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Regenerate src/lib/field-paths.generated.ts from the field schema.
+
+Usage:
+    python scripts/generate_field_paths.py              # write if the schema changed
+    python scripts/generate_field_paths.py --check      # exit 1 if the file is stale
+    python scripts/generate_field_paths.py --dry-run    # print the diff
+"""
+import argparse
+import io
+import sys
+from functools import partial
+
+from codemods.field_paths import OUTPUT, sync
+from codemods.journal import Journal
+from codemods.paths import REPO_ROOT
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--root', default=str(REPO_ROOT), help='repository root')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='print a unified diff instead of writing the file')
+    parser.add_argument('--check', action='store_true',
+                        help='write nothing; exit 1 if the generated file is out of date')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.check:
+        if sync(args.root, dry_run=True, out=io.StringIO()):
+            print(f'❌ {OUTPUT} is out of date - run scripts/generate_field_paths.py')
+            return 1
+        print(f'✅ {OUTPUT} is up to date')
+        return 0
+
+    # With --dry-run stdout carries only the diff
+    say = partial(print, file=sys.stderr if args.dry_run else sys.stdout)
+    journal = None if args.dry_run else Journal.start('generate_field_paths', args.root)
+    if sync(args.root, dry_run=args.dry_run, journal=journal):
+        say(f'📝 {"Diff above for" if args.dry_run else "Regenerated"} {OUTPUT}')
+    else:
+        say(f'✅ {OUTPUT} already matches the schema - not written')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Code-split the Recharts section modules used by the Category*.tsx visuals
+
+Every static ``import X from './recharts/Section...'`` in a Category file
+becomes ``const X = lazy(() => import('./recharts/Section...'))`` and each
+``<X ... />`` is wrapped in a ``<Suspense>`` boundary, so the heavy chart
+sections load as their own chunks when the category is opened instead of
+with the dashboard bundle. Re-running is a no-op.
+
+Every boundary falls back to the one shared ChartSectionLoader component
+(src/components/visuals/ChartSectionLoader.tsx), which is imported, not
+pasted into each file; the script writes that module if it is missing and
+replaces copies an earlier run inlined.
+"""
+import re
+import sys
+from functools import partial
+
+from codemods.cache import ScriptCache
+from codemods.cli import expand_targets, parse_script_args
+from codemods.instrument import Profile, write_report
+from codemods.journal import Journal
+from codemods.paths import REPO_ROOT
+from codemods.tsx import IMPORT, ensure_import, ensure_named_imports
+from codemods.writer import write_if_changed
+
+target_dir = 'src/components/visuals'
+target_glob = 'Category*.tsx'
+
+section_import = re.compile(r"^import\s+(\w+)\s+from\s+'(\./recharts/Section\w+)';[ \t]*\n", re.MULTILINE)
+lazy_const = re.compile(r"^const\s+(\w+)\s*=\s*lazy\(\(\)\s*=>\s*import\('(\./recharts/Section\w+)'\)\);", re.MULTILINE)
+
+LOADER = 'ChartSectionLoader'
+LOADER_PATH = f'./{LOADER}'
+LOADER_IMPORT = f"import {LOADER} from '{LOADER_PATH}';"
+LOADER_MODULE = f'''/**
+ * Chart Section Loader
+ * Suspense fallback for the lazy-loaded Recharts sections in the Category visuals
+ */
+
+export default function {LOADER}() {{
+  return (
+    <div className="flex items-center justify-center py-12">
+      <div className="w-8 h-8 border-2 border-cyan-500 border-t-transparent rounded-full animate-spin" />
+    </div>
+  );
+}}
+'''
+
+# The copy earlier runs pasted into each Category file
+_INLINE_LOADER = re.compile(rf'\n^function {LOADER}\(\) \{{\n.*?^\}}\n', re.MULTILINE | re.DOTALL)
+
+
+def section_imports(content):
+    """(component, module) for every static Recharts section import."""
+    return [(m.group(1), m.group(2)) for m in section_import.finditer(content)]
+
+
+def _previous_line(text, pos):
+    end = text.rfind('\n', 0, pos)
+    if end < 0:
+        return ''
+    while end > 0 and text[end - 1] in ' \t\n':
+        end -= 1
+    return text[text.rfind('\n', 0, end) + 1:end].strip()
+
+
+def wrap_usages(content, names, stats):
+    """Put each single-line ``<Name ... />`` for names in its own Suspense boundary."""
+    if not names:
+        return content
+    usage = re.compile(rf'^([ \t]*)(<(?:{"|".join(map(re.escape, names))})\b[^<>]*?/>)[ \t]*$', re.MULTILINE)
+
+    def wrap(match):
+        stats.matches += 1
+        if _previous_line(content, match.start()).startswith('<Suspense'):
+            return match.group(0)
+        stats.replacements += 1
+        indent = match.group(1)
+        return (f'{indent}<Suspense fallback={{<{LOADER} />}}>\n'
+                f'{indent}  {match.group(2)}\n'
+                f'{indent}</Suspense>')
+    return usage.sub(wrap, content)
+
+
+def transform(content, profile=None):
+    """Lazy-load the section chart imports; returns (new_content, counts)."""
+    # Record into a fresh profile so counts are this file's, then merge
+    local = Profile()
+
+    with local.timed('lazy_imports', content) as stats:
+        converted = section_imports(content)
+        stats.matches = stats.replacements = len(converted)
+        new_content = section_import.sub('', content)
+        if converted:
+            consts = ''.join(f"const {name} = lazy(() => import('{module}'));\n" for name, module in converted)
+            last = None
+            for last in IMPORT.finditer(new_content):
+                pass
+            at = last.end() if last else 0
+            new_content = (new_content[:at] + '\n// Chart sections load as separate chunks\n' + consts
+                           + new_content[at:])
+            new_content = ensure_named_imports(new_content, ['Suspense', 'lazy'], 'react')
+
+    names = [m.group(1) for m in lazy_const.finditer(new_content)]
+    with local.timed('suspense', new_content) as stats:
+        new_content = wrap_usages(new_content, names, stats)
+
+    with local.timed('shared_loader', new_content) as stats:
+        if f'<{LOADER} />' in new_content:
+            stats.matches = 1
+            shared = ensure_import(_INLINE_LOADER.sub('', new_content), LOADER_IMPORT, LOADER_PATH)
+            stats.replacements = int(shared != new_content)
+            new_content = shared
+
+    if profile is not None:
+        profile.merge(local)
+    return new_content, {'lazy_imports': len(converted), 'suspense': local['suspense'].replacements,
+                         'shared_loader': local['shared_loader'].replacements}
+
+
+def emit_loader(dry_run=False, journal=None, root=REPO_ROOT):
+    """Write the shared loader module if it is missing; returns whether it was (or would be)."""
+    path = root / target_dir / f'{LOADER}.tsx'
+    if path.exists():
+        return False
+    return write_if_changed(path, '', LOADER_MODULE, dry_run, journal=journal)
+
+
+def main(path=target_dir, dry_run=False, profile_path=None):
+    # With --dry-run stdout carries only the diff
+    say = partial(print, file=sys.stderr if dry_run else sys.stdout)
+    cache = ScriptCache('lazy_section_charts', __file__)
+    journal = None if dry_run else Journal.start('lazy_section_charts')
+    profile = Profile()
+    chunks = []
+    written = 0
+    files = expand_targets(path, target_glob)
+    if emit_loader(dry_run, journal):
+        say(f'🧩 Wrote the shared {LOADER} fallback to {target_dir}/{LOADER}.tsx')
+
+    for file in files:
+        if cache.fresh(file) is not None:
+            continue
+        with open(file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        new_content, counts = transform(content, profile)
+        if write_if_changed(file, content, new_content, dry_run, journal=journal):
+            written += 1
+            shared = ', shared loader imported' if counts['shared_loader'] else ''
+            say(f'✏️  {file.name}: {counts["lazy_imports"]} lazy import(s), '
+                f'{counts["suspense"]} Suspense boundary(ies){shared}')
+            chunks.extend(module for _, module in section_imports(content))
+        if not dry_run:
+            cache.done(file, counts)
+
+    if chunks:
+        say(f'\n📦 {len(chunks)} new chunk(s):')
+        for module in chunks:
+            say(f'   {module}')
+    elif not written:
+        say(f'✅ No static section imports left in {len(files)} file(s) - nothing written')
+
+    if profile_path:
+        write_report(profile_path, {'lazy_section_charts': profile}, files=len(files))
+
+
+if __name__ == '__main__':
+    args = parse_script_args('Code-split Recharts section imports in the Category*.tsx visuals', target_dir,
+                             target='file, or directory of Category*.tsx files')
+    main(args.path, args.dry_run, args.profile)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Check every codemod regex for catastrophic-backtracking hazards.
+
+Usage:
+    python scripts/lint_codemod_patterns.py            # errors and warnings
+    python scripts/lint_codemod_patterns.py --errors   # errors only
+
+Scans the module-level patterns and RewriteEngine rules of every registered
+codemod script and of the codemods package, and every rule declared in
+codemods.rules; see codemods/regex_safety.py for what is reported. Exits 1 when any pattern has an error-level hazard.
+"""
+import argparse
+import importlib
+import pkgutil
+import re
+import sys
+
+import codemods
+from codemods import RewriteEngine
+from codemods.regex_safety import lint
+from codemods.registry import registry
+from codemods.runner import CODEMODS, load_module
+
+
+def patterns(module):
+    """(name, pattern, flags) for each module-level regex and engine rule."""
+    for name, value in vars(module).items():
+        if isinstance(value, re.Pattern):
+            yield name, value.pattern, value.flags
+        engine = getattr(value, 'engine', value)
+        if isinstance(engine, RewriteEngine):
+            for rule in engine.rules:
+                yield f'{name}[{rule.name}]', rule.pattern, rule.flags
+
+
+def modules():
+    for codemod in CODEMODS:
+        if not codemod.declared:  # its rules are checked by declared()
+            yield codemod.script, load_module(codemod)
+    for info in pkgutil.iter_modules(codemods.__path__):
+        yield f'codemods/{info.name}.py', importlib.import_module(f'codemods.{info.name}')
+
+
+def declared():
+    """(source, name, pattern, flags) for each rule declared in codemods.rules."""
+    for d in registry().declarations:
+        yield d.source, f'{d.codemod}[{d.rule.name}]', d.rule.pattern, d.rule.flags
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--errors', action='store_true', help='only report error-level hazards')
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    found = [(source, *p) for source, module in modules() for p in patterns(module)]
+    found += declared()
+
+    checked = errors = warnings = 0
+    for source, name, pattern, flags in found:
+        checked += 1
+        for finding in lint(pattern, flags):
+            if finding.severity == 'error':
+                errors += 1
+                print(f'❌ {source} {name}: {finding.message}')
+            elif not args.errors:
+                warnings += 1
+                print(f'⚠️  {source} {name}: {finding.message}')
+
+    print(f'🔍 {checked} pattern(s) checked: {errors} error(s), {warnings} warning(s)')
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
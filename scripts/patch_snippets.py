@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Apply a JSON file of old -> new code snippets to a file in one scan.
+
+Usage:
+    python scripts/patch_snippets.py patches.json                  # target from the JSON
+    python scripts/patch_snippets.py patches.json src/pages/Foo.tsx --dry-run
+
+See codemods/snippets.py for the file format. Exits 1 when a required
+snippet's anchor is missing (the file is left untouched).
+"""
+import argparse
+import sys
+from functools import partial
+
+from codemods.instrument import Profile, write_report
+from codemods.journal import Journal
+from codemods.snippets import SnippetPatcher, load_snippets
+from codemods.writer import write_if_changed
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('snippets', help='JSON snippet file')
+    parser.add_argument('path', nargs='?', help='file to patch (default: the JSON "target")')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='print a unified diff instead of writing the file')
+    parser.add_argument('--profile', metavar='JSON',
+                        help='write per-snippet timings and match counts to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    # With --dry-run stdout carries only the diff
+    say = partial(print, file=sys.stderr if args.dry_run else sys.stdout)
+
+    target, snippets = load_snippets(args.snippets)
+    path = args.path or target
+    if not path:
+        say(f'❌ {args.snippets} has no "target" - pass the file to patch')
+        return 2
+
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    profile = Profile()
+    result = SnippetPatcher(snippets).patch(content, profile)
+    if args.profile:
+        write_report(args.profile, {'snippets': profile}, files=1)
+
+    for snippet in snippets:
+        if result.patched[snippet.name]:
+            say(f'✅ {snippet.name}: patched {result.patched[snippet.name]}x')
+        elif snippet.name in result.already:
+            say(f'⏭️  {snippet.name}: already applied')
+        elif snippet.name in result.skipped:
+            say(f'⏭️  {snippet.name}: anchor not found (optional)')
+        else:
+            say(f'❌ {snippet.name}: anchor not found')
+    if not result.ok:
+        say(f'❌ {len(result.missing)} required anchor(s) missing - {path} not written')
+        return 1
+
+    journal = None if args.dry_run else Journal.start('patch_snippets')
+    if write_if_changed(path, content, result.text, args.dry_run, journal=journal):
+        say(f'📝 {"Diff above" if args.dry_run else "Wrote"} {path}')
+    else:
+        say(f'📝 Nothing changed - {path} not written')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Run the Python codemods over every matching .tsx under src/ in parallel.
+
+Usage:
+    python scripts/run_codemods.py                      # all codemods, all cores
+    python scripts/run_codemods.py fix_retry -j 4       # one codemod, 4 workers
+    python scripts/run_codemods.py --dry-run > codemods.diff   # preview, write nothing
+    python scripts/run_codemods.py section6_styling --glob 'components/visuals/recharts/Section6*.tsx'
+"""
+import argparse
+import sys
+from dataclasses import replace
+from functools import partial
+
+from codemods import field_paths, search_index
+from codemods.instrument import write_report
+from codemods.journal import Journal
+from codemods.regex_safety import DEFAULT_BUDGET
+from codemods.runner import CODEMODS, CODEMODS_BY_NAME, REPO_ROOT, run
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('codemods', nargs='*', metavar='codemod',
+                        help='one of: ' + ', '.join(CODEMODS_BY_NAME) + ' (default: all, in registry order)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: every core)')
+    parser.add_argument('--root', default=str(REPO_ROOT), help='repository root')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignore the incremental cache and process every file')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='stream unified diffs to stdout instead of writing files')
+    parser.add_argument('--profile', metavar='JSON',
+                        help='write per-rule timings and match counts to this file '
+                             '(cached files are not profiled; add --no-cache for a full sweep)')
+    parser.add_argument('--glob', action='append', dest='globs',
+                        help='override target globs (relative to src/); repeatable')
+    parser.add_argument('--rule-budget', type=float, default=DEFAULT_BUDGET, metavar='SECONDS',
+                        help=f'fail a file when one rule runs longer than this on it '
+                             f'(default: {DEFAULT_BUDGET:g}; 0 turns it off)')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.codemods if name not in CODEMODS_BY_NAME]
+    if unknown:
+        parser.error('unknown codemod(s): ' + ', '.join(unknown))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    selected = [c for c in CODEMODS if not args.codemods or c.name in args.codemods]
+    if args.globs:
+        selected = [replace(c, globs=tuple(args.globs)) for c in selected]
+
+    def stream(result):
+        if result.diff:
+            sys.stdout.write(result.diff)
+            sys.stdout.flush()
+
+    journal = None if args.dry_run else Journal.start('run_codemods', args.root)
+
+    # The pages import the generated field-path table; keep it in step with the schema
+    if field_paths.sync(args.root, dry_run=args.dry_run, journal=journal):
+        print(f'📝 Regenerated {field_paths.OUTPUT}', file=sys.stderr if args.dry_run else sys.stdout)
+
+    summary = run(selected, root=args.root, jobs=args.jobs, use_cache=not args.no_cache,
+                  dry_run=args.dry_run, profile=bool(args.profile), on_result=stream, journal=journal,
+                  rule_budget=args.rule_budget)
+
+    # With --dry-run stdout carries only the diffs
+    say = partial(print, file=sys.stderr if args.dry_run else sys.stdout)
+
+    # The field search index is built from the keyed page: from the sweep's
+    # copy if it processed the page, else (cached) from the page on disk
+    if summary.sites is not None or any(c.name == 'fix_property_detail' for c in selected):
+        if search_index.refresh(args.root, summary.sites, dry_run=args.dry_run, journal=journal):
+            say(f'🔎 Regenerated {search_index.OUTPUT}')
+
+    say(f'🔧 Scanned {summary.files} file(s), changed {len(summary.changed)}, '
+        f'skipped {len(summary.skipped)} unchanged')
+    for path in summary.changed:
+        say(f'   ✏️  {path}')
+    for name, counts in summary.counts.items():
+        hits = ', '.join(f'{k}={v}' for k, v in counts.items())
+        say(f'   {name}: {hits} ({summary.seconds[name] * 1000:.1f} ms)')
+    for path, error in summary.errors.items():
+        say(f'❌ {path}: {error}')
+    if summary.timeouts:
+        say(f'⏱️  {len(summary.timeouts)} file(s) skipped after a rule ran out of time - '
+            f'check the rule with scripts/lint_codemod_patterns.py')
+    if journal is not None and journal.path.exists():
+        say(f'↩️  Journal {journal.run} - undo with: python scripts/codemod_journal.py revert {journal.run}')
+    if args.profile:
+        write_report(args.profile, summary.profiles, files=summary.files - len(summary.skipped))
+        say(f'📊 Rule profile written to {args.profile}')
+    return 1 if summary.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Run an ordered chain of codemods over files, reading and writing each file once.
+
+Usage:
+    python scripts/run_pipeline.py update_datafields fix_property_detail
+    python scripts/run_pipeline.py update_datafields fix_retry fix_property_detail --file src/pages/PropertyDetail.tsx --dry-run
+
+Without --file every file claimed by any of the codemods' globs is processed,
+each going through the stages whose globs claim it; a --file goes through
+every stage. Stages run in the order given, in memory; the per-stage
+timings are printed at the end.
+"""
+import argparse
+import sys
+from collections import Counter
+from functools import partial
+from pathlib import Path
+
+from codemods import search_index
+from codemods.instrument import write_report
+from codemods.journal import Journal
+from codemods.runner import CODEMODS_BY_NAME, REPO_ROOT, Summary, discover, plan, run_file, target_globs
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('codemods', nargs='+', metavar='codemod',
+                        help='stages in order, from: ' + ', '.join(CODEMODS_BY_NAME))
+    parser.add_argument('--file', action='append', dest='files',
+                        help='file to process (repeatable; default: every file the codemods target)')
+    parser.add_argument('--root', default=str(REPO_ROOT), help='repository root')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='stream unified diffs to stdout instead of writing files')
+    parser.add_argument('--profile', metavar='JSON',
+                        help='write per-rule timings and match counts to this file')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.codemods if name not in CODEMODS_BY_NAME]
+    if unknown:
+        parser.error('unknown codemod(s): ' + ', '.join(unknown))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    # With --dry-run stdout carries only the diffs
+    say = partial(print, file=sys.stderr if args.dry_run else sys.stdout)
+
+    if args.files:
+        tasks = [(str(Path(f)), tuple(args.codemods)) for f in args.files]
+    else:
+        stages = [CODEMODS_BY_NAME[name] for name in args.codemods]
+        tasks = plan(discover(args.root, target_globs(stages)), stages, args.root)
+
+    journal = None if args.dry_run else Journal.start('run_pipeline', args.root)
+    summary = Summary()
+    for path, names in tasks:
+        result = run_file(path, names, args.dry_run, bool(args.profile), root=args.root)
+        summary.add(result)
+        if journal is not None and result.journal is not None:
+            journal.append(result.journal)
+        if result.diff:
+            sys.stdout.write(result.diff)
+            sys.stdout.flush()
+
+    # The page went through the chain: bring its field search index up to date
+    if summary.sites is not None and search_index.sync(summary.sites, args.root, args.dry_run, journal=journal):
+        say(f'🔎 Regenerated {search_index.OUTPUT}')
+    say(f'🔗 {" -> ".join(args.codemods)}: {summary.files} file(s), changed {len(summary.changed)}')
+    for path in summary.changed:
+        say(f'   ✏️  {path}')
+    for name in args.codemods:
+        hits = ', '.join(f'{k}={v}' for k, v in summary.counts.get(name, Counter()).items())
+        say(f'   {name:<20} {summary.seconds[name] * 1000:8.1f} ms  {hits}')
+    for path, error in summary.errors.items():
+        say(f'❌ {path}: {error}')
+    if journal is not None and journal.path.exists():
+        say(f'↩️  Journal {journal.run} - undo with: python scripts/codemod_journal.py revert {journal.run}')
+    if args.profile:
+        write_report(args.profile, summary.profiles, files=summary.files)
+        say(f'📊 Rule profile written to {args.profile}')
+    return 1 if summary.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
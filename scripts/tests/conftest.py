@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The scripts import the shared package as ``codemods`` from scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,57 @@
+from codemods.journal import Entry, Journal
+
+OLD = 'const a = 1;\r\nconst b = 2;\r\nconst c = 3;\r\n'
+NEW = 'const a = 1;\r\nconst b = 20;\r\nconst c = 3;\r\n'
+
+
+def write(path, text):
+    path.write_bytes(text.encode('utf-8'))
+
+
+def test_revert_and_replay_round_trip_crlf(tmp_path):
+    target = tmp_path / 'Page.tsx'
+    write(target, NEW)
+    journal = Journal(tmp_path / 'run.jsonl')
+    journal.append(Entry.between(target, OLD, NEW))
+
+    outcome = journal.revert()
+    assert outcome.done == [str(target.resolve())]
+    assert target.read_bytes() == OLD.encode('utf-8')
+
+    outcome = journal.replay()
+    assert outcome.done == [str(target.resolve())]
+    assert target.read_bytes() == NEW.encode('utf-8')
+
+
+def test_revert_twice_is_a_no_op(tmp_path):
+    target = tmp_path / 'Page.tsx'
+    write(target, NEW)
+    journal = Journal(tmp_path / 'run.jsonl')
+    journal.append(Entry.between(target, OLD, NEW))
+
+    journal.revert()
+    outcome = journal.revert()
+    assert outcome.already == [str(target.resolve())]
+    assert target.read_bytes() == OLD.encode('utf-8')
+
+
+def test_revert_leaves_a_file_edited_since_alone(tmp_path):
+    target = tmp_path / 'Page.tsx'
+    edited = NEW.replace('const c = 3;', 'const c = 4;')
+    write(target, edited)
+    journal = Journal(tmp_path / 'run.jsonl')
+    journal.append(Entry.between(target, OLD, NEW))
+
+    outcome = journal.revert()
+    assert outcome.conflicts == [str(target.resolve())]
+    assert target.read_bytes() == edited.encode('utf-8')
+
+
+def test_revert_deletes_a_created_file(tmp_path):
+    target = tmp_path / 'generated.ts'
+    write(target, NEW)
+    journal = Journal(tmp_path / 'run.jsonl')
+    journal.append(Entry.between(target, '', NEW, created=True))
+
+    assert journal.revert().done == [str(target.resolve())]
+    assert not target.exists()
@@ -0,0 +1,136 @@
+from codemods.memoize import memoize_charts
+
+
+def memoize(text):
+    out, counts = memoize_charts(text)
+    again, recount = memoize_charts(out)
+    assert again == out, 'a second run must not change the output'
+    assert recount == {'use_memo': 0, 'react_memo': 0}
+    return out, counts
+
+
+def test_derived_run_is_memoized_and_component_wrapped():
+    out, counts = memoize('''import React from 'react';
+
+export function ScoreChart({ homes }: Props) {
+  const scores = homes.map((h) => h.score);
+  const maxScore = Math.max(...scores);
+  return (
+    <div>{maxScore}</div>
+  );
+}
+''')
+    assert counts == {'use_memo': 1, 'react_memo': 1}
+    assert out == '''import React, { useMemo, memo } from 'react';
+
+export const ScoreChart = memo(function ScoreChart({ homes }: Props) {
+  const { scores, maxScore } = useMemo(() => {
+    const scores = homes.map((h) => h.score);
+    const maxScore = Math.max(...scores);
+    return { scores, maxScore };
+  }, [homes]);
+  return (
+    <div>{maxScore}</div>
+  );
+});
+'''
+
+
+def test_run_mutated_later_is_not_memoized():
+    out, counts = memoize('''import React from 'react';
+
+export function RankChart({ homes }: Props) {
+  const ranked = homes.map((h) => h.score);
+  ranked.sort((a, b) => b - a);
+  return <div>{ranked[0]}</div>;
+}
+''')
+    assert counts == {'use_memo': 0, 'react_memo': 1}
+    assert 'useMemo' not in out
+    assert '  const ranked = homes.map((h) => h.score);\n  ranked.sort(' in out
+
+
+def test_assignment_into_a_run_value_is_a_mutation():
+    out, counts = memoize('''function TotalsChart({ homes }: Props) {
+  const totals = homes.map((h) => ({ score: h.score }));
+  totals[0].score = 100;
+  return <div>{totals.length}</div>;
+}
+''')
+    assert counts['use_memo'] == 0
+    assert 'useMemo' not in out
+
+
+def test_state_derived_const_is_not_memoized():
+    out, counts = memoize('''import React, { useState } from 'react';
+
+export function TabChart({ homes }: Props) {
+  const [tab, setTab] = useState(0);
+  const visible = homes.filter((h, i) => i !== tab);
+  return <div onClick={() => setTab(1)}>{visible.length}</div>;
+}
+''')
+    assert counts == {'use_memo': 0, 'react_memo': 1}
+    assert '  const visible = homes.filter((h, i) => i !== tab);' in out
+    assert 'useMemo' not in out
+
+
+def test_nothing_after_a_statement_with_return_is_memoized():
+    out, counts = memoize('''import React from 'react';
+
+export function EmptyChart({ homes }: Props) {
+  const count = homes.length;
+  if (!count) return null;
+  const total = homes.reduce((sum, h) => sum + h.score, 0);
+  return <div>{total}</div>;
+}
+''')
+    assert counts == {'use_memo': 1, 'react_memo': 1}
+    assert '  const count = useMemo(() => homes.length, [homes]);' in out
+    assert '  const total = homes.reduce((sum, h) => sum + h.score, 0);' in out
+
+
+def test_react_fc_arrow_component():
+    out, counts = memoize('''import React from 'react';
+
+const WinnerChart: React.FC<{ homes: Home[] }> = ({ homes }) => {
+  const winner = homes.reduce((best, h) => (h.score > best.score ? h : best), homes[0]);
+  return <div>{winner.name}</div>;
+};
+
+export { WinnerChart };
+''')
+    assert counts == {'use_memo': 1, 'react_memo': 1}
+    assert out == '''import React, { useMemo, memo } from 'react';
+
+const WinnerChart = memo<{ homes: Home[] }>(function WinnerChart({ homes }) {
+  const winner = useMemo(() => homes.reduce((best, h) => (h.score > best.score ? h : best), homes[0]), [homes]);
+  return <div>{winner.name}</div>;
+});
+
+export { WinnerChart };
+'''
+
+
+def test_default_export_keeps_its_plain_form():
+    out, counts = memoize('''import React from 'react';
+
+export default function Dashboard({ homes }: Props) {
+  const total = homes.length;
+  return <div>{total}</div>;
+}
+''')
+    assert counts == {'use_memo': 1, 'react_memo': 0}
+    assert 'export default function Dashboard({ homes }: Props) {' in out
+    assert 'import React, { useMemo } from' in out
+
+
+def test_components_without_homes_are_untouched():
+    text = '''import React from 'react';
+
+export function Legend({ items }: Props) {
+  const sorted = items.map((i) => i.label);
+  return <ul>{sorted}</ul>;
+}
+'''
+    assert memoize_charts(text) == (text, {'use_memo': 0, 'react_memo': 0})
@@ -0,0 +1,58 @@
+import pytest
+
+from codemods import registry, runner
+from codemods.watch import watch_dirs
+
+
+@pytest.fixture
+def lib_rule():
+    """A migration declared after import time, targeting src/lib (like a new rules module)."""
+    registry.REGISTRY.register('lib_var_to_const', 'var', r'\bvar\b', 'const', globs=('lib/*.ts',))
+    runner.refresh()
+    yield runner.CODEMODS_BY_NAME['lib_var_to_const']
+    registry.reload()
+    runner.refresh()
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for rel, text in {'src/lib/a.ts': 'var a = 1;\n',
+                      'src/lib/nested/b.ts': 'var b = 2;\n',
+                      'src/pages/Home.tsx': 'var page = 3;\n'}.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return tmp_path
+
+
+def test_refresh_adds_declared_codemods(lib_rule):
+    assert runner.CODEMODS[-1] is lib_rule
+    assert lib_rule.declared and lib_rule.globs == ('lib/*.ts',)
+    assert 'lib/*.ts' in runner.target_globs(runner.CODEMODS)
+
+
+def test_run_discovers_the_codemods_globs(lib_rule, tree):
+    summary = runner.run([lib_rule], root=tree, jobs=1, use_cache=False, dry_run=True)
+
+    assert summary.files == 1
+    assert summary.changed == [str(tree / 'src/lib/a.ts')]
+    assert summary.counts['lib_var_to_const'] == {'var': 1}
+    assert (tree / 'src/lib/a.ts').read_text() == 'var a = 1;\n'
+
+
+def test_run_defaults_to_every_codemod(lib_rule, tree):
+    summary = runner.run(root=tree, jobs=1, use_cache=False, dry_run=True)
+
+    assert str(tree / 'src/lib/a.ts') in summary.changed
+    assert str(tree / 'src/lib/nested/b.ts') not in summary.changed
+
+
+def test_watch_dirs_are_the_globs_literal_prefixes(lib_rule):
+    assert watch_dirs(runner.CODEMODS) == ('src/components/visuals', 'src/lib', 'src/pages')
+    assert watch_dirs([runner.Codemod('any', 'any.py', ('**/*.ts', 'lib/*.ts'))]) == ('src',)
+
+
+def test_refresh_drops_codemods_gone_from_the_registry(lib_rule):
+    registry.reload()
+    assert 'lib_var_to_const' not in {c.name for c in runner.refresh()}
+    assert 'lib_var_to_const' not in runner.CODEMODS_BY_NAME
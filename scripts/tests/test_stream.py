@@ -0,0 +1,92 @@
+import pytest
+
+from codemods import stream
+from codemods.journal import Journal
+from codemods.registry import registry
+from codemods.runner import CODEMODS_BY_NAME, load_module
+from codemods.stream import stream_rewrite
+
+# Non-ASCII labels and CRLF line endings around and inside the matched spans
+DATAFIELDS = (
+    '<div>\r\n'
+    '  <DataField label="Größe in m²" value={fullProperty.details.livingSqft.value} />\r\n'
+    '  <DataField label="Price €" value={fullProperty.address.listingPrice.value} format="currency" />\r\n'
+    '  <DataField label="物件" value={fullProperty.details.bedrooms.value} icon={<Bed />} />\r\n'
+    '  <DataField label="Año" value={fullProperty.details.yearBuilt.value} format="number" icon={Calendar} />\r\n'
+    '  <p>Ünchanged — «text» 🏠</p>\r\n'
+    '</div>\r\n'
+)
+
+FIELD_KEYS = (
+    '{renderDataField("Precio €", fullProperty.address.listingPrice, "currency")}\n'
+    '{renderDataField("Dirección 🏠", fullProperty.address.fullAddress)}\n'
+    '{renderDataField("Schlafzimmer", fullProperty.details.bedrooms, "number", undefined, "17_bedrooms")}\n'
+    '{renderDataField("Ünknown", fullProperty.nope.field)}\n'
+    '{renderDataField("Año", fullProperty.details.yearBuilt, "number", <Calendar />)}\n'
+)
+
+
+def datafields_engine():
+    return registry().engine('update_datafields')
+
+
+def field_keys_engine():
+    return load_module(CODEMODS_BY_NAME['fix_property_detail']).FIELD_KEYS
+
+
+CASES = [(datafields_engine, DATAFIELDS), (field_keys_engine, FIELD_KEYS)]
+
+
+@pytest.fixture(params=[stream.CHUNK, 7], ids=['chunk', 'tiny-chunk'])
+def chunk(request, monkeypatch):
+    # A tiny chunk splits the copied stretches inside multi-byte characters
+    monkeypatch.setattr(stream, 'CHUNK', request.param)
+    return request.param
+
+
+@pytest.mark.parametrize('engine, text', CASES, ids=['update_datafields', 'fix_property_detail'])
+def test_stream_matches_in_memory_rewrite(tmp_path, chunk, engine, text):
+    engine = engine()
+    path = tmp_path / 'Page.tsx'
+    path.write_bytes(text.encode('utf-8'))
+
+    expected = engine.rewrite(text)
+    result = stream_rewrite(engine, path)
+
+    assert expected.text != text
+    assert path.read_bytes() == expected.text.encode('utf-8')
+    assert result.changed
+    assert result.counts == expected.counts
+    assert result.bytes_out == len(expected.text.encode('utf-8'))
+
+
+@pytest.mark.parametrize('engine, text', CASES, ids=['update_datafields', 'fix_property_detail'])
+def test_stream_journal_reverts_and_replays(tmp_path, chunk, engine, text):
+    engine = engine()
+    path = tmp_path / 'Page.tsx'
+    path.write_bytes(text.encode('utf-8'))
+    journal = Journal(tmp_path / 'run.jsonl')
+
+    stream_rewrite(engine, path, journal=journal)
+    rewritten = path.read_bytes()
+
+    assert journal.revert().done == [str(path.resolve())]
+    assert path.read_bytes() == text.encode('utf-8')
+    assert journal.replay().done == [str(path.resolve())]
+    assert path.read_bytes() == rewritten
+
+
+def test_stream_dry_run_and_no_op_write_nothing(tmp_path):
+    engine = datafields_engine()
+    path = tmp_path / 'Page.tsx'
+    path.write_bytes(DATAFIELDS.encode('utf-8'))
+
+    assert stream_rewrite(engine, path, dry_run=True).changed
+    assert path.read_bytes() == DATAFIELDS.encode('utf-8')
+
+    stream_rewrite(engine, path)
+    written = path.stat().st_mtime_ns
+    assert not stream_rewrite(engine, path).changed
+    assert path.stat().st_mtime_ns == written
+    # No temp file is left beside the target
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,63 @@
+from codemods.tsx import TsxIndex, ensure_named_imports
+
+CHART = '''function Chart({ homes }: Props) {
+  const a = homes.map((h) => { return h.x; });
+  if (a.length) {
+    console.log(a);
+  }
+  const s = `x;y ${a.length};`;
+  const re = /;\\}/g;
+  const b = a.filter(Boolean); // done;
+  return (<div>{b}</div>);
+}
+'''
+
+
+def test_statements_split_on_top_level_semicolons_only():
+    index = TsxIndex(CHART)
+    chart, = index.functions()
+    statements = [CHART[start:end].strip() for start, end in index.statements(chart.body_open)]
+    assert statements == [
+        'const a = homes.map((h) => { return h.x; });',
+        'if (a.length) {\n    console.log(a);\n  }\n  const s = `x;y ${a.length};`;',
+        'const re = /;\\}/g;',
+        'const b = a.filter(Boolean);',
+        '// done;\n  return (<div>{b}</div>);',
+    ]
+
+
+def test_function_span_and_top_level_return():
+    index = TsxIndex(CHART)
+    chart, = index.functions(r'Chart')
+    assert CHART[chart.body_open] == '{' and chart.end == len(CHART) - 1
+    assert CHART[chart.return_open:chart.return_close + 1] == '(<div>{b}</div>)'
+
+
+def test_arrow_functions_need_a_block_body():
+    text = '''const Small = (props: P): JSX.Element => {
+  return <span />;
+};
+const Typed: React.FC<{ onPick: (id: string) => void }> = ({ onPick }) => {
+  return <button onClick={() => onPick('a')} />;
+};
+const Inline = (x: number) => x * 2;
+const notAFunction = (1 + 2);
+'''
+    index = TsxIndex(text)
+    assert [span.name for span in index.arrow_functions()] == ['Small', 'Typed']
+    assert [span.name for span in index.arrow_functions(r'T\w*')] == ['Typed']
+
+
+def test_functions_match_memo_wrapped_declarations():
+    text = '''export const Chart = memo(function Chart({ homes }: Props) {
+  return <div />;
+});
+'''
+    assert [span.name for span in TsxIndex(text).functions()] == ['Chart']
+
+
+def test_ensure_named_imports_merges_into_the_react_import():
+    assert (ensure_named_imports("import React from 'react';\n", ['useMemo'], 'react')
+            == "import React, { useMemo } from 'react';\n")
+    assert (ensure_named_imports("import React, { useState } from 'react';\n", ['useState', 'memo'], 'react')
+            == "import React, { useState, memo } from 'react';\n")
@@ -1,36 +1,69 @@
 #!/usr/bin/env python3
 """
 Batch update all DataField calls to use renderDataField helper
+
+All four <DataField ... /> variants are declared in
+codemods/rules/datafields.py and rewritten in a single scan of the file
+(see codemods.engine), with a per-variant match count. With --stream the
+file is memory-mapped and rewritten in bounded memory instead
+(codemods.stream), for large generated files.
 """
-import re
-
-# Read the file
-with open('src/pages/PropertyDetail.tsx', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Pattern 1: <DataField label="X" value={fullProperty.category.field.value} />
-pattern1 = r'<DataField label="([^"]+)" value=\{fullProperty\.([^.]+)\.([^.]+)\.value\} />'
-replacement1 = r'{renderDataField("\1", fullProperty.\2.\3)}'
-content = re.sub(pattern1, replacement1, content)
-
-# Pattern 2: <DataField label="X" value={fullProperty.category.field.value} format="Y" />
-pattern2 = r'<DataField label="([^"]+)" value=\{fullProperty\.([^.]+)\.([^.]+)\.value\} format="([^"]+)" />'
-replacement2 = r'{renderDataField("\1", fullProperty.\2.\3, "\4")}'
-content = re.sub(pattern2, replacement2, content)
-
-# Pattern 3: With icon prop
-pattern3 = r'<DataField label="([^"]+)" value=\{fullProperty\.([^.]+)\.([^.]+)\.value\} icon=\{([^}]+)\} />'
-replacement3 = r'{renderDataField("\1", fullProperty.\2.\3, "text", \4)}'
-content = re.sub(pattern3, replacement3, content)
-
-# Pattern 4: With format and icon
-pattern4 = r'<DataField label="([^"]+)" value=\{fullProperty\.([^.]+)\.([^.]+)\.value\} format="([^"]+)" icon=\{([^}]+)\} />'
-replacement4 = r'{renderDataField("\1", fullProperty.\2.\3, "\4", \5)}'
-content = re.sub(pattern4, replacement4, content)
-
-# Write back
-with open('src/pages/PropertyDetail.tsx', 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("✅ Updated all DataField calls to use renderDataField")
-print(f"📊 File size: {len(content)} characters")
+import sys
+from functools import partial
+
+from codemods.cache import ScriptCache
+from codemods.cli import parse_script_args
+from codemods.instrument import Profile, write_report
+from codemods.journal import Journal
+from codemods.registry import registry
+from codemods.stream import stream_rewrite
+from codemods.writer import write_if_changed
+
+TARGET = 'src/pages/PropertyDetail.tsx'
+
+# The engine is compiled on first use, once per process (codemods.registry)
+REGISTRY = registry()
+
+
+def transform(content, profile=None):
+    """Rewrite every DataField variant; returns (new_content, counts)."""
+    result = REGISTRY.engine('update_datafields').rewrite(content, profile)
+    return result.text, result.counts
+
+
+def main(path=TARGET, dry_run=False, profile_path=None, stream=False):
+    # With --dry-run stdout carries only the diff
+    say = partial(print, file=sys.stderr if dry_run else sys.stdout)
+    cache = ScriptCache('update_datafields', __file__, REGISTRY.sources('update_datafields'))
+    if cache.fresh(path) is not None:
+        say(f'⏭️  {path} unchanged since last run - skipping')
+        return
+
+    journal = None if dry_run else Journal.start('update_datafields')
+    profile = Profile()
+    if stream:
+        result = stream_rewrite(REGISTRY.engine('update_datafields'), path, dry_run, journal=journal, profile=profile)
+        changed, counts, size = result.changed, result.counts, f'{result.bytes_out} bytes'
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            original = f.read()
+        content, counts = transform(original, profile)
+        changed = write_if_changed(path, original, content, dry_run, journal=journal)
+        size = f'{len(content)} characters'
+
+    if changed:
+        say("✅ Updated all DataField calls to use renderDataField")
+    else:
+        say("✅ No DataField calls left to update - file not written")
+    for name, count in counts.items():
+        say(f"   {name:<12} {count}")
+    say(f"📊 File size: {size}")
+    if profile_path:
+        write_report(profile_path, {'update_datafields': profile}, files=1)
+    if not dry_run:
+        cache.done(path, counts)
+
+
+if __name__ == '__main__':
+    args = parse_script_args(__doc__.strip().splitlines()[0], TARGET, stream=True)
+    main(args.path, args.dry_run, args.profile, args.stream)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Watch the codemods' target directories and re-run the codemods on every save.
+
+Usage:
+    python scripts/watch_codemods.py                    # all codemods, inotify if available
+    python scripts/watch_codemods.py fix_property_detail --poll --interval 0.5
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from codemods.runner import CODEMODS, CODEMODS_BY_NAME, REPO_ROOT
+from codemods.watch import make_watcher, watch, watch_dirs
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('codemods', nargs='*', metavar='codemod',
+                        help='one of: ' + ', '.join(CODEMODS_BY_NAME) + ' (default: all, in registry order)')
+    parser.add_argument('--root', default=str(REPO_ROOT), help='repository root')
+    parser.add_argument('--poll', action='store_true', help='poll file stats instead of using inotify')
+    parser.add_argument('--interval', type=float, default=0.25,
+                        help='polling interval in seconds (default: 0.25)')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.codemods if name not in CODEMODS_BY_NAME]
+    if unknown:
+        parser.error('unknown codemod(s): ' + ', '.join(unknown))
+    return args
+
+
+def show(result, seconds):
+    if result.error:
+        print(f'❌ {result.path}: {result.error}', flush=True)
+        return
+    hits = ', '.join(f'{name}={sum(counts.values())}' for name, counts in result.counts.items())
+    status = '✏️  rewrote' if result.changed else '✅ clean  '
+    print(f'{status} {result.path} in {seconds * 1000:.1f} ms ({hits})', flush=True)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    root = Path(args.root).resolve()
+    # None follows the registry, so a rules module added while watching joins
+    selected = [c for c in CODEMODS if c.name in args.codemods] if args.codemods else None
+
+    dirs = watch_dirs(selected or CODEMODS)
+    watcher = make_watcher((root / d for d in dirs), args.poll, args.interval)
+    print(f'👀 Watching {", ".join(dirs)} ({watcher.name}) - Ctrl-C to stop', flush=True)
+    watch(selected, root=root, watcher=watcher, on_result=show,
+          on_reload=lambda: print('🔄 Codemod sources or schema changed - rules reloaded', flush=True))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
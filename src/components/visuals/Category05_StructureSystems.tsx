@@ -14,8 +14,12 @@
  */
 
 import type { ChartProperty } from '@/lib/visualsDataMapper';
-import Section5PerplexityCharts from './recharts/Section5PerplexityCharts';
-import Section5StructureSystemsCharts from './recharts/Section5StructureSystemsCharts';
+import { Suspense, lazy } from 'react';
+import ChartSectionLoader from './ChartSectionLoader';
+
+// Chart sections load as separate chunks
+const Section5PerplexityCharts = lazy(() => import('./recharts/Section5PerplexityCharts'));
+const Section5StructureSystemsCharts = lazy(() => import('./recharts/Section5StructureSystemsCharts'));
 
 interface CategoryProps {
   properties: ChartProperty[];
@@ -82,10 +86,14 @@ export default function Category05_StructureSystems({ properties }: CategoryProp
       </div>
 
       {/* Charts 5-1 to 5-3: Systems Overview & Replacement */}
-      <Section5PerplexityCharts homes={mappedHomes} />
+      <Suspense fallback={<ChartSectionLoader />}>
+        <Section5PerplexityCharts homes={mappedHomes} />
+      </Suspense>
 
       {/* Charts 5-4 to 5-6: Material Quality & Condition */}
-      <Section5StructureSystemsCharts homes={mappedHomes} />
+      <Suspense fallback={<ChartSectionLoader />}>
+        <Section5StructureSystemsCharts homes={mappedHomes} />
+      </Suspense>
 
       {/* Chart Guide */}
       <div className="mt-8 p-6 bg-gradient-to-br from-blue-500/10 to-purple-500/10 backdrop-blur-xl border border-white/10 rounded-xl">
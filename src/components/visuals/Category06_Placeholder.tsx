@@ -4,8 +4,12 @@
  */
 
 import type { ChartProperty } from '@/lib/visualsDataMapper';
-import Section6InteriorFeaturesCharts from './recharts/Section6InteriorFeaturesCharts';
-import InteriorConditionChart from './recharts/Section6InteriorChart';
+import { Suspense, lazy } from 'react';
+import ChartSectionLoader from './ChartSectionLoader';
+
+// Chart sections load as separate chunks
+const Section6InteriorFeaturesCharts = lazy(() => import('./recharts/Section6InteriorFeaturesCharts'));
+const InteriorConditionChart = lazy(() => import('./recharts/Section6InteriorChart'));
 
 interface CategoryProps {
   properties: ChartProperty[];
@@ -72,10 +76,14 @@ export default function Category06_InteriorFeatures({ properties }: CategoryProp
       </div>
 
       {/* OLD Interior Condition Chart (FIRST) */}
-      <InteriorConditionChart homes={oldChartHomes} />
+      <Suspense fallback={<ChartSectionLoader />}>
+        <InteriorConditionChart homes={oldChartHomes} />
+      </Suspense>
 
       {/* NEW Section 6 Interior Features Charts (10 charts) */}
-      <Section6InteriorFeaturesCharts homes={mappedHomes} />
+      <Suspense fallback={<ChartSectionLoader />}>
+        <Section6InteriorFeaturesCharts homes={mappedHomes} />
+      </Suspense>
     </div>
   );
 }
@@ -0,0 +1,12 @@
+/**
+ * Chart Section Loader
+ * Suspense fallback for the lazy-loaded Recharts sections in the Category visuals
+ */
+
+export default function ChartSectionLoader() {
+  return (
+    <div className="flex items-center justify-center py-12">
+      <div className="w-8 h-8 border-2 border-cyan-500 border-t-transparent rounded-full animate-spin" />
+    </div>
+  );
+}
@@ -1,4 +1,4 @@
-import { useEffect } from 'react';
+import { useEffect, useMemo, memo } from 'react';
 import {
   BarChart,
   Bar,
@@ -243,18 +243,21 @@ const CustomTooltip: React.FC<any> = ({ active, payload, label }) => {
 // ============================================
 // CHART 4-1: ANNUAL COST BREAKDOWN (STACKED HORIZONTAL BAR)
 // ============================================
-const Chart41_AnnualCostBreakdown: React.FC<{ homes: Home[] }> = ({ homes }) => {
-  const chartData = homes.map((home) => ({
-    name: home.name,
-    Taxes: home.annualTaxes,
-    HOA: home.hoaFeeAnnual,
-    total: home.annualTaxes + home.hoaFeeAnnual,
-    score: scoreTrueCostIndex(home, homes),
-  }));
-
-  // Find winner (highest score)
-  const maxScore = Math.max(...chartData.map((d) => d.score));
-  const winner = chartData.find((d) => d.score === maxScore);
+const Chart41_AnnualCostBreakdown = memo<{ homes: Home[] }>(function Chart41_AnnualCostBreakdown({ homes }) {
+  const { chartData, maxScore, winner } = useMemo(() => {
+    const chartData = homes.map((home) => ({
+      name: home.name,
+      Taxes: home.annualTaxes,
+      HOA: home.hoaFeeAnnual,
+      total: home.annualTaxes + home.hoaFeeAnnual,
+      score: scoreTrueCostIndex(home, homes),
+    }));
+
+    // Find winner (highest score)
+    const maxScore = Math.max(...chartData.map((d) => d.score));
+    const winner = chartData.find((d) => d.score === maxScore);
+    return { chartData, maxScore, winner };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 4-1 - Annual Cost Breakdown');
@@ -306,38 +309,41 @@ const Chart41_AnnualCostBreakdown: React.FC<{ homes: Home[] }> = ({ homes }) =>
       />
     </div>
   );
-};
+});
 
 // ============================================
 // CHART 4-2: TAX RATE COMPARISON (VERTICAL BAR)
 // ============================================
-const Chart42_TaxRateComparison: React.FC<{ homes: Home[] }> = ({ homes }) => {
-  // RELATIVE SCORING: lowest tax rate = 100, highest = 0
-  const rates = homes.map(h => h.propertyTaxRate);
-  const minRate = Math.min(...rates);
-  const maxRate = Math.max(...rates);
-
-  const chartData = homes.map((home) => {
-    // Reverse score: lower rate = higher score
-    const relativeScore = maxRate === minRate ? 50 : ((maxRate - home.propertyTaxRate) / (maxRate - minRate)) * 100;
-    // Apply 5-tier thresholds
-    let score: number;
-    if (relativeScore >= 75) score = 100;
-    else if (relativeScore >= 50) score = 75;
-    else if (relativeScore >= 25) score = 50;
-    else score = 25;
-
-    return {
-      name: home.name,
-      'Tax Rate': home.propertyTaxRate,
-      score: score,
-      fill: home.color,
-    };
-  });
+const Chart42_TaxRateComparison = memo<{ homes: Home[] }>(function Chart42_TaxRateComparison({ homes }) {
+  const { rates, minRate, maxRate, chartData, maxScore, winner } = useMemo(() => {
+    // RELATIVE SCORING: lowest tax rate = 100, highest = 0
+    const rates = homes.map(h => h.propertyTaxRate);
+    const minRate = Math.min(...rates);
+    const maxRate = Math.max(...rates);
+
+    const chartData = homes.map((home) => {
+      // Reverse score: lower rate = higher score
+      const relativeScore = maxRate === minRate ? 50 : ((maxRate - home.propertyTaxRate) / (maxRate - minRate)) * 100;
+      // Apply 5-tier thresholds
+      let score: number;
+      if (relativeScore >= 75) score = 100;
+      else if (relativeScore >= 50) score = 75;
+      else if (relativeScore >= 25) score = 50;
+      else score = 25;
+
+      return {
+        name: home.name,
+        'Tax Rate': home.propertyTaxRate,
+        score: score,
+        fill: home.color,
+      };
+    });
 
-  // Find winner (highest score)
-  const maxScore = Math.max(...chartData.map((d) => d.score));
-  const winner = chartData.find((d) => d.score === maxScore);
+    // Find winner (highest score)
+    const maxScore = Math.max(...chartData.map((d) => d.score));
+    const winner = chartData.find((d) => d.score === maxScore);
+    return { rates, minRate, maxRate, chartData, maxScore, winner };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 4-2 - Tax Rate Comparison');
@@ -384,24 +390,27 @@ const Chart42_TaxRateComparison: React.FC<{ homes: Home[] }> = ({ homes }) => {
       />
     </div>
   );
-};
+});
 
 // ============================================
 // CHART 4-3: HOA VS TAX BURDEN (BUBBLE/SCATTER)
 // ============================================
-const Chart43_HOAVsTaxBurden: React.FC<{ homes: Home[] }> = ({ homes }) => {
-  const chartData = homes.map((home) => ({
-    name: home.name,
-    x: home.annualTaxes,
-    y: home.hoaFeeAnnual,
-    z: home.annualTaxes + home.hoaFeeAnnual,
-    score: scoreTrueCostIndex(home, homes),
-    fill: home.color, // Use property color for consistency
-  }));
-
-  // Find winner (highest score)
-  const maxScore = Math.max(...chartData.map((d) => d.score));
-  const winner = chartData.find((d) => d.score === maxScore);
+const Chart43_HOAVsTaxBurden = memo<{ homes: Home[] }>(function Chart43_HOAVsTaxBurden({ homes }) {
+  const { chartData, maxScore, winner } = useMemo(() => {
+    const chartData = homes.map((home) => ({
+      name: home.name,
+      x: home.annualTaxes,
+      y: home.hoaFeeAnnual,
+      z: home.annualTaxes + home.hoaFeeAnnual,
+      score: scoreTrueCostIndex(home, homes),
+      fill: home.color, // Use property color for consistency
+    }));
+
+    // Find winner (highest score)
+    const maxScore = Math.max(...chartData.map((d) => d.score));
+    const winner = chartData.find((d) => d.score === maxScore);
+    return { chartData, maxScore, winner };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 4-3 - HOA vs Tax Burden');
@@ -489,22 +498,25 @@ const Chart43_HOAVsTaxBurden: React.FC<{ homes: Home[] }> = ({ homes }) => {
       />
     </div>
   );
-};
+});
 
 // ============================================
 // CHART 4-4: OWNERSHIP TYPE SCORE (VERTICAL BAR)
 // ============================================
-const Chart44_OwnershipTypeScore: React.FC<{ homes: Home[] }> = ({ homes }) => {
-  const chartData = homes.map((home) => ({
-    name: home.name,
-    Score: scoreOwnershipType(home.ownershipType),
-    ownershipType: home.ownershipType,
-    fill: home.color,
-  }));
-
-  // Find winner (highest score)
-  const maxScore = Math.max(...chartData.map((d) => d.Score));
-  const winner = chartData.find((d) => d.Score === maxScore);
+const Chart44_OwnershipTypeScore = memo<{ homes: Home[] }>(function Chart44_OwnershipTypeScore({ homes }) {
+  const { chartData, maxScore, winner } = useMemo(() => {
+    const chartData = homes.map((home) => ({
+      name: home.name,
+      Score: scoreOwnershipType(home.ownershipType),
+      ownershipType: home.ownershipType,
+      fill: home.color,
+    }));
+
+    // Find winner (highest score)
+    const maxScore = Math.max(...chartData.map((d) => d.Score));
+    const winner = chartData.find((d) => d.Score === maxScore);
+    return { chartData, maxScore, winner };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 4-4 - Ownership Type Score');
@@ -551,22 +563,25 @@ const Chart44_OwnershipTypeScore: React.FC<{ homes: Home[] }> = ({ homes }) => {
       />
     </div>
   );
-};
+});
 
 // ============================================
 // CHART 4-4: COST DISTRIBUTION - 3 SEPARATE DONUTS
 // ============================================
-const Chart45_CostDistributionDonut: React.FC<{ homes: Home[] }> = ({ homes }) => {
-  // Calculate scores for each property based on total cost
-  const scoresData = homes.map((home) => ({
-    ...home,
-    totalCost: home.annualTaxes + home.hoaFeeAnnual,
-    score: scoreTrueCostIndex(home, homes),
-  }));
-
-  // Find winner (highest score = lowest cost)
-  const maxScore = Math.max(...scoresData.map((d) => d.score));
-  const winner = scoresData.find((d) => d.score === maxScore);
+const Chart45_CostDistributionDonut = memo<{ homes: Home[] }>(function Chart45_CostDistributionDonut({ homes }) {
+  const { scoresData, maxScore, winner } = useMemo(() => {
+    // Calculate scores for each property based on total cost
+    const scoresData = homes.map((home) => ({
+      ...home,
+      totalCost: home.annualTaxes + home.hoaFeeAnnual,
+      score: scoreTrueCostIndex(home, homes),
+    }));
+
+    // Find winner (highest score = lowest cost)
+    const maxScore = Math.max(...scoresData.map((d) => d.score));
+    const winner = scoresData.find((d) => d.score === maxScore);
+    return { scoresData, maxScore, winner };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 4-4 - Cost Distribution: Taxes vs HOA (3 properties)');
@@ -670,22 +685,25 @@ const Chart45_CostDistributionDonut: React.FC<{ homes: Home[] }> = ({ homes }) =
       />
     </div>
   );
-};
+});
 
 // ============================================
 // CHART 4-6: TRUE COST OF OWNERSHIP INDEX (VERTICAL BAR)
 // ============================================
-const Chart46_TrueCostOwnershipIndex: React.FC<{ homes: Home[] }> = ({ homes }) => {
-  const chartData = homes.map((home) => ({
-    name: home.name,
-    Score: scoreTrueCostIndex(home, homes),
-    totalCost: home.annualTaxes + home.hoaFeeAnnual,
-    fill: home.color,
-  }));
-
-  // Find winner (highest score)
-  const maxScore = Math.max(...chartData.map((d) => d.Score));
-  const winner = chartData.find((d) => d.Score === maxScore);
+const Chart46_TrueCostOwnershipIndex = memo<{ homes: Home[] }>(function Chart46_TrueCostOwnershipIndex({ homes }) {
+  const { chartData, maxScore, winner } = useMemo(() => {
+    const chartData = homes.map((home) => ({
+      name: home.name,
+      Score: scoreTrueCostIndex(home, homes),
+      totalCost: home.annualTaxes + home.hoaFeeAnnual,
+      fill: home.color,
+    }));
+
+    // Find winner (highest score)
+    const maxScore = Math.max(...chartData.map((d) => d.Score));
+    const winner = chartData.find((d) => d.Score === maxScore);
+    return { chartData, maxScore, winner };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 4-6 - True Cost of Ownership Index');
@@ -734,22 +752,25 @@ const Chart46_TrueCostOwnershipIndex: React.FC<{ homes: Home[] }> = ({ homes })
       />
     </div>
   );
-};
+});
 
 // ============================================
 // CHART 4-7: MONTHLY VS ANNUAL COST (GROUPED VERTICAL BARS)
 // ============================================
-const Chart47_MonthlyVsAnnualCost: React.FC<{ homes: Home[] }> = ({ homes }) => {
-  const chartData = homes.map((home) => ({
-    name: home.name,
-    Monthly: Math.round((home.annualTaxes + home.hoaFeeAnnual) / 12),
-    Annual: home.annualTaxes + home.hoaFeeAnnual,
-    score: scoreTrueCostIndex(home, homes),
-  }));
-
-  // Find winner (highest score)
-  const maxScore = Math.max(...chartData.map((d) => d.score));
-  const winner = chartData.find((d) => d.score === maxScore);
+const Chart47_MonthlyVsAnnualCost = memo<{ homes: Home[] }>(function Chart47_MonthlyVsAnnualCost({ homes }) {
+  const { chartData, maxScore, winner } = useMemo(() => {
+    const chartData = homes.map((home) => ({
+      name: home.name,
+      Monthly: Math.round((home.annualTaxes + home.hoaFeeAnnual) / 12),
+      Annual: home.annualTaxes + home.hoaFeeAnnual,
+      score: scoreTrueCostIndex(home, homes),
+    }));
+
+    // Find winner (highest score)
+    const maxScore = Math.max(...chartData.map((d) => d.score));
+    const winner = chartData.find((d) => d.score === maxScore);
+    return { chartData, maxScore, winner };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 4-7 - Monthly vs Annual Cost');
@@ -799,60 +820,63 @@ const Chart47_MonthlyVsAnnualCost: React.FC<{ homes: Home[] }> = ({ homes }) =>
       />
     </div>
   );
-};
+});
 
 // ============================================
 // CHART 4-8: FINANCIAL EFFICIENCY RADAR (4-DIMENSIONAL)
 // ============================================
-const Chart48_FinancialEfficiencyRadar: React.FC<{ homes: Home[] }> = ({ homes }) => {
-  const radarData = [
-    {
-      metric: 'HOA Score',
-      ...Object.fromEntries(
-        homes.map((home) => [
-          home.name,
-          scoreHOA(home.hoaFeeAnnual, home.ownershipType),
-        ])
-      ),
-    },
-    {
-      metric: 'Tax Rate',
-      ...Object.fromEntries(
-        homes.map((home) => [home.name, scoreTaxRate(home.propertyTaxRate)])
-      ),
-    },
-    {
-      metric: 'Ownership',
-      ...Object.fromEntries(
-        homes.map((home) => [home.name, scoreOwnershipType(home.ownershipType)])
-      ),
-    },
-    {
-      metric: 'Cost Index',
-      ...Object.fromEntries(
-        homes.map((home) => [home.name, scoreTrueCostIndex(home, homes)])
-      ),
-    },
-  ];
-
-  // Calculate average radar score for each home
-  const avgScores = homes.map((home) => {
-    const scores = [
-      scoreHOA(home.hoaFeeAnnual, home.ownershipType),
-      scoreTaxRate(home.propertyTaxRate),
-      scoreOwnershipType(home.ownershipType),
-      scoreTrueCostIndex(home, homes),
+const Chart48_FinancialEfficiencyRadar = memo<{ homes: Home[] }>(function Chart48_FinancialEfficiencyRadar({ homes }) {
+  const { radarData, avgScores, maxScore, winner } = useMemo(() => {
+    const radarData = [
+      {
+        metric: 'HOA Score',
+        ...Object.fromEntries(
+          homes.map((home) => [
+            home.name,
+            scoreHOA(home.hoaFeeAnnual, home.ownershipType),
+          ])
+        ),
+      },
+      {
+        metric: 'Tax Rate',
+        ...Object.fromEntries(
+          homes.map((home) => [home.name, scoreTaxRate(home.propertyTaxRate)])
+        ),
+      },
+      {
+        metric: 'Ownership',
+        ...Object.fromEntries(
+          homes.map((home) => [home.name, scoreOwnershipType(home.ownershipType)])
+        ),
+      },
+      {
+        metric: 'Cost Index',
+        ...Object.fromEntries(
+          homes.map((home) => [home.name, scoreTrueCostIndex(home, homes)])
+        ),
+      },
     ];
-    return {
-      name: home.name,
-      avgScore: scores.reduce((a, b) => a + b, 0) / scores.length,
-      color: home.color,
-    };
-  });
 
-  // Find winner (highest avg score)
-  const maxScore = Math.max(...avgScores.map((d) => d.avgScore));
-  const winner = avgScores.find((d) => d.avgScore === maxScore);
+    // Calculate average radar score for each home
+    const avgScores = homes.map((home) => {
+      const scores = [
+        scoreHOA(home.hoaFeeAnnual, home.ownershipType),
+        scoreTaxRate(home.propertyTaxRate),
+        scoreOwnershipType(home.ownershipType),
+        scoreTrueCostIndex(home, homes),
+      ];
+      return {
+        name: home.name,
+        avgScore: scores.reduce((a, b) => a + b, 0) / scores.length,
+        color: home.color,
+      };
+    });
+
+    // Find winner (highest avg score)
+    const maxScore = Math.max(...avgScores.map((d) => d.avgScore));
+    const winner = avgScores.find((d) => d.avgScore === maxScore);
+    return { radarData, avgScores, maxScore, winner };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 4-8 - Financial Efficiency Radar');
@@ -901,7 +925,7 @@ const Chart48_FinancialEfficiencyRadar: React.FC<{ homes: Home[] }> = ({ homes }
       />
     </div>
   );
-};
+});
 
 // ============================================
 // MAIN COMPONENT - ALL 8 CHARTS
@@ -4,7 +4,7 @@
  * Score thresholds: 81-100 Excellent, 61-80 Good, 41-60 Average, 21-40 Fair, 0-20 Poor
  */
 
-import { useEffect } from 'react';
+import { useEffect, useMemo, memo } from 'react';
 import {
   RadarChart,
   PolarGrid,
@@ -117,72 +117,75 @@ function scoreLowerIsBetter(values: number[]): number[] {
 // CHART A-1: PROPERTY PROFILE RADAR WITH SMART SCORING
 // Multi-dimensional overlay of all key property metrics
 // ============================================
-function PropertyProfileRadar({ homes }: { homes: Home[] }) {
-  const currentYear = new Date().getFullYear();
-
-  // Calculate DYNAMIC max values (not hardcoded!)
-  const maxBedrooms = Math.max(...homes.map(h => h.bedrooms), 4);
-  const maxBathrooms = Math.max(...homes.map(h => h.totalBathrooms), 4);
-  const maxLivingSqft = Math.max(...homes.map(h => h.livingSqft), 3000);
-  const maxLotAcres = Math.max(...homes.map(h => h.lotSizeAcres), 0.3);
-  const maxGarage = Math.max(...homes.map(h => h.garageSpaces), 3);
-
-  // Calculate scores for each dimension
-  const bedroomScores = scoreHigherIsBetter(homes.map(h => h.bedrooms));
-  const bathroomScores = scoreHigherIsBetter(homes.map(h => h.totalBathrooms));
-  const livingScores = scoreHigherIsBetter(homes.map(h => h.livingSqft));
-  const lotScores = scoreHigherIsBetter(homes.map(h => h.lotSizeAcres));
-  const garageScores = scoreHigherIsBetter(homes.map(h => h.garageSpaces));
-
-  // Newness: newer = better
-  const ages = homes.map(h => currentYear - h.yearBuilt);
-  const newnessScores = ages.map(age => Math.max(0, 100 - (age * 2)));
-
-  // Calculate AGGREGATE RADAR SCORE (average of all 6 dimensions)
-  const aggregateScores = homes.map((_, idx) => {
-    const dimensionScores = [
-      bedroomScores[idx],
-      bathroomScores[idx],
-      livingScores[idx],
-      lotScores[idx],
-      newnessScores[idx],
-      garageScores[idx]
-    ];
-    return Math.round(dimensionScores.reduce((a, b) => a + b, 0) / 6);
-  });
+const PropertyProfileRadar = memo(function PropertyProfileRadar({ homes }: { homes: Home[] }) {
+  const { currentYear, maxBedrooms, maxBathrooms, maxLivingSqft, maxLotAcres, maxGarage, bedroomScores, bathroomScores, livingScores, lotScores, garageScores, ages, newnessScores, aggregateScores, maxAggregateScore, winnerIndices, radarData } = useMemo(() => {
+    const currentYear = new Date().getFullYear();
+
+    // Calculate DYNAMIC max values (not hardcoded!)
+    const maxBedrooms = Math.max(...homes.map(h => h.bedrooms), 4);
+    const maxBathrooms = Math.max(...homes.map(h => h.totalBathrooms), 4);
+    const maxLivingSqft = Math.max(...homes.map(h => h.livingSqft), 3000);
+    const maxLotAcres = Math.max(...homes.map(h => h.lotSizeAcres), 0.3);
+    const maxGarage = Math.max(...homes.map(h => h.garageSpaces), 3);
+
+    // Calculate scores for each dimension
+    const bedroomScores = scoreHigherIsBetter(homes.map(h => h.bedrooms));
+    const bathroomScores = scoreHigherIsBetter(homes.map(h => h.totalBathrooms));
+    const livingScores = scoreHigherIsBetter(homes.map(h => h.livingSqft));
+    const lotScores = scoreHigherIsBetter(homes.map(h => h.lotSizeAcres));
+    const garageScores = scoreHigherIsBetter(homes.map(h => h.garageSpaces));
+
+    // Newness: newer = better
+    const ages = homes.map(h => currentYear - h.yearBuilt);
+    const newnessScores = ages.map(age => Math.max(0, 100 - (age * 2)));
+
+    // Calculate AGGREGATE RADAR SCORE (average of all 6 dimensions)
+    const aggregateScores = homes.map((_, idx) => {
+      const dimensionScores = [
+        bedroomScores[idx],
+        bathroomScores[idx],
+        livingScores[idx],
+        lotScores[idx],
+        newnessScores[idx],
+        garageScores[idx]
+      ];
+      return Math.round(dimensionScores.reduce((a, b) => a + b, 0) / 6);
+    });
 
-  const maxAggregateScore = Math.max(...aggregateScores);
-  const winnerIndices = aggregateScores
-    .map((s, i) => (s === maxAggregateScore ? i : -1))
-    .filter(i => i !== -1);
-
-  // Radar data structure
-  const radarData = [
-    {
-      metric: 'Bedrooms',
-      ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, bedroomScores[i]]))
-    },
-    {
-      metric: 'Bathrooms',
-      ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, bathroomScores[i]]))
-    },
-    {
-      metric: 'Living Sqft',
-      ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, livingScores[i]]))
-    },
-    {
-      metric: 'Lot Size',
-      ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, lotScores[i]]))
-    },
-    {
-      metric: 'Newness',
-      ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, newnessScores[i]]))
-    },
-    {
-      metric: 'Garage',
-      ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, garageScores[i]]))
-    },
-  ];
+    const maxAggregateScore = Math.max(...aggregateScores);
+    const winnerIndices = aggregateScores
+      .map((s, i) => (s === maxAggregateScore ? i : -1))
+      .filter(i => i !== -1);
+
+    // Radar data structure
+    const radarData = [
+      {
+        metric: 'Bedrooms',
+        ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, bedroomScores[i]]))
+      },
+      {
+        metric: 'Bathrooms',
+        ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, bathroomScores[i]]))
+      },
+      {
+        metric: 'Living Sqft',
+        ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, livingScores[i]]))
+      },
+      {
+        metric: 'Lot Size',
+        ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, lotScores[i]]))
+      },
+      {
+        metric: 'Newness',
+        ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, newnessScores[i]]))
+      },
+      {
+        metric: 'Garage',
+        ...Object.fromEntries(homes.map((h, i) => [`prop${i}`, garageScores[i]]))
+      },
+    ];
+    return { currentYear, maxBedrooms, maxBathrooms, maxLivingSqft, maxLotAcres, maxGarage, bedroomScores, bathroomScores, livingScores, lotScores, garageScores, ages, newnessScores, aggregateScores, maxAggregateScore, winnerIndices, radarData };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart A-1: Property Profile Radar - SMART SCORING:');
@@ -314,43 +317,46 @@ function PropertyProfileRadar({ homes }: { homes: Home[] }) {
       </div>
     </div>
   );
-}
+});
 
 // ============================================
 // CHART A-2: HOME/LOT RATIO BUBBLE WITH VALUE SCORING
 // Scatter plot: Lot Size (X) vs Living Space (Y), Bubble Size = Price
 // Score based on home coverage percentage (lower = better, more yard space)
 // ============================================
-function SpaceEfficiencyBubble({ homes }: { homes: Home[] }) {
-  // Calculate home/lot ratio as percentage: (living sqft / lot sqft) * 100
-  // Lower ratio = more yard space = more desirable (except condos/townhouses)
-  const ratios = homes.map(h => {
-    if (!h.lotSizeSqft || h.lotSizeSqft <= 0) return 100; // Worst case for invalid data
-    return (h.livingSqft / h.lotSizeSqft) * 100;
-  });
+const SpaceEfficiencyBubble = memo(function SpaceEfficiencyBubble({ homes }: { homes: Home[] }) {
+  const { ratios, efficiencyScores, maxScore, winnerIndices, bubbleData, prices, minPrice, maxPrice, bubbleRange } = useMemo(() => {
+    // Calculate home/lot ratio as percentage: (living sqft / lot sqft) * 100
+    // Lower ratio = more yard space = more desirable (except condos/townhouses)
+    const ratios = homes.map(h => {
+      if (!h.lotSizeSqft || h.lotSizeSqft <= 0) return 100; // Worst case for invalid data
+      return (h.livingSqft / h.lotSizeSqft) * 100;
+    });
 
-  const efficiencyScores = scoreLowerIsBetter(ratios);
-
-  const maxScore = Math.max(...efficiencyScores);
-  const winnerIndices = efficiencyScores
-    .map((s, i) => (s === maxScore ? i : -1))
-    .filter(i => i !== -1);
-
-  const bubbleData = homes.map((h, idx) => ({
-    name: h.name.split(',')[0],
-    lotSqft: h.lotSizeSqft || 0,
-    livingSqft: h.livingSqft || 0,
-    price: h.listingPrice || 0,
-    ratio: ratios[idx],
-    score: efficiencyScores[idx],
-    color: h.color || '#22c55e',
-  }));
-
-  // Dynamic bubble size range based on price variance
-  const prices = homes.map(h => h.listingPrice || 0).filter(p => p > 0);
-  const minPrice = Math.min(...prices);
-  const maxPrice = Math.max(...prices);
-  const bubbleRange: [number, number] = prices.length > 0 ? [300, 1000] : [500, 500];
+    const efficiencyScores = scoreLowerIsBetter(ratios);
+
+    const maxScore = Math.max(...efficiencyScores);
+    const winnerIndices = efficiencyScores
+      .map((s, i) => (s === maxScore ? i : -1))
+      .filter(i => i !== -1);
+
+    const bubbleData = homes.map((h, idx) => ({
+      name: h.name.split(',')[0],
+      lotSqft: h.lotSizeSqft || 0,
+      livingSqft: h.livingSqft || 0,
+      price: h.listingPrice || 0,
+      ratio: ratios[idx],
+      score: efficiencyScores[idx],
+      color: h.color || '#22c55e',
+    }));
+
+    // Dynamic bubble size range based on price variance
+    const prices = homes.map(h => h.listingPrice || 0).filter(p => p > 0);
+    const minPrice = Math.min(...prices);
+    const maxPrice = Math.max(...prices);
+    const bubbleRange: [number, number] = prices.length > 0 ? [300, 1000] : [500, 500];
+    return { ratios, efficiencyScores, maxScore, winnerIndices, bubbleData, prices, minPrice, maxPrice, bubbleRange };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart A-2: Home/Lot Ratio Bubble - SMART SCORING:');
@@ -493,33 +499,36 @@ function SpaceEfficiencyBubble({ homes }: { homes: Home[] }) {
       </div>
     </div>
   );
-}
+});
 
 // ============================================
 // CHART A-3: TOTAL CAPACITY SCORE (Bedrooms + Bathrooms + Garage)
 // Donut showing capacity allocation with smart scoring
 // ============================================
-function TotalCapacityDonut({ homes }: { homes: Home[] }) {
-  // Calculate total capacity score: bedrooms + bathrooms + garage (all contribute to property utility)
-  const capacities = homes.map(h => h.bedrooms + h.totalBathrooms + h.garageSpaces);
-  const capacityScores = scoreHigherIsBetter(capacities);
-
-  const maxScore = Math.max(...capacityScores);
-  const winnerIndices = capacityScores
-    .map((s, i) => (s === maxScore ? i : -1))
-    .filter(i => i !== -1);
-
-  const donutData = homes.map((h, idx) => ({
-    name: h.name.split(',')[0],
-    totalCapacity: capacities[idx],
-    bedrooms: h.bedrooms,
-    bathrooms: h.totalBathrooms,
-    garage: h.garageSpaces,
-    score: capacityScores[idx],
-    color: h.color || '#22c55e',
-  }));
-
-  const totalCapacity = donutData.reduce((sum, d) => sum + d.totalCapacity, 0);
+const TotalCapacityDonut = memo(function TotalCapacityDonut({ homes }: { homes: Home[] }) {
+  const { capacities, capacityScores, maxScore, winnerIndices, donutData, totalCapacity } = useMemo(() => {
+    // Calculate total capacity score: bedrooms + bathrooms + garage (all contribute to property utility)
+    const capacities = homes.map(h => h.bedrooms + h.totalBathrooms + h.garageSpaces);
+    const capacityScores = scoreHigherIsBetter(capacities);
+
+    const maxScore = Math.max(...capacityScores);
+    const winnerIndices = capacityScores
+      .map((s, i) => (s === maxScore ? i : -1))
+      .filter(i => i !== -1);
+
+    const donutData = homes.map((h, idx) => ({
+      name: h.name.split(',')[0],
+      totalCapacity: capacities[idx],
+      bedrooms: h.bedrooms,
+      bathrooms: h.totalBathrooms,
+      garage: h.garageSpaces,
+      score: capacityScores[idx],
+      color: h.color || '#22c55e',
+    }));
+
+    const totalCapacity = donutData.reduce((sum, d) => sum + d.totalCapacity, 0);
+    return { capacities, capacityScores, maxScore, winnerIndices, donutData, totalCapacity };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart A-3: Total Capacity Donut - SMART SCORING:');
@@ -656,7 +665,7 @@ function TotalCapacityDonut({ homes }: { homes: Home[] }) {
       </div>
     </div>
   );
-}
+});
 
 // ============================================
 // MAIN COMPONENT
@@ -11,7 +11,7 @@
  * - Chart 3-7: Parking Capacity (Field 28)
  */
 
-import { useEffect } from 'react';
+import { useEffect, useMemo, memo } from 'react';
 import { motion } from 'framer-motion';
 import {
   BarChart,
@@ -156,18 +156,21 @@ const formatPercent = (value: number): string => `${(value * 100).toFixed(1)}%`;
 // ============================================
 // CHART 3-1: BEDROOM COMPARISON
 // ============================================
-function BedroomComparison({ homes }: { homes: Home[] }) {
-  const values = homes.map((h) => h.bedrooms);
-  const scores = scoreHigherIsBetter(values);
-  const maxScore = Math.max(...scores);
-
-  const data = homes.map((h, index) => ({
-    name: h.name.split(',')[0],
-    value: h.bedrooms,
-    color: h.color,
-    score: scores[index],
-    index,
-  }));
+const BedroomComparison = memo(function BedroomComparison({ homes }: { homes: Home[] }) {
+  const { values, scores, maxScore, data } = useMemo(() => {
+    const values = homes.map((h) => h.bedrooms);
+    const scores = scoreHigherIsBetter(values);
+    const maxScore = Math.max(...scores);
+
+    const data = homes.map((h, index) => ({
+      name: h.name.split(',')[0],
+      value: h.bedrooms,
+      color: h.color,
+      score: scores[index],
+      index,
+    }));
+    return { values, scores, maxScore, data };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 3-1: Bedroom Comparison - Data Verification:');
@@ -283,23 +286,26 @@ function BedroomComparison({ homes }: { homes: Home[] }) {
       </div>
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 3-2: BATHROOM COMPARISON
 // ============================================
-function BathroomComparison({ homes }: { homes: Home[] }) {
-  const values = homes.map((h) => h.totalBathrooms);
-  const scores = scoreHigherIsBetter(values);
-  const maxScore = Math.max(...scores);
-
-  const data = homes.map((h, index) => ({
-    name: h.name.split(',')[0],
-    value: h.totalBathrooms,
-    color: h.color,
-    score: scores[index],
-    index,
-  }));
+const BathroomComparison = memo(function BathroomComparison({ homes }: { homes: Home[] }) {
+  const { values, scores, maxScore, data } = useMemo(() => {
+    const values = homes.map((h) => h.totalBathrooms);
+    const scores = scoreHigherIsBetter(values);
+    const maxScore = Math.max(...scores);
+
+    const data = homes.map((h, index) => ({
+      name: h.name.split(',')[0],
+      value: h.totalBathrooms,
+      color: h.color,
+      score: scores[index],
+      index,
+    }));
+    return { values, scores, maxScore, data };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 3-2: Bathroom Comparison - Data Verification:');
@@ -403,24 +409,27 @@ function BathroomComparison({ homes }: { homes: Home[] }) {
       </div>
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 3-3: LIVING SPACE SHOWDOWN
 // ============================================
-function LivingSpaceShowdown({ homes }: { homes: Home[] }) {
-  const values = homes.map((h) => h.livingSqft);
-  const scores = scoreHigherIsBetter(values);
-  const maxScore = Math.max(...scores);
-
-  const data = homes.map((h, index) => ({
-    name: h.name.split(',')[0],
-    value: h.livingSqft,
-    pricePerSqft: h.listingPrice && h.livingSqft ? Math.round(h.listingPrice / h.livingSqft) : 0,
-    color: h.color,
-    score: scores[index],
-    index,
-  }));
+const LivingSpaceShowdown = memo(function LivingSpaceShowdown({ homes }: { homes: Home[] }) {
+  const { values, scores, maxScore, data } = useMemo(() => {
+    const values = homes.map((h) => h.livingSqft);
+    const scores = scoreHigherIsBetter(values);
+    const maxScore = Math.max(...scores);
+
+    const data = homes.map((h, index) => ({
+      name: h.name.split(',')[0],
+      value: h.livingSqft,
+      pricePerSqft: h.listingPrice && h.livingSqft ? Math.round(h.listingPrice / h.livingSqft) : 0,
+      color: h.color,
+      score: scores[index],
+      index,
+    }));
+    return { values, scores, maxScore, data };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 3-3: Living Space Showdown - Data Verification:');
@@ -542,24 +551,27 @@ function LivingSpaceShowdown({ homes }: { homes: Home[] }) {
       </div>
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 3-4: LOT SIZE COMPARISON
 // ============================================
-function LotSizeComparison({ homes }: { homes: Home[] }) {
-  const values = homes.map((h) => h.lotSizeSqft);
-  const scores = scoreHigherIsBetter(values);
-  const maxScore = Math.max(...scores);
-
-  const data = homes.map((h, index) => ({
-    name: h.name.split(',')[0],
-    sqft: h.lotSizeSqft,
-    acres: h.lotSizeAcres,
-    color: h.color,
-    score: scores[index],
-    index,
-  }));
+const LotSizeComparison = memo(function LotSizeComparison({ homes }: { homes: Home[] }) {
+  const { values, scores, maxScore, data } = useMemo(() => {
+    const values = homes.map((h) => h.lotSizeSqft);
+    const scores = scoreHigherIsBetter(values);
+    const maxScore = Math.max(...scores);
+
+    const data = homes.map((h, index) => ({
+      name: h.name.split(',')[0],
+      sqft: h.lotSizeSqft,
+      acres: h.lotSizeAcres,
+      color: h.color,
+      score: scores[index],
+      index,
+    }));
+    return { values, scores, maxScore, data };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 3-4: Lot Size Comparison - Data Verification:');
@@ -680,38 +692,41 @@ function LotSizeComparison({ homes }: { homes: Home[] }) {
       </div>
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 3-5: SPACE EFFICIENCY RATIO
 // ============================================
-function SpaceEfficiencyRatio({ homes }: { homes: Home[] }) {
-  const efficiencyRatios = homes.map((h) =>
-    h.livingSqft && h.lotSizeSqft ? h.livingSqft / h.lotSizeSqft : 0
-  );
-
-  // CUSTOM SCORING: Lower coverage = better (more yard space)
-  // >= 50% = 0 (Red/Poor), 40-49% = 25 (Orange/Fair), 30-39% = 50 (Yellow/Average),
-  // 20-29% = 75 (Blue/Good), < 20% = 100 (Green/Excellent)
-  const scores = efficiencyRatios.map((ratio) => {
-    const percent = ratio * 100;
-    if (percent >= 50) return 0;        // Red - Poor (too much lot covered)
-    if (percent >= 40) return 25;       // Orange - Fair
-    if (percent >= 30) return 50;       // Yellow - Average
-    if (percent >= 20) return 75;       // Blue - Good
-    return 100;                          // Green - Excellent (lots of yard space)
-  });
+const SpaceEfficiencyRatio = memo(function SpaceEfficiencyRatio({ homes }: { homes: Home[] }) {
+  const { efficiencyRatios, scores, maxScore, data } = useMemo(() => {
+    const efficiencyRatios = homes.map((h) =>
+      h.livingSqft && h.lotSizeSqft ? h.livingSqft / h.lotSizeSqft : 0
+    );
+
+    // CUSTOM SCORING: Lower coverage = better (more yard space)
+    // >= 50% = 0 (Red/Poor), 40-49% = 25 (Orange/Fair), 30-39% = 50 (Yellow/Average),
+    // 20-29% = 75 (Blue/Good), < 20% = 100 (Green/Excellent)
+    const scores = efficiencyRatios.map((ratio) => {
+      const percent = ratio * 100;
+      if (percent >= 50) return 0;        // Red - Poor (too much lot covered)
+      if (percent >= 40) return 25;       // Orange - Fair
+      if (percent >= 30) return 50;       // Yellow - Average
+      if (percent >= 20) return 75;       // Blue - Good
+      return 100;                          // Green - Excellent (lots of yard space)
+    });
 
-  const maxScore = Math.max(...scores);
+    const maxScore = Math.max(...scores);
 
-  const data = homes.map((h, index) => ({
-    name: h.name.split(',')[0],
-    ratio: efficiencyRatios[index],
-    percent: efficiencyRatios[index] * 100,
-    color: h.color,
-    score: scores[index],
-    index,
-  }));
+    const data = homes.map((h, index) => ({
+      name: h.name.split(',')[0],
+      ratio: efficiencyRatios[index],
+      percent: efficiencyRatios[index] * 100,
+      color: h.color,
+      score: scores[index],
+      index,
+    }));
+    return { efficiencyRatios, scores, maxScore, data };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 3-5: Space Efficiency Ratio - Data Verification:');
@@ -832,37 +847,40 @@ function SpaceEfficiencyRatio({ homes }: { homes: Home[] }) {
       </div>
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 3-6: PROPERTY AGE
 // ============================================
-function PropertyAgeComparison({ homes }: { homes: Home[] }) {
-  const currentYear = new Date().getFullYear();
-  const ages = homes.map((h) => currentYear - h.yearBuilt);
-
-  // CUSTOM SCORING: 100-year lifespan depreciation scale
-  // Each year of age subtracts 1 point from 100
-  // 0 years = 100 pts (Green/Excellent)
-  // 20 years = 80 pts (Blue/Good)
-  // 50 years = 50 pts (Yellow/Average)
-  // 80 years = 20 pts (Orange/Fair)
-  // 100+ years = 0 pts (Red/Poor)
-  const scores = ages.map((age) => {
-    // Each year subtracts 1 point from 100 (100-year lifespan model)
-    return Math.max(0, 100 - age);
-  });
+const PropertyAgeComparison = memo(function PropertyAgeComparison({ homes }: { homes: Home[] }) {
+  const { currentYear, ages, scores, maxScore, data } = useMemo(() => {
+    const currentYear = new Date().getFullYear();
+    const ages = homes.map((h) => currentYear - h.yearBuilt);
+
+    // CUSTOM SCORING: 100-year lifespan depreciation scale
+    // Each year of age subtracts 1 point from 100
+    // 0 years = 100 pts (Green/Excellent)
+    // 20 years = 80 pts (Blue/Good)
+    // 50 years = 50 pts (Yellow/Average)
+    // 80 years = 20 pts (Orange/Fair)
+    // 100+ years = 0 pts (Red/Poor)
+    const scores = ages.map((age) => {
+      // Each year subtracts 1 point from 100 (100-year lifespan model)
+      return Math.max(0, 100 - age);
+    });
 
-  const maxScore = Math.max(...scores);
+    const maxScore = Math.max(...scores);
 
-  const data = homes.map((h, index) => ({
-    name: h.name.split(',')[0],
-    yearBuilt: h.yearBuilt,
-    age: ages[index],
-    color: h.color,
-    score: scores[index],
-    index,
-  }));
+    const data = homes.map((h, index) => ({
+      name: h.name.split(',')[0],
+      yearBuilt: h.yearBuilt,
+      age: ages[index],
+      color: h.color,
+      score: scores[index],
+      index,
+    }));
+    return { currentYear, ages, scores, maxScore, data };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 3-6: Property Age - Data Verification:');
@@ -991,24 +1009,27 @@ function PropertyAgeComparison({ homes }: { homes: Home[] }) {
       </div>
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 3-7: PARKING CAPACITY
 // ============================================
-function ParkingCapacity({ homes }: { homes: Home[] }) {
-  const values = homes.map((h) => h.garageSpaces);
-  const scores = scoreHigherIsBetter(values);
-  const maxScore = Math.max(...scores);
-
-  const data = homes.map((h, index) => ({
-    name: h.name.split(',')[0],
-    spaces: h.garageSpaces,
-    parkingTotal: h.parkingTotal,
-    color: h.color,
-    score: scores[index],
-    index,
-  }));
+const ParkingCapacity = memo(function ParkingCapacity({ homes }: { homes: Home[] }) {
+  const { values, scores, maxScore, data } = useMemo(() => {
+    const values = homes.map((h) => h.garageSpaces);
+    const scores = scoreHigherIsBetter(values);
+    const maxScore = Math.max(...scores);
+
+    const data = homes.map((h, index) => ({
+      name: h.name.split(',')[0],
+      spaces: h.garageSpaces,
+      parkingTotal: h.parkingTotal,
+      color: h.color,
+      score: scores[index],
+      index,
+    }));
+    return { values, scores, maxScore, data };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 3-7: Parking Capacity - Data Verification:');
@@ -1128,7 +1149,7 @@ function ParkingCapacity({ homes }: { homes: Home[] }) {
       </div>
     </motion.div>
   );
-}
+});
 
 // ============================================
 // MAIN COMPONENT: PROPERTY BASICS CHARTS
@@ -19,6 +19,7 @@ import {
   LineElement,
   Filler,
 } from 'chart.js';
+import { useMemo, memo } from 'react';
 
 ChartJS.register(RadialLinearScale, PointElement, LineElement, Filler);
 
@@ -320,12 +321,15 @@ function getConditionColor(score: number): string {
 // ============================================
 // CHART 5-1: SYSTEMS HEALTH RADAR (AGE-BASED SCORING)
 // ============================================
-function SystemsRadar({ homes }: { homes: Home[] }) {
-  const comparisonProperties = homes.slice(0, 3);
-  const currentYear = new Date().getFullYear();
+const SystemsRadar = memo(function SystemsRadar({ homes }: { homes: Home[] }) {
+  const { comparisonProperties, currentYear, anyHasPool } = useMemo(() => {
+    const comparisonProperties = homes.slice(0, 3);
+    const currentYear = new Date().getFullYear();
 
-  // Check if any property has a pool
-  const anyHasPool = comparisonProperties.some(h => h.poolYn === true || (h.poolType && h.poolType !== 'None'));
+    // Check if any property has a pool
+    const anyHasPool = comparisonProperties.some(h => h.poolYn === true || (h.poolType && h.poolType !== 'None'));
+    return { comparisonProperties, currentYear, anyHasPool };
+  }, [homes]);
 
   console.log('\n🔍 ========================================');
   console.log('📊 CHART 5-1: SYSTEMS HEALTH RADAR - AGE-BASED CLUES-SMART SCORING');
@@ -611,14 +615,17 @@ function SystemsRadar({ homes }: { homes: Home[] }) {
       </div>
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 5-3: EXTERIOR CONDITION (CORRECTED - TRUE SCORING & WINNER)
 // ============================================
-function ExteriorCondition({ homes }: { homes: Home[] }) {
-  const currentYear = new Date().getFullYear();
-  const comparisonProperties = homes.slice(0, 3);
+const ExteriorCondition = memo(function ExteriorCondition({ homes }: { homes: Home[] }) {
+  const { currentYear, comparisonProperties } = useMemo(() => {
+    const currentYear = new Date().getFullYear();
+    const comparisonProperties = homes.slice(0, 3);
+    return { currentYear, comparisonProperties };
+  }, [homes]);
 
   console.log('\n🔍 ========================================');
   console.log('📊 CHART 5-3: EXTERIOR CONDITION - DATABASE-CONNECTED SCORING');
@@ -960,7 +967,7 @@ function ExteriorCondition({ homes }: { homes: Home[] }) {
       </div>
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 5-2: REPLACEMENT HORIZON (CORRECTED - TRUE WINNER CALCULATION)
@@ -984,9 +991,12 @@ function getReplacementColor(yearsLeft: number, maxLifespan: number): string {
   return getScoreColor(score);
 }
 
-function ReplacementBars({ homes }: { homes: Home[] }) {
-  const currentYear = new Date().getFullYear();
-  const comparisonProperties = homes.slice(0, 3);
+const ReplacementBars = memo(function ReplacementBars({ homes }: { homes: Home[] }) {
+  const { currentYear, comparisonProperties } = useMemo(() => {
+    const currentYear = new Date().getFullYear();
+    const comparisonProperties = homes.slice(0, 3);
+    return { currentYear, comparisonProperties };
+  }, [homes]);
 
   console.log('\n🔍 ========================================');
   console.log('📊 CHART 5-2: REPLACEMENT HORIZON - DATABASE-CONNECTED CALCULATION');
@@ -1305,7 +1315,7 @@ function ReplacementBars({ homes }: { homes: Home[] }) {
       </div>
     </motion.div>
   );
-}
+});
 
 // ============================================
 // MAIN WRAPPER
@@ -4,7 +4,7 @@
  * Score thresholds: 81-100 Excellent, 61-80 Good, 41-60 Average, 21-40 Fair, 0-20 Poor
  */
 
-import { useEffect } from 'react';
+import { useEffect, useMemo, memo } from 'react';
 import { motion } from 'framer-motion';
 import {
   BarChart,
@@ -190,37 +190,40 @@ const BrainWidget: React.FC<{ score: number }> = ({ score }) => {
 // ============================================
 // CHART 5-4: ROOF TYPE & QUALITY COMPARISON
 // ============================================
-function Chart5_4_RoofQuality({ homes }: { homes: Home[] }) {
-  const propertyData = homes.map((h, idx) => {
-    const roofType = h.roofType || 'Other';
-
-    // FIXED: Case-insensitive partial matching (not exact key lookup)
-    // Matches database values like "Asphalt Shingle", "Clay Tile", "METAL ROOF", etc.
-    let score = 30; // Default for "Other"
-    const typeLower = roofType.toLowerCase();
-
-    if (typeLower.includes('metal')) score = 100;           // 40-70 year lifespan, best overall
-    else if (typeLower.includes('slate')) score = 95;       // 75-100+ year lifespan, longest lasting (CORRECTED from 85)
-    else if (typeLower.includes('tile')) score = 90;        // 50+ year lifespan, excellent
-    else if (typeLower.includes('shingle') || typeLower.includes('asphalt')) score = 60;  // 15-30 year lifespan
-    else if (typeLower.includes('flat')) score = 40;        // 10-20 year lifespan, higher maintenance
-
-    return {
-      id: h.id,
-      name: h.name, // FULL address
-      roofType,
-      score,
-      color: h.color,
-      label: getScoreLabel(score),
-      propertyNum: idx + 1,
-    };
-  });
+const Chart5_4_RoofQuality = memo(function Chart5_4_RoofQuality({ homes }: { homes: Home[] }) {
+  const { propertyData, maxScore, winnerIndices, winner } = useMemo(() => {
+    const propertyData = homes.map((h, idx) => {
+      const roofType = h.roofType || 'Other';
+
+      // FIXED: Case-insensitive partial matching (not exact key lookup)
+      // Matches database values like "Asphalt Shingle", "Clay Tile", "METAL ROOF", etc.
+      let score = 30; // Default for "Other"
+      const typeLower = roofType.toLowerCase();
+
+      if (typeLower.includes('metal')) score = 100;           // 40-70 year lifespan, best overall
+      else if (typeLower.includes('slate')) score = 95;       // 75-100+ year lifespan, longest lasting (CORRECTED from 85)
+      else if (typeLower.includes('tile')) score = 90;        // 50+ year lifespan, excellent
+      else if (typeLower.includes('shingle') || typeLower.includes('asphalt')) score = 60;  // 15-30 year lifespan
+      else if (typeLower.includes('flat')) score = 40;        // 10-20 year lifespan, higher maintenance
+
+      return {
+        id: h.id,
+        name: h.name, // FULL address
+        roofType,
+        score,
+        color: h.color,
+        label: getScoreLabel(score),
+        propertyNum: idx + 1,
+      };
+    });
 
-  const maxScore = Math.max(...propertyData.map(p => p.score));
-  const winnerIndices = propertyData
-    .map((p, i) => (p.score === maxScore ? i : -1))
-    .filter((i) => i !== -1);
-  const winner = propertyData[winnerIndices[0]];
+    const maxScore = Math.max(...propertyData.map(p => p.score));
+    const winnerIndices = propertyData
+      .map((p, i) => (p.score === maxScore ? i : -1))
+      .filter((i) => i !== -1);
+    const winner = propertyData[winnerIndices[0]];
+    return { propertyData, maxScore, winnerIndices, winner };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 5-4: Roof Type & Quality - FIXED CASE-INSENSITIVE MATCHING:');
@@ -357,69 +360,72 @@ function Chart5_4_RoofQuality({ homes }: { homes: Home[] }) {
       <SmartScaleLegend description="Roof types scored by material durability: Metal (100) > Slate (95) > Tile (90) > Shingle (60) > Flat (40) > Other (30)" />
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 5-5: EXTERIOR MATERIAL QUALITY
 // ============================================
-function Chart5_5_ExteriorMaterial({ homes }: { homes: Home[] }) {
-  const propertyData = homes.map((h, idx) => {
-    const material = h.exteriorMaterial || 'Other';
-    const materialLower = material.toLowerCase();
-
-    // Florida-specific exterior material scoring using case-insensitive partial matching
-    let score = 30; // Default for "Other"
-    let displayMaterial = material;
-
-    // Check for material types using partial matching
-    if (materialLower.includes('metal')) {
-      score = 95; // Superior but rare in Florida
-      displayMaterial = 'Metal';
-    } else if (materialLower.includes('concrete block') || materialLower.includes('cmu') || materialLower.includes('block')) {
-      score = 100; // Best for Florida (hurricanes, termites)
-      displayMaterial = 'Concrete Block';
-    } else if (materialLower.includes('fiber cement') || materialLower.includes('hardie') || materialLower.includes('cement board')) {
-      score = 85; // Good modern material
-      displayMaterial = 'Fiber Cement';
-    } else if (materialLower.includes('stucco')) {
-      score = 65; // Good for Florida climate
-      displayMaterial = 'Stucco';
-    } else if (materialLower.includes('frame') || materialLower.includes('wood')) {
-      score = 35; // Inferior for hurricanes
-      displayMaterial = materialLower.includes('wood') ? 'Wood' : 'Frame';
-
-      // SPECIAL RULE: Pre-1945 Frame/Wood = 50 (Historic construction quality)
-      if (h.yearBuilt && h.yearBuilt < 1945) {
-        score = 50;
+const Chart5_5_ExteriorMaterial = memo(function Chart5_5_ExteriorMaterial({ homes }: { homes: Home[] }) {
+  const { propertyData, maxScore, winnerIndices, winners, winnerNames } = useMemo(() => {
+    const propertyData = homes.map((h, idx) => {
+      const material = h.exteriorMaterial || 'Other';
+      const materialLower = material.toLowerCase();
+
+      // Florida-specific exterior material scoring using case-insensitive partial matching
+      let score = 30; // Default for "Other"
+      let displayMaterial = material;
+
+      // Check for material types using partial matching
+      if (materialLower.includes('metal')) {
+        score = 95; // Superior but rare in Florida
+        displayMaterial = 'Metal';
+      } else if (materialLower.includes('concrete block') || materialLower.includes('cmu') || materialLower.includes('block')) {
+        score = 100; // Best for Florida (hurricanes, termites)
+        displayMaterial = 'Concrete Block';
+      } else if (materialLower.includes('fiber cement') || materialLower.includes('hardie') || materialLower.includes('cement board')) {
+        score = 85; // Good modern material
+        displayMaterial = 'Fiber Cement';
+      } else if (materialLower.includes('stucco')) {
+        score = 65; // Good for Florida climate
+        displayMaterial = 'Stucco';
+      } else if (materialLower.includes('frame') || materialLower.includes('wood')) {
+        score = 35; // Inferior for hurricanes
+        displayMaterial = materialLower.includes('wood') ? 'Wood' : 'Frame';
+
+        // SPECIAL RULE: Pre-1945 Frame/Wood = 50 (Historic construction quality)
+        if (h.yearBuilt && h.yearBuilt < 1945) {
+          score = 50;
+        }
+      } else if (materialLower.includes('vinyl') || materialLower.includes('siding')) {
+        score = 10; // Worst of the worst - covers damage, fashion no-no
+        displayMaterial = 'Vinyl';
+      } else if (materialLower.includes('stone') || materialLower.includes('brick')) {
+        score = 50; // Rare/unheard of in Florida
+        displayMaterial = materialLower.includes('stone') ? 'Stone' : 'Brick';
       }
-    } else if (materialLower.includes('vinyl') || materialLower.includes('siding')) {
-      score = 10; // Worst of the worst - covers damage, fashion no-no
-      displayMaterial = 'Vinyl';
-    } else if (materialLower.includes('stone') || materialLower.includes('brick')) {
-      score = 50; // Rare/unheard of in Florida
-      displayMaterial = materialLower.includes('stone') ? 'Stone' : 'Brick';
-    }
-
-    console.log(`  🏠 ${h.name}: "${material}" → "${displayMaterial}" = ${score} ${h.yearBuilt && h.yearBuilt < 1945 ? '(Pre-1945 Historic)' : ''}`)
-
-    return {
-      id: h.id,
-      name: h.name, // FULL address
-      material: displayMaterial,
-      score,
-      color: h.color,
-      label: getScoreLabel(score),
-      propertyNum: idx + 1,
-      yearBuilt: h.yearBuilt, // For debugging
-    };
-  });
 
-  const maxScore = Math.max(...propertyData.map(p => p.score));
-  const winnerIndices = propertyData
-    .map((p, i) => (p.score === maxScore ? i : -1))
-    .filter((i) => i !== -1);
-  const winners = winnerIndices.map(i => propertyData[i]);
-  const winnerNames = winners.map(w => w.name).join(' & ');
+      console.log(`  🏠 ${h.name}: "${material}" → "${displayMaterial}" = ${score} ${h.yearBuilt && h.yearBuilt < 1945 ? '(Pre-1945 Historic)' : ''}`)
+
+      return {
+        id: h.id,
+        name: h.name, // FULL address
+        material: displayMaterial,
+        score,
+        color: h.color,
+        label: getScoreLabel(score),
+        propertyNum: idx + 1,
+        yearBuilt: h.yearBuilt, // For debugging
+      };
+    });
+
+    const maxScore = Math.max(...propertyData.map(p => p.score));
+    const winnerIndices = propertyData
+      .map((p, i) => (p.score === maxScore ? i : -1))
+      .filter((i) => i !== -1);
+    const winners = winnerIndices.map(i => propertyData[i]);
+    const winnerNames = winners.map(w => w.name).join(' & ');
+    return { propertyData, maxScore, winnerIndices, winners, winnerNames };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 5-5: Exterior Material Quality - CARD-BASED DESIGN:');
@@ -557,89 +563,92 @@ function Chart5_5_ExteriorMaterial({ homes }: { homes: Home[] }) {
       />
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 5-6: FOUNDATION TYPE COMPARISON
 // ============================================
-function Chart5_6_Foundation({ homes }: { homes: Home[] }) {
-  const foundationQualityMap: { [key: string]: number } = {
-    'Slab': 100,              // Monolithic slab - best for Florida
-    'Stem Wall': 85,          // Stem wall slab
-    'Post-Tension': 90,       // Post-tension slab
-    'Pier and Beam': 50,      // Older Florida homes
-    'Crawl Space': 40,        // Rare in FL, not ideal
-  };
-
-  const rawValues = homes.map((h) => {
-    const rawFoundation = h.foundation || 'Other';  // ORIGINAL DATABASE VALUE
-    let foundation = rawFoundation;
-
-    // REMAP DATABASE VALUES TO FLORIDA TYPES
-    const foundationLower = foundation.toLowerCase();
-    if (foundationLower.includes('slab') || foundationLower.includes('monolithic') || foundationLower.includes('concrete')) {
-      foundation = 'Slab';  // In Florida: Concrete = Slab = Monolithic Slab
-    } else if (foundationLower.includes('stem wall')) {
-      foundation = 'Stem Wall';
-    } else if (foundationLower.includes('post') || foundationLower.includes('tension')) {
-      foundation = 'Post-Tension';
-    } else if (foundationLower.includes('pier') || foundationLower.includes('beam')) {
-      foundation = 'Pier and Beam';
-    } else if (foundationLower.includes('crawl')) {
-      foundation = 'Crawl Space';
-    }
-
-    const score = foundationQualityMap[foundation] || 50;
-
-    // PROOF OF WIRING - Log every property's database → display → score mapping
-    console.log(`🔍 FOUNDATION WIRING CHECK - ${h.name}:`);
-    console.log(`  📥 RAW DATABASE VALUE: "${rawFoundation}"`);
-    console.log(`  🔄 REMAPPED TO: "${foundation}"`);
-    console.log(`  📊 SCORE ASSIGNED: ${score}/100`);
-    console.log(`  ✅ MAPPING RULE: ${foundationLower.includes('concrete') ? 'Concrete → Slab (Florida standard)' : 'Direct mapping'}`);
-
-    return score;
-  });
-
-  const scores = rawValues;
-  const maxScore = Math.max(...scores);
-  const winnerIndices = scores.map((s, i) => (s === maxScore ? i : -1)).filter((i) => i !== -1);
-
-  const chartData = homes.map((h, idx) => {
-    let foundation = h.foundation || 'Unknown';
-
-    // REMAP FOR DISPLAY (MUST MATCH SCORING LOGIC EXACTLY)
-    const foundationLower = foundation.toLowerCase();
-    if (foundationLower.includes('slab') || foundationLower.includes('monolithic') || foundationLower.includes('concrete')) {
-      foundation = 'Slab';  // In Florida: Concrete = Slab = Monolithic Slab
-    } else if (foundationLower.includes('stem wall')) {
-      foundation = 'Stem Wall';
-    } else if (foundationLower.includes('post') || foundationLower.includes('tension')) {
-      foundation = 'Post-Tension';
-    } else if (foundationLower.includes('pier') || foundationLower.includes('beam')) {
-      foundation = 'Pier and Beam';
-    } else if (foundationLower.includes('crawl')) {
-      foundation = 'Crawl Space';
-    }
-
-    return {
-      name: h.name.split(',')[0],
-      foundation,
-      score: scores[idx],
-      color: h.color,
+const Chart5_6_Foundation = memo(function Chart5_6_Foundation({ homes }: { homes: Home[] }) {
+  const { foundationQualityMap, rawValues, scores, maxScore, winnerIndices, chartData, propertyData, winners, winnerNames } = useMemo(() => {
+    const foundationQualityMap: { [key: string]: number } = {
+      'Slab': 100,              // Monolithic slab - best for Florida
+      'Stem Wall': 85,          // Stem wall slab
+      'Post-Tension': 90,       // Post-tension slab
+      'Pier and Beam': 50,      // Older Florida homes
+      'Crawl Space': 40,        // Rare in FL, not ideal
     };
-  });
 
-  const propertyData = chartData.map((d, idx) => ({
-    ...d,
-    id: homes[idx].id,
-    fullAddress: homes[idx].name,
-    label: getScoreLabel(d.score),
-    propertyNum: idx + 1,
-  }));
+    const rawValues = homes.map((h) => {
+      const rawFoundation = h.foundation || 'Other';  // ORIGINAL DATABASE VALUE
+      let foundation = rawFoundation;
+
+      // REMAP DATABASE VALUES TO FLORIDA TYPES
+      const foundationLower = foundation.toLowerCase();
+      if (foundationLower.includes('slab') || foundationLower.includes('monolithic') || foundationLower.includes('concrete')) {
+        foundation = 'Slab';  // In Florida: Concrete = Slab = Monolithic Slab
+      } else if (foundationLower.includes('stem wall')) {
+        foundation = 'Stem Wall';
+      } else if (foundationLower.includes('post') || foundationLower.includes('tension')) {
+        foundation = 'Post-Tension';
+      } else if (foundationLower.includes('pier') || foundationLower.includes('beam')) {
+        foundation = 'Pier and Beam';
+      } else if (foundationLower.includes('crawl')) {
+        foundation = 'Crawl Space';
+      }
+
+      const score = foundationQualityMap[foundation] || 50;
+
+      // PROOF OF WIRING - Log every property's database → display → score mapping
+      console.log(`🔍 FOUNDATION WIRING CHECK - ${h.name}:`);
+      console.log(`  📥 RAW DATABASE VALUE: "${rawFoundation}"`);
+      console.log(`  🔄 REMAPPED TO: "${foundation}"`);
+      console.log(`  📊 SCORE ASSIGNED: ${score}/100`);
+      console.log(`  ✅ MAPPING RULE: ${foundationLower.includes('concrete') ? 'Concrete → Slab (Florida standard)' : 'Direct mapping'}`);
+
+      return score;
+    });
+
+    const scores = rawValues;
+    const maxScore = Math.max(...scores);
+    const winnerIndices = scores.map((s, i) => (s === maxScore ? i : -1)).filter((i) => i !== -1);
+
+    const chartData = homes.map((h, idx) => {
+      let foundation = h.foundation || 'Unknown';
+
+      // REMAP FOR DISPLAY (MUST MATCH SCORING LOGIC EXACTLY)
+      const foundationLower = foundation.toLowerCase();
+      if (foundationLower.includes('slab') || foundationLower.includes('monolithic') || foundationLower.includes('concrete')) {
+        foundation = 'Slab';  // In Florida: Concrete = Slab = Monolithic Slab
+      } else if (foundationLower.includes('stem wall')) {
+        foundation = 'Stem Wall';
+      } else if (foundationLower.includes('post') || foundationLower.includes('tension')) {
+        foundation = 'Post-Tension';
+      } else if (foundationLower.includes('pier') || foundationLower.includes('beam')) {
+        foundation = 'Pier and Beam';
+      } else if (foundationLower.includes('crawl')) {
+        foundation = 'Crawl Space';
+      }
+
+      return {
+        name: h.name.split(',')[0],
+        foundation,
+        score: scores[idx],
+        color: h.color,
+      };
+    });
+
+    const propertyData = chartData.map((d, idx) => ({
+      ...d,
+      id: homes[idx].id,
+      fullAddress: homes[idx].name,
+      label: getScoreLabel(d.score),
+      propertyNum: idx + 1,
+    }));
 
-  const winners = winnerIndices.map(i => propertyData[i]);
-  const winnerNames = winners.map(w => w.fullAddress).join(' & ');
+    const winners = winnerIndices.map(i => propertyData[i]);
+    const winnerNames = winners.map(w => w.fullAddress).join(' & ');
+    return { foundationQualityMap, rawValues, scores, maxScore, winnerIndices, chartData, propertyData, winners, winnerNames };
+  }, [homes]);
 
   useEffect(() => {
     console.log('═══════════════════════════════════════════════════════════');
@@ -786,7 +795,7 @@ function Chart5_6_Foundation({ homes }: { homes: Home[] }) {
       <SmartScaleLegend description="Foundations scored by quality (Florida-specific): Slab (100) > Post-Tension (90) > Stem Wall (85) > Pier and Beam (50) > Crawl Space (40)" />
     </motion.div>
   );
-}
+});
 
 // ============================================
 // MAIN COMPONENT
@@ -3,7 +3,7 @@
  * Interior features comparison charts for flooring, kitchen, appliances, and fireplaces.
  * Score thresholds: 81-100 Excellent, 61-80 Good, 41-60 Average, 21-40 Fair, 0-20 Poor
  */
-import { useEffect, useState } from 'react';
+import { useEffect, useState, useMemo, memo } from 'react';
 import { motion } from 'framer-motion';
 import { PieChart, Pie, Cell, BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, RadarChart, PolarGrid, PolarAngleAxis, PolarRadiusAxis, Radar, Legend, ScatterChart, Scatter, ComposedChart, ResponsiveContainer, Label } from 'recharts';
 
@@ -187,50 +187,53 @@ const SmartScaleLegend: React.FC<{ description: string }> = ({ description }) =>
 // ============================================
 // CHART 6-2: Flooring Type Comparison (Property Cards)
 // ============================================
-function Chart6_2_FlooringTypeDistribution({ homes }: { homes: Home[] }) {
+const Chart6_2_FlooringTypeDistribution = memo(function Chart6_2_FlooringTypeDistribution({ homes }: { homes: Home[] }) {
   const [hoveredCard, setHoveredCard] = useState<string | null>(null);
 
-  // Flooring scoring map based on material quality
-  const getFlooringScore = (flooringType: string): number => {
-    const flooring = flooringType.toLowerCase();
-    // 81-100 (Green/Excellent): Terrazzo, Marble, Exotic, Hardwood
-    if (flooring.includes('terrazzo') || flooring.includes('terazzo')) return 95;
-    if (flooring.includes('marble')) return 95;
-    if (flooring.includes('exotic')) return 90;
-    if (flooring.includes('hardwood') || flooring.includes('hard wood')) return 85;
-    // 61-80 (Blue/Good): Vinyl laminate
-    if (flooring.includes('vinyl') && flooring.includes('laminate')) return 70;
-    if (flooring.includes('vinyl')) return 70;
-    // 41-60 (Yellow/Average): Ceramic Tile
-    if (flooring.includes('ceramic') || flooring.includes('tile')) return 50;
-    // 21-40 (Orange/Fair): Carpet
-    if (flooring.includes('carpet')) return 30;
-    // 0-20 (Red/Poor): Wood laminate
-    if (flooring.includes('laminate') && flooring.includes('wood')) return 15;
-    if (flooring.includes('laminate')) return 15;
-    // Default for unknown types
-    return 50;
-  };
-
-  const propertyData = homes.map((h, idx) => {
-    const score = getFlooringScore(h.flooringType);
-    return {
-      id: h.id,
-      name: h.name,
-      flooringType: h.flooringType || 'Unknown',
-      score,
-      color: h.color,
-      label: getScoreLabel(score),
-      propertyNum: idx + 1,
+  const { getFlooringScore, propertyData, maxScore, winnerIndices, winners, winnerNames } = useMemo(() => {
+    // Flooring scoring map based on material quality
+    const getFlooringScore = (flooringType: string): number => {
+      const flooring = flooringType.toLowerCase();
+      // 81-100 (Green/Excellent): Terrazzo, Marble, Exotic, Hardwood
+      if (flooring.includes('terrazzo') || flooring.includes('terazzo')) return 95;
+      if (flooring.includes('marble')) return 95;
+      if (flooring.includes('exotic')) return 90;
+      if (flooring.includes('hardwood') || flooring.includes('hard wood')) return 85;
+      // 61-80 (Blue/Good): Vinyl laminate
+      if (flooring.includes('vinyl') && flooring.includes('laminate')) return 70;
+      if (flooring.includes('vinyl')) return 70;
+      // 41-60 (Yellow/Average): Ceramic Tile
+      if (flooring.includes('ceramic') || flooring.includes('tile')) return 50;
+      // 21-40 (Orange/Fair): Carpet
+      if (flooring.includes('carpet')) return 30;
+      // 0-20 (Red/Poor): Wood laminate
+      if (flooring.includes('laminate') && flooring.includes('wood')) return 15;
+      if (flooring.includes('laminate')) return 15;
+      // Default for unknown types
+      return 50;
     };
-  });
 
-  const maxScore = Math.max(...propertyData.map(p => p.score));
-  const winnerIndices = propertyData
-    .map((p, i) => (p.score === maxScore ? i : -1))
-    .filter((i) => i !== -1);
-  const winners = winnerIndices.map(i => propertyData[i]);
-  const winnerNames = winners.map(w => w.name.split(',')[0]).join(' & ');
+    const propertyData = homes.map((h, idx) => {
+      const score = getFlooringScore(h.flooringType);
+      return {
+        id: h.id,
+        name: h.name,
+        flooringType: h.flooringType || 'Unknown',
+        score,
+        color: h.color,
+        label: getScoreLabel(score),
+        propertyNum: idx + 1,
+      };
+    });
+
+    const maxScore = Math.max(...propertyData.map(p => p.score));
+    const winnerIndices = propertyData
+      .map((p, i) => (p.score === maxScore ? i : -1))
+      .filter((i) => i !== -1);
+    const winners = winnerIndices.map(i => propertyData[i]);
+    const winnerNames = winners.map(w => w.name.split(',')[0]).join(' & ');
+    return { getFlooringScore, propertyData, maxScore, winnerIndices, winners, winnerNames };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 6-2: Flooring Type Comparison - CARD-BASED DESIGN:');
@@ -373,61 +376,64 @@ function Chart6_2_FlooringTypeDistribution({ homes }: { homes: Home[] }) {
       <SmartScaleLegend description="Flooring Quality Methodology: Scores assigned based on material durability (lifespan), maintenance requirements, and luxury market appeal. Terrazzo/Marble (95 - 50+ year lifespan, premium luxury), Exotic/Hardwood (85-90 - premium natural materials with 30-50 year lifespan), Vinyl Laminate (70 - durable modern flooring with easy maintenance), Ceramic Tile (50 - standard quality, 20-30 year lifespan), Carpet (30 - higher maintenance, 10-15 year lifespan), Wood Laminate (15 - lower durability, 10-15 year lifespan)." />
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 6-3: Appliance Velocity (Radial Gauges)
 // ============================================
-function Chart6_3_ApplianceCounts({ homes }: { homes: Home[] }) {
+const Chart6_3_ApplianceCounts = memo(function Chart6_3_ApplianceCounts({ homes }: { homes: Home[] }) {
   const [hoveredCard, setHoveredCard] = useState<string | null>(null);
 
-  // Define 8 standard appliances to track
-  const standardAppliances = [
-    { key: 'refrigerator', label: 'Refrigerator', keywords: ['refrigerator', 'fridge'] },
-    { key: 'range', label: 'Range/Stove', keywords: ['range', 'stove', 'oven', 'cooktop'] },
-    { key: 'microwave', label: 'Microwave', keywords: ['microwave'] },
-    { key: 'dishwasher', label: 'Dishwasher', keywords: ['dishwasher'] },
-    { key: 'washer', label: 'Washer', keywords: ['washer', 'washing machine'] },
-    { key: 'dryer', label: 'Dryer', keywords: ['dryer'] },
-    { key: 'disposal', label: 'Garbage Disposal', keywords: ['disposal', 'garbage disposal'] },
-    { key: 'extra', label: 'Extra (Wine Cooler/Ice Maker)', keywords: ['wine', 'ice maker', 'trash compactor', 'water filter'] }
-  ];
-
-  // Appliance scoring based on count (CLUES 0-100)
-  const getApplianceScore = (count: number): number => {
-    return Math.round((count / 8) * 100); // Linear 0-100 based on 8 appliances
-  };
-
-  const propertyData = homes.map((h, idx) => {
-    // Detect which of the 8 standard appliances this property has
-    const detected: Record<string, boolean> = {};
-    standardAppliances.forEach(app => {
-      detected[app.key] = h.appliancesIncluded.some(a =>
-        app.keywords.some(keyword => a.toLowerCase().includes(keyword))
-      );
-    });
-
-    const count = Object.values(detected).filter(Boolean).length;
-    const score = getApplianceScore(count);
-
-    return {
-      id: h.id,
-      name: h.name,
-      count,
-      detectedAppliances: detected,
-      allAppliances: h.appliancesIncluded,
-      score,
-      propertyColor: h.color,
-      propertyNum: idx + 1,
+  const { standardAppliances, getApplianceScore, propertyData, maxScore, winnerIndices, winners, winnerNames } = useMemo(() => {
+    // Define 8 standard appliances to track
+    const standardAppliances = [
+      { key: 'refrigerator', label: 'Refrigerator', keywords: ['refrigerator', 'fridge'] },
+      { key: 'range', label: 'Range/Stove', keywords: ['range', 'stove', 'oven', 'cooktop'] },
+      { key: 'microwave', label: 'Microwave', keywords: ['microwave'] },
+      { key: 'dishwasher', label: 'Dishwasher', keywords: ['dishwasher'] },
+      { key: 'washer', label: 'Washer', keywords: ['washer', 'washing machine'] },
+      { key: 'dryer', label: 'Dryer', keywords: ['dryer'] },
+      { key: 'disposal', label: 'Garbage Disposal', keywords: ['disposal', 'garbage disposal'] },
+      { key: 'extra', label: 'Extra (Wine Cooler/Ice Maker)', keywords: ['wine', 'ice maker', 'trash compactor', 'water filter'] }
+    ];
+
+    // Appliance scoring based on count (CLUES 0-100)
+    const getApplianceScore = (count: number): number => {
+      return Math.round((count / 8) * 100); // Linear 0-100 based on 8 appliances
     };
-  });
 
-  const maxScore = Math.max(...propertyData.map(p => p.score));
-  const winnerIndices = propertyData
-    .map((p, i) => (p.score === maxScore ? i : -1))
-    .filter((i) => i !== -1);
-  const winners = winnerIndices.map(i => propertyData[i]);
-  const winnerNames = winners.map(w => w.name.split(',')[0]).join(' & ');
+    const propertyData = homes.map((h, idx) => {
+      // Detect which of the 8 standard appliances this property has
+      const detected: Record<string, boolean> = {};
+      standardAppliances.forEach(app => {
+        detected[app.key] = h.appliancesIncluded.some(a =>
+          app.keywords.some(keyword => a.toLowerCase().includes(keyword))
+        );
+      });
+
+      const count = Object.values(detected).filter(Boolean).length;
+      const score = getApplianceScore(count);
+
+      return {
+        id: h.id,
+        name: h.name,
+        count,
+        detectedAppliances: detected,
+        allAppliances: h.appliancesIncluded,
+        score,
+        propertyColor: h.color,
+        propertyNum: idx + 1,
+      };
+    });
+
+    const maxScore = Math.max(...propertyData.map(p => p.score));
+    const winnerIndices = propertyData
+      .map((p, i) => (p.score === maxScore ? i : -1))
+      .filter((i) => i !== -1);
+    const winners = winnerIndices.map(i => propertyData[i]);
+    const winnerNames = winners.map(w => w.name.split(',')[0]).join(' & ');
+    return { standardAppliances, getApplianceScore, propertyData, maxScore, winnerIndices, winners, winnerNames };
+  }, [homes]);
 
   useEffect(() => {
     console.log('🔍 Chart 6-3: Appliance Count Scoring - CLUES-SMART SCORING:');
@@ -626,78 +632,81 @@ function Chart6_3_ApplianceCounts({ homes }: { homes: Home[] }) {
       <SmartScaleLegend description="Appliance Scoring Methodology: Linear calculation based on count of 8 standard modern appliances (Refrigerator, Range/Stove, Microwave, Dishwasher, Washer, Dryer, Garbage Disposal, Extra/Wine Cooler). Formula: Score = (count ÷ 8) × 100. Complete appliance packages significantly increase property value, rental appeal, and move-in convenience. Examples: 8/8 appliances = 100 (Excellent), 6/8 = 75 (Good), 4/8 = 50 (Average), 2/8 = 25 (Fair)." />
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 6-4: Kitchen Features Scoring (Radar)
 // ============================================
-function Chart6_4_KitchenFeatures({ homes }: { homes: Home[] }) {
+const Chart6_4_KitchenFeatures = memo(function Chart6_4_KitchenFeatures({ homes }: { homes: Home[] }) {
   const [hoveredCard, setHoveredCard] = useState<string | null>(null);
 
-  // LUXURY FEATURE DETECTION
-  const detectLuxuryAppliances = (text: string) => {
-    const lower = text.toLowerCase();
-    return {
-      wolfViking: lower.includes('wolf') || lower.includes('viking'),
-      subZero: lower.includes('sub-zero') || lower.includes('sub zero') || lower.includes('subzero'),
-      restaurantHood: (lower.includes('restaurant') || lower.includes('commercial')) && lower.includes('hood'),
-      inductionGas: lower.includes('induction') || (lower.includes('gas') && lower.includes('cooktop')),
-      miele: lower.includes('miele')
+  const { detectLuxuryAppliances, detectLuxuryFinishes, detectLayout, propertyData, maxScore, winnerIndices } = useMemo(() => {
+    // LUXURY FEATURE DETECTION
+    const detectLuxuryAppliances = (text: string) => {
+      const lower = text.toLowerCase();
+      return {
+        wolfViking: lower.includes('wolf') || lower.includes('viking'),
+        subZero: lower.includes('sub-zero') || lower.includes('sub zero') || lower.includes('subzero'),
+        restaurantHood: (lower.includes('restaurant') || lower.includes('commercial')) && lower.includes('hood'),
+        inductionGas: lower.includes('induction') || (lower.includes('gas') && lower.includes('cooktop')),
+        miele: lower.includes('miele')
+      };
     };
-  };
-
-  const detectLuxuryFinishes = (text: string) => {
-    const lower = text.toLowerCase();
-    return {
-      solidSurface: lower.includes('quartz') || lower.includes('granite') || lower.includes('marble') || lower.includes('solid surface'),
-      pantry: lower.includes('pantry') || lower.includes('butler'),
-      quietClose: lower.includes('soft close') || lower.includes('soft-close') || lower.includes('quiet close') || lower.includes('quiet-close'),
-      solidCabinets: (lower.includes('solid wood') || lower.includes('custom')) && lower.includes('cabinet'),
-      builtIns: lower.includes('built-in') || lower.includes('builtin') || lower.includes('built in')
+
+    const detectLuxuryFinishes = (text: string) => {
+      const lower = text.toLowerCase();
+      return {
+        solidSurface: lower.includes('quartz') || lower.includes('granite') || lower.includes('marble') || lower.includes('solid surface'),
+        pantry: lower.includes('pantry') || lower.includes('butler'),
+        quietClose: lower.includes('soft close') || lower.includes('soft-close') || lower.includes('quiet close') || lower.includes('quiet-close'),
+        solidCabinets: (lower.includes('solid wood') || lower.includes('custom')) && lower.includes('cabinet'),
+        builtIns: lower.includes('built-in') || lower.includes('builtin') || lower.includes('built in')
+      };
     };
-  };
-
-  const detectLayout = (text: string): { type: string; multiplier: number; color: string } => {
-    const lower = text.toLowerCase();
-    if (lower.includes('island') && lower.includes('open')) return { type: 'Open with Island', multiplier: 1.0, color: '#4CAF50' };
-    if (lower.includes('open')) return { type: 'Open Layout', multiplier: 0.90, color: '#2196F3' };
-    if (lower.includes('rectangular')) return { type: 'Rectangular', multiplier: 0.75, color: '#FFEB3B' };
-    if (lower.includes('galley')) return { type: 'Galley', multiplier: 0.60, color: '#FF9800' };
-    return { type: 'Small/Closed', multiplier: 0.40, color: '#FF4444' };
-  };
-
-  // CALCULATE PROPERTY DATA WITH CLUES SCORING
-  const propertyData = homes.map(h => {
-    const appliances = detectLuxuryAppliances(h.kitchenFeatures);
-    const finishes = detectLuxuryFinishes(h.kitchenFeatures);
-    const layout = detectLayout(h.kitchenFeatures);
-
-    const applianceCount = Object.values(appliances).filter(Boolean).length;
-    const finishCount = Object.values(finishes).filter(Boolean).length;
-    const totalFeatures = applianceCount + finishCount;
-
-    const baseScore = totalFeatures * 10; // 0-100
-    const finalScore = Math.round(baseScore * layout.multiplier);
-
-    return {
-      id: h.id,
-      name: h.name,
-      color: h.color,
-      rawText: h.kitchenFeatures,
-      appliances,
-      finishes,
-      layout,
-      applianceCount,
-      finishCount,
-      totalFeatures,
-      baseScore,
-      finalScore
+
+    const detectLayout = (text: string): { type: string; multiplier: number; color: string } => {
+      const lower = text.toLowerCase();
+      if (lower.includes('island') && lower.includes('open')) return { type: 'Open with Island', multiplier: 1.0, color: '#4CAF50' };
+      if (lower.includes('open')) return { type: 'Open Layout', multiplier: 0.90, color: '#2196F3' };
+      if (lower.includes('rectangular')) return { type: 'Rectangular', multiplier: 0.75, color: '#FFEB3B' };
+      if (lower.includes('galley')) return { type: 'Galley', multiplier: 0.60, color: '#FF9800' };
+      return { type: 'Small/Closed', multiplier: 0.40, color: '#FF4444' };
     };
-  });
 
-  // FIND WINNER
-  const maxScore = Math.max(...propertyData.map(p => p.finalScore));
-  const winnerIndices = propertyData.map((p, i) => p.finalScore === maxScore ? i : -1).filter(i => i !== -1);
+    // CALCULATE PROPERTY DATA WITH CLUES SCORING
+    const propertyData = homes.map(h => {
+      const appliances = detectLuxuryAppliances(h.kitchenFeatures);
+      const finishes = detectLuxuryFinishes(h.kitchenFeatures);
+      const layout = detectLayout(h.kitchenFeatures);
+
+      const applianceCount = Object.values(appliances).filter(Boolean).length;
+      const finishCount = Object.values(finishes).filter(Boolean).length;
+      const totalFeatures = applianceCount + finishCount;
+
+      const baseScore = totalFeatures * 10; // 0-100
+      const finalScore = Math.round(baseScore * layout.multiplier);
+
+      return {
+        id: h.id,
+        name: h.name,
+        color: h.color,
+        rawText: h.kitchenFeatures,
+        appliances,
+        finishes,
+        layout,
+        applianceCount,
+        finishCount,
+        totalFeatures,
+        baseScore,
+        finalScore
+      };
+    });
+
+    // FIND WINNER
+    const maxScore = Math.max(...propertyData.map(p => p.finalScore));
+    const winnerIndices = propertyData.map((p, i) => p.finalScore === maxScore ? i : -1).filter(i => i !== -1);
+    return { detectLuxuryAppliances, detectLuxuryFinishes, detectLayout, propertyData, maxScore, winnerIndices };
+  }, [homes]);
 
   // DATA WIRING PROOF - CONSOLE LOGGING
   useEffect(() => {
@@ -893,58 +902,61 @@ function Chart6_4_KitchenFeatures({ homes }: { homes: Home[] }) {
       <SmartScaleLegend description="Luxury Kitchen Scoring Methodology: Score = (Feature Count × 10) × Layout Multiplier. Features tracked: 5 Luxury Appliances (Wolf/Viking Stove, Sub-Zero Fridge, Restaurant Hood, Induction/Gas Cooktop, Miele Dishwasher) + 5 Luxury Finishes (Solid Surface Counters, Pantry, Quiet-Close Drawers, Solid Wood Cabinets, Built-in Features). Layout Multipliers: Open with Island (×1.0), Open Layout (×0.90), Rectangular (×0.75), Galley (×0.60), Small/Closed (×0.40). Example: 8 features in Open Island kitchen = (8 × 10) × 1.0 = 80 (Good). Maximum possible score: 100 (all 10 features in Open Island layout)." />
     </motion.div>
   );
-}
+});
 
 // ============================================
 // CHART 6-5: Architectural Features (Property Cards)
 // ============================================
-function Chart6_5_ArchitecturalFeatures({ homes }: { homes: Home[] }) {
+const Chart6_5_ArchitecturalFeatures = memo(function Chart6_5_ArchitecturalFeatures({ homes }: { homes: Home[] }) {
   const [hoveredCard, setHoveredCard] = useState<string | null>(null);
 
-  // Feature labels for Field 167
-  const featureLabels: Record<string, string> = {
-    'Cathedral Ceiling(s)': 'Cathedral Ceiling(s)',
-    'Walk-In Closet(s)': 'Walk-In Closet(s)',
-    'Primary Bedroom Main Floor': 'Primary Bedroom Main Floor',
-    'Open Floor Plan': 'Open Floor Plan',
-    'Crown Molding': 'Crown Molding',
-    'Skylight(s)': 'Skylight(s)',
-    'Wet Bar': 'Wet Bar',
-    'Built-in Features': 'Built-in Features'
-  };
-
-  // Detect architectural features for each property
-  const propertyData = homes.map(home => {
-    const features = home.interiorFeatures || [];
-
-    // Detect which features are present
-    const detectedFeatures: Record<string, boolean> = {
-      'Cathedral Ceiling(s)': features.includes('Cathedral Ceiling(s)'),
-      'Walk-In Closet(s)': features.includes('Walk-In Closet(s)'),
-      'Primary Bedroom Main Floor': features.includes('Primary Bedroom Main Floor'),
-      'Open Floor Plan': features.includes('Open Floor Plan'),
-      'Crown Molding': features.includes('Crown Molding'),
-      'Skylight(s)': features.includes('Skylight(s)'),
-      'Wet Bar': features.includes('Wet Bar'),
-      'Built-in Features': features.includes('Built-in Features')
+  const { featureLabels, propertyData, maxScore, winnerIndices } = useMemo(() => {
+    // Feature labels for Field 167
+    const featureLabels: Record<string, string> = {
+      'Cathedral Ceiling(s)': 'Cathedral Ceiling(s)',
+      'Walk-In Closet(s)': 'Walk-In Closet(s)',
+      'Primary Bedroom Main Floor': 'Primary Bedroom Main Floor',
+      'Open Floor Plan': 'Open Floor Plan',
+      'Crown Molding': 'Crown Molding',
+      'Skylight(s)': 'Skylight(s)',
+      'Wet Bar': 'Wet Bar',
+      'Built-in Features': 'Built-in Features'
     };
 
-    const featureCount = Object.values(detectedFeatures).filter(Boolean).length;
-    const score = Math.round((featureCount / 8) * 100); // CLUES 0-100 scoring
-
-    return {
-      id: home.id || home.name,
-      name: home.name,
-      color: home.color,
-      features: detectedFeatures,
-      featureCount,
-      score
-    };
-  });
+    // Detect architectural features for each property
+    const propertyData = homes.map(home => {
+      const features = home.interiorFeatures || [];
+
+      // Detect which features are present
+      const detectedFeatures: Record<string, boolean> = {
+        'Cathedral Ceiling(s)': features.includes('Cathedral Ceiling(s)'),
+        'Walk-In Closet(s)': features.includes('Walk-In Closet(s)'),
+        'Primary Bedroom Main Floor': features.includes('Primary Bedroom Main Floor'),
+        'Open Floor Plan': features.includes('Open Floor Plan'),
+        'Crown Molding': features.includes('Crown Molding'),
+        'Skylight(s)': features.includes('Skylight(s)'),
+        'Wet Bar': features.includes('Wet Bar'),
+        'Built-in Features': features.includes('Built-in Features')
+      };
+
+      const featureCount = Object.values(detectedFeatures).filter(Boolean).length;
+      const score = Math.round((featureCount / 8) * 100); // CLUES 0-100 scoring
+
+      return {
+        id: home.id || home.name,
+        name: home.name,
+        color: home.color,
+        features: detectedFeatures,
+        featureCount,
+        score
+      };
+    });
 
-  // Find winner
-  const maxScore = Math.max(...propertyData.map(p => p.score));
-  const winnerIndices = propertyData.map((p, i) => p.score === maxScore ? i : -1).filter(i => i !== -1);
+    // Find winner
+    const maxScore = Math.max(...propertyData.map(p => p.score));
+    const winnerIndices = propertyData.map((p, i) => p.score === maxScore ? i : -1).filter(i => i !== -1);
+    return { featureLabels, propertyData, maxScore, winnerIndices };
+  }, [homes]);
 
   // Console logging for data wiring proof
   useEffect(() => {
@@ -1112,7 +1124,7 @@ function Chart6_5_ArchitecturalFeatures({ homes }: { homes: Home[] }) {
       <SmartScaleLegend description="Architectural Features Scoring Methodology: Formula: Score = (Feature Count ÷ 8) × 100. Features tracked: (1) Cathedral Ceiling(s), (2) Walk-In Closet(s), (3) Primary Bedroom Main Floor, (4) Open Floor Plan, (5) Crown Molding, (6) Skylight(s), (7) Wet Bar, (8) Built-in Features. Each feature adds 12.5 points to the score. These premium design elements significantly increase property value, luxury appeal, and buyer desirability in the Florida real estate market. Examples: 4/8 features = 50 (Average), 6/8 features = 75 (Good), 8/8 features = 100 (Excellent)." />
     </motion.div>
   );
-}
+});
 
 // ============================================
 // MAIN COMPONENT: Section6_InteriorFeaturesCharts
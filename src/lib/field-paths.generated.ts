@@ -0,0 +1,192 @@
+/**
+ * Field-path lookup: full field key -> [Property group, property name].
+ *
+ * GENERATED by scripts/generate_field_paths.py from src/types/fields-schema.ts
+ * and src/lib/field-normalizer.ts - DO NOT EDIT. It is regenerated before
+ * every scripts/run_codemods.py sweep, or run the script after a schema change.
+ *
+ * Module-level and frozen: built once at import, so lookups allocate nothing.
+ */
+
+export type FieldPath = readonly [group: string, prop: string];
+
+const paths: Record<string, FieldPath> = {
+  // Address & Identity
+  '1_full_address': ['address', 'fullAddress'],
+  '2_mls_primary': ['address', 'mlsPrimary'],
+  '3_new_construction_yn': ['address', 'newConstructionYN'],
+  '4_listing_status': ['address', 'listingStatus'],
+  '5_listing_date': ['address', 'listingDate'],
+  '6_neighborhood': ['address', 'neighborhoodName'],
+  '7_county': ['address', 'county'],
+  '8_zip_code': ['address', 'zipCode'],
+  '9_parcel_id': ['details', 'parcelId'],
+  // Pricing & Value
+  '10_listing_price': ['address', 'listingPrice'],
+  '11_price_per_sqft': ['address', 'pricePerSqft'],
+  '12_market_value_estimate': ['details', 'marketValueEstimate'],
+  '13_last_sale_date': ['details', 'lastSaleDate'],
+  '14_last_sale_price': ['details', 'lastSalePrice'],
+  '15_assessed_value': ['details', 'assessedValue'],
+  '16_avms': ['financial', 'avms'],
+  '16a_zestimate': ['financial', 'zestimate'],
+  '16b_redfin_estimate': ['financial', 'redfinEstimate'],
+  '16c_first_american_avm': ['financial', 'firstAmericanAvm'],
+  '16d_quantarium_avm': ['financial', 'quantariumAvm'],
+  '16e_ice_avm': ['financial', 'iceAvm'],
+  '16f_collateral_analytics_avm': ['financial', 'collateralAnalyticsAvm'],
+  // Property Basics
+  '17_bedrooms': ['details', 'bedrooms'],
+  '18_full_bathrooms': ['details', 'fullBathrooms'],
+  '19_half_bathrooms': ['details', 'halfBathrooms'],
+  '20_total_bathrooms': ['details', 'totalBathrooms'],
+  '21_living_sqft': ['details', 'livingSqft'],
+  '22_total_sqft_under_roof': ['details', 'totalSqftUnderRoof'],
+  '23_lot_size_sqft': ['details', 'lotSizeSqft'],
+  '24_lot_size_acres': ['details', 'lotSizeAcres'],
+  '25_year_built': ['details', 'yearBuilt'],
+  '26_property_type': ['details', 'propertyType'],
+  '27_stories': ['details', 'stories'],
+  '28_garage_spaces': ['details', 'garageSpaces'],
+  '29_parking_total': ['details', 'parkingTotal'],
+  // HOA & Taxes
+  '30_hoa_yn': ['details', 'hoaYn'],
+  '31_association_fee': ['details', 'associationFeeAnnualized'],
+  '32_hoa_name': ['details', 'hoaName'],
+  '33_hoa_includes': ['details', 'hoaIncludes'],
+  '34_ownership_type': ['details', 'ownershipType'],
+  '35_annual_taxes': ['details', 'annualTaxes'],
+  '36_tax_year': ['details', 'taxYear'],
+  '37_property_tax_rate': ['financial', 'propertyTaxRate'],
+  '38_tax_exemptions': ['financial', 'taxExemptions'],
+  // Structure & Systems
+  '39_roof_type': ['structural', 'roofType'],
+  '40_roof_age_est': ['structural', 'roofAgeEst'],
+  '41_exterior_material': ['structural', 'exteriorMaterial'],
+  '42_foundation': ['structural', 'foundation'],
+  '43_water_heater_type': ['structural', 'waterHeaterType'],
+  '44_garage_type': ['structural', 'garageType'],
+  '45_hvac_type': ['structural', 'hvacType'],
+  '46_hvac_age': ['structural', 'hvacAge'],
+  '47_laundry_type': ['structural', 'laundryType'],
+  '48_interior_condition': ['structural', 'interiorCondition'],
+  // Interior Features
+  '49_flooring_type': ['structural', 'flooringType'],
+  '50_kitchen_features': ['structural', 'kitchenFeatures'],
+  '51_appliances_included': ['structural', 'appliancesIncluded'],
+  '52_fireplace_yn': ['structural', 'fireplaceYn'],
+  '53_primary_br_location': ['structural', 'primaryBrLocation'],
+  // Exterior Features
+  '54_pool_yn': ['structural', 'poolYn'],
+  '55_pool_type': ['structural', 'poolType'],
+  '56_deck_patio': ['structural', 'deckPatio'],
+  '57_fence': ['structural', 'fence'],
+  '58_landscaping': ['structural', 'landscaping'],
+  // Permits & Renovations
+  '59_recent_renovations': ['structural', 'recentRenovations'],
+  '60_permit_history_roof': ['structural', 'permitHistoryRoof'],
+  '61_permit_history_hvac': ['structural', 'permitHistoryHvac'],
+  '62_permit_history_other': ['structural', 'permitHistoryPoolAdditions'],
+  // Assigned Schools
+  '63_school_district': ['location', 'schoolDistrictName'],
+  '64_elevation_feet': ['location', 'elevationFeet'],
+  '65_elementary_school': ['location', 'assignedElementary'],
+  '66_elementary_rating': ['location', 'elementaryRating'],
+  '67_elementary_distance_mi': ['location', 'elementaryDistanceMiles'],
+  '68_middle_school': ['location', 'assignedMiddle'],
+  '69_middle_rating': ['location', 'middleRating'],
+  '70_middle_distance_mi': ['location', 'middleDistanceMiles'],
+  '71_high_school': ['location', 'assignedHigh'],
+  '72_high_rating': ['location', 'highRating'],
+  '73_high_distance_mi': ['location', 'highDistanceMiles'],
+  // Location Scores
+  '74_walk_score': ['location', 'walkScore'],
+  '75_transit_score': ['location', 'transitScore'],
+  '76_bike_score': ['location', 'bikeScore'],
+  '77_safety_score': ['location', 'safetyScore'],
+  '78_noise_level': ['location', 'noiseLevel'],
+  '79_traffic_level': ['location', 'trafficLevel'],
+  '80_walkability_description': ['location', 'walkabilityDescription'],
+  '81_public_transit_access': ['location', 'publicTransitAccess'],
+  '82_commute_to_city_center': ['location', 'commuteTimeCityCenter'],
+  // Distances & Amenities
+  '83_distance_grocery_mi': ['location', 'distanceGroceryMiles'],
+  '84_distance_hospital_mi': ['location', 'distanceHospitalMiles'],
+  '85_distance_airport_mi': ['location', 'distanceAirportMiles'],
+  '86_distance_park_mi': ['location', 'distanceParkMiles'],
+  '87_distance_beach_mi': ['location', 'distanceBeachMiles'],
+  // Safety & Crime
+  '88_violent_crime_index': ['location', 'crimeIndexViolent'],
+  '89_property_crime_index': ['location', 'crimeIndexProperty'],
+  '90_neighborhood_safety_rating': ['location', 'neighborhoodSafetyRating'],
+  // Market & Investment Data
+  '91_median_home_price_neighborhood': ['financial', 'medianHomePriceNeighborhood'],
+  '92_price_per_sqft_recent_avg': ['financial', 'pricePerSqftRecentAvg'],
+  '93_price_to_rent_ratio': ['financial', 'priceToRentRatio'],
+  '94_price_vs_median_percent': ['financial', 'priceVsMedianPercent'],
+  '95_days_on_market_avg': ['financial', 'daysOnMarketAvg'],
+  '96_inventory_surplus': ['financial', 'inventorySurplus'],
+  '97_insurance_est_annual': ['financial', 'insuranceEstAnnual'],
+  '98_rental_estimate_monthly': ['financial', 'rentalEstimateMonthly'],
+  '99_rental_yield_est': ['financial', 'rentalYieldEst'],
+  '100_vacancy_rate_neighborhood': ['financial', 'vacancyRateNeighborhood'],
+  '101_cap_rate_est': ['financial', 'capRateEst'],
+  '102_financing_terms': ['financial', 'financingTerms'],
+  '103_comparable_sales': ['financial', 'comparableSalesLast3'],
+  // Utilities & Connectivity
+  '104_electric_provider': ['utilities', 'electricProvider'],
+  '105_avg_electric_bill': ['utilities', 'avgElectricBill'],
+  '106_water_provider': ['utilities', 'waterProvider'],
+  '107_avg_water_bill': ['utilities', 'avgWaterBill'],
+  '108_sewer_provider': ['utilities', 'sewerProvider'],
+  '109_natural_gas': ['utilities', 'naturalGas'],
+  '110_trash_provider': ['utilities', 'trashProvider'],
+  '111_internet_providers_top3': ['utilities', 'internetProvidersTop3'],
+  '112_max_internet_speed': ['utilities', 'maxInternetSpeed'],
+  '113_fiber_available': ['utilities', 'fiberAvailable'],
+  '114_cable_tv_provider': ['utilities', 'cableTvProvider'],
+  '115_cell_coverage_quality': ['utilities', 'cellCoverageQuality'],
+  '116_emergency_services_distance': ['utilities', 'emergencyServicesDistance'],
+  // Environment & Risk
+  '117_air_quality_index': ['utilities', 'airQualityIndexCurrent'],
+  '118_air_quality_grade': ['utilities', 'airQualityGrade'],
+  '119_flood_zone': ['utilities', 'floodZone'],
+  '120_flood_risk_level': ['utilities', 'floodRiskLevel'],
+  '121_climate_risk': ['utilities', 'climateRiskWildfireFlood'],
+  '122_wildfire_risk': ['utilities', 'wildfireRisk'],
+  '123_earthquake_risk': ['utilities', 'earthquakeRisk'],
+  '124_hurricane_risk': ['utilities', 'hurricaneRisk'],
+  '125_tornado_risk': ['utilities', 'tornadoRisk'],
+  '126_radon_risk': ['utilities', 'radonRisk'],
+  '127_superfund_site_nearby': ['utilities', 'superfundNearby'],
+  '128_sea_level_rise_risk': ['utilities', 'seaLevelRiseRisk'],
+  '129_noise_level_db_est': ['utilities', 'noiseLevelDbEst'],
+  '130_solar_potential': ['utilities', 'solarPotential'],
+  // Additional Features
+  '131_view_type': ['utilities', 'viewType'],
+  '132_lot_features': ['utilities', 'lotFeatures'],
+  '133_ev_charging': ['utilities', 'evChargingYn'],
+  '134_smart_home_features': ['utilities', 'smartHomeFeatures'],
+  '135_accessibility_modifications': ['utilities', 'accessibilityMods'],
+  '136_pet_policy': ['utilities', 'petPolicy'],
+  '137_age_restrictions': ['utilities', 'ageRestrictions'],
+  '138_special_assessments': ['financial', 'specialAssessments'],
+  // Market Performance
+  '169_months_of_inventory': ['marketPerformance', 'monthsOfInventory'],
+  '170_new_listings_30d': ['marketPerformance', 'newListings30d'],
+  '171_homes_sold_30d': ['marketPerformance', 'homesSold30d'],
+  '172_median_dom_zip': ['marketPerformance', 'medianDomZip'],
+  '173_price_reduced_percent': ['marketPerformance', 'priceReducedPercent'],
+  '174_homes_under_contract': ['marketPerformance', 'homesUnderContract'],
+  '175_market_type': ['marketPerformance', 'marketType'],
+  '176_avg_sale_to_list_percent': ['marketPerformance', 'avgSaleToListPercent'],
+  '177_avg_days_to_pending': ['marketPerformance', 'avgDaysToPending'],
+  '178_multiple_offers_likelihood': ['marketPerformance', 'multipleOffersLikelihood'],
+  '179_appreciation_percent': ['marketPerformance', 'appreciationPercent'],
+  '180_price_trend': ['marketPerformance', 'priceTrend'],
+  '181_rent_zestimate': ['marketPerformance', 'rentZestimate'],
+};
+
+for (const path of Object.values(paths)) Object.freeze(path);
+
+export const FIELD_PATHS: Readonly<Record<string, FieldPath>> = Object.freeze(paths);